@@ -1,36 +1,58 @@
 """Nexus CLI entry point."""
 
 import asyncio
+import atexit
+import fnmatch
+import functools
 import os
+import re
 import shutil
 import subprocess
 import sys
-from typing import Optional
+from collections.abc import Callable, Coroutine, Sequence
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 import typer
-from coolname import generate_slug
-from rich.console import Console
-from rich.table import Table
 
 from nx import __version__
 from nx.config import FleetConfig, load_config
-from nx.ssh import fan_out, run_on_node
+from nx.fzf import fzf_select
+from nx.ssh import fan_out, fan_out_iter, run_many, run_on_node
 from nx.resolve import AmbiguousSession, SessionNotFound, resolve_session
-from nx.nodes import nodes_ls, nodes_add, nodes_rm, discover_hosts
 from nx.tmux import (
     build_list_cmd,
     build_new_cmd,
     build_capture_cmd,
     build_send_keys_cmd,
     build_kill_cmd,
+    build_kill_many_cmd,
     parse_list_output,
+    SessionInfo,
 )
-from nx.snapshot import save_snapshot, restore_snapshot
-from nx.dashboard import build_dashboard
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+    from nx.nodes import NodeStatus
+
+# Reason: rich, coolname, and the snapshot/dashboard/nodes modules are only
+# needed by some commands, so they are imported inside those commands
+# rather than paid for on every nx invocation.
 
 
 _PICK_NODE = "__pick__"
 
+_T = TypeVar("_T")
+
+# Status labels shared by `nx list` (table and TSV), `nx gc`, and `nx nodes ls`.
+_STATUS_RUNNING = "[RUNNING]"
+_STATUS_UNREACHABLE = "[UNREACHABLE]"
+_status_exited = "[EXITED {}]".format
+
+# tmux stderr meaning "no nexus server on this node yet", i.e. zero sessions.
+_NO_SERVER_RE = re.compile(r"no server running|No such file")
+
 
 class _OptionalOnCommand(typer.core.TyperCommand):
     """Typer command that allows --on without a value.
@@ -68,7 +90,52 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
-console = Console()
+
+@functools.cache
+def _console() -> "Console":
+    """Return the shared Rich console, creating it on first use.
+
+    Returns:
+        Console: Console used for all human-readable output.
+    """
+    # Reason: Console() probes the terminal (size, color support), which
+    # `nx --version` and the TSV paths never need.
+    from rich.console import Console
+
+    return Console()
+
+
+# Event loop constructor for the shared runner; main() sets it from config
+# before any command runs. None keeps asyncio's default loop.
+_event_loop_factory: Callable[[], asyncio.AbstractEventLoop] | None = None
+
+
+@functools.cache
+def _runner() -> asyncio.Runner:
+    """Return the process-wide asyncio runner, creating it on first use.
+
+    Returns:
+        asyncio.Runner: Runner whose event loop is reused by every _run call.
+    """
+    runner = asyncio.Runner(loop_factory=_event_loop_factory)
+    atexit.register(runner.close)
+    return runner
+
+
+def _run(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion on the shared event loop.
+
+    Reason: Commands like gc and restore run several coroutines in a row;
+    asyncio.run would build and tear down a fresh loop for each. The runner
+    is created lazily, after main() has picked the event loop factory.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    return _runner().run(coro)
 
 
 def version_callback(value: bool) -> None:
@@ -91,84 +158,196 @@ def main(
     ),
 ) -> None:
     """nx — Distributed terminal orchestration."""
+    global _event_loop_factory
     ctx.ensure_object(dict)
     ctx.obj["config"] = load_config()
+    _event_loop_factory = _loop_factory(ctx.obj["config"].use_uvloop)
     if not shutil.which("fzf"):
         typer.echo("Error: fzf is required but not found on $PATH.", err=True)
         raise typer.Exit(code=1)
 
 
+def _loop_factory(
+    use_uvloop: bool,
+) -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Pick the event loop constructor for the shared runner.
+
+    Reason: uvloop's libuv-based loop spawns subprocesses and pumps their
+    pipes faster than the default selector loop, which speeds up every
+    fan-out. Without it installed (e.g. on Windows) nx silently keeps the
+    stdlib loop. Handing the factory to asyncio.Runner avoids event loop
+    policies, which are deprecated from Python 3.14.
+
+    Args:
+        use_uvloop: Whether the config asks for uvloop.
+
+    Returns:
+        uvloop.new_event_loop when requested and importable, else None so
+        asyncio.Runner builds its default loop.
+    """
+    if not use_uvloop:
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 @app.command("list")
 def list_sessions(ctx: typer.Context) -> None:
     """List tmux sessions across all fleet nodes.
 
     Queries every node in the fleet for active nexus-managed tmux sessions
     and displays them in a table grouped by node. Unreachable nodes are
-    flagged in the Status column.
+    flagged in the Status column. When stdout is not a terminal, rows are
+    printed as tab-separated text instead of a table.
     """
     config: FleetConfig = ctx.obj["config"]
+    tty = sys.stdout.isatty()
 
-    # Fan out the list command to all nodes concurrently.
-    results = asyncio.run(
-        fan_out(
-            config.nodes, build_list_cmd(), max_concurrent=config.max_concurrent_ssh
-        )
-    )
+    if tty:
+        # Reason: Show rows as each node answers so one slow node doesn't
+        # leave the screen blank; the transient live view is replaced by the
+        # final table, ordered by config, once every node has replied.
+        from rich.live import Live
+
+        live_table = _session_table()
+
+        def show_node(node: str, sessions: list[SessionInfo] | None) -> None:
+            for row in _session_rows(node, sessions):
+                live_table.add_row(*row)
 
-    # Classify nodes into reachable (with parsed sessions) and unreachable.
-    node_sessions: dict[str, list] = {}
-    unreachable_nodes: list[str] = []
+        with Live(live_table, console=_console(), transient=True):
+            node_sessions, unreachable_nodes = _run(
+                _query_fleet(config, on_node=show_node)
+            )
+    else:
+        node_sessions, unreachable_nodes = _run(_query_fleet(config))
 
+    # Build rows in one pass over the fleet: reachable sessions in config
+    # order, with unreachable nodes collected for the tail.
+    rows: list[tuple[str, ...]] = []
+    unreachable_rows: list[tuple[str, ...]] = []
     for node in config.nodes:
-        result = results[node]
-        if result.returncode != 0:
-            stderr = result.stderr or ""
-            # Reason: tmux exits non-zero when the nexus socket doesn't exist
-            # (no sessions created yet). This is "zero sessions", not unreachable.
-            if "no server running" in stderr or "No such file" in stderr:
-                node_sessions[node] = []
-            else:
-                unreachable_nodes.append(node)
+        if node in unreachable_nodes:
+            unreachable_rows.extend(_session_rows(node, None))
         else:
-            sessions = parse_list_output(result.stdout)
-            node_sessions[node] = sessions
+            rows.extend(_session_rows(node, node_sessions.get(node, [])))
+    rows.extend(unreachable_rows)
 
-    # Count total sessions across all reachable nodes.
-    total_sessions = sum(len(s) for s in node_sessions.values())
+    # No sessions anywhere and no unreachable nodes: print a simple message.
+    if not rows:
+        _console().print("No active sessions.")
+        return
 
-    # If no sessions anywhere and no unreachable nodes, print a simple message.
-    if total_sessions == 0 and not unreachable_nodes:
-        console.print("No active sessions.")
+    # Reason: When piped into grep/awk/cut nobody sees Rich's styling, so
+    # skip the table layout machinery and emit tab-separated rows in a
+    # single write.
+    if not tty:
+        _echo_tsv(rows)
         return
 
-    # Build the Rich table.
+    table = _session_table()
+    for row in rows:
+        table.add_row(*row)
+
+    _console().print(table)
+
+
+def _session_table() -> "Table":
+    """Create the empty Rich table used by `nx list`.
+
+    Returns:
+        Table: Table with the Node/Session/Directory/Command/Status columns.
+    """
+    from rich.table import Table
+
     table = Table()
     table.add_column("Node")
     table.add_column("Session")
     table.add_column("Directory")
     table.add_column("Command")
     table.add_column("Status")
+    return table
+
+
+def _session_rows(
+    node: str, sessions: list[SessionInfo] | None
+) -> list[tuple[str, ...]]:
+    """Build the `nx list` rows for one node.
+
+    Args:
+        node: Node the sessions were listed on.
+        sessions: Parsed sessions, or None if the node was unreachable.
+
+    Returns:
+        list[tuple[str, ...]]: One row per session, or a single
+            unreachable marker row.
+    """
+    if sessions is None:
+        return [(node, "", "", "", _STATUS_UNREACHABLE)]
+    return [
+        (
+            node,
+            session.name,
+            session.pane_path,
+            session.pane_cmd,
+            _status_exited(session.exit_status) if session.is_dead else _STATUS_RUNNING,
+        )
+        for session in sessions
+    ]
+
+
+async def _query_fleet(
+    config: FleetConfig,
+    on_node: Callable[[str, list[SessionInfo] | None], None] | None = None,
+) -> tuple[dict[str, list[SessionInfo]], set[str]]:
+    """List sessions on every node, parsing each reply as it arrives.
+
+    Args:
+        config: Fleet configuration with node list and settings.
+        on_node: Optional callback invoked as each node replies, with its
+            parsed sessions or None if the node is unreachable.
 
-    # Render reachable nodes with their sessions.
-    for node, sessions in node_sessions.items():
-        for session in sessions:
-            if session.is_dead:
-                status = f"[EXITED {session.exit_status}]"
+    Returns:
+        tuple[dict[str, list[SessionInfo]], set[str]]: Parsed sessions keyed
+            by reachable node (in arrival order), and the unreachable nodes.
+    """
+    node_sessions: dict[str, list[SessionInfo]] = {}
+    unreachable_nodes: set[str] = set()
+
+    async for node, result in fan_out_iter(
+        config.nodes,
+        build_list_cmd(),
+        max_concurrent=config.max_concurrent_ssh,
+        timeout=config.ssh_timeout,
+        deadline=config.fleet_timeout,
+    ):
+        if result.returncode != 0:
+            stderr = result.stderr or ""
+            # Reason: tmux exits non-zero when the nexus socket doesn't exist
+            # (no sessions created yet). This is "zero sessions", not unreachable.
+            if _NO_SERVER_RE.search(stderr):
+                node_sessions[node] = []
             else:
-                status = "[RUNNING]"
-            table.add_row(
-                node,
-                session.name,
-                session.pane_path,
-                session.pane_cmd,
-                status,
-            )
+                unreachable_nodes.add(node)
+        else:
+            node_sessions[node] = parse_list_output(result.stdout)
+
+        if on_node is not None:
+            on_node(node, node_sessions.get(node))
 
-    # Render unreachable nodes.
-    for node in unreachable_nodes:
-        table.add_row(node, "", "", "", "[UNREACHABLE]")
+    return node_sessions, unreachable_nodes
 
-    console.print(table)
+
+def _echo_tsv(rows: list[tuple[str, ...]]) -> None:
+    """Write table rows as tab-separated lines in a single write.
+
+    Args:
+        rows: One tuple of column values per output line.
+    """
+    typer.echo("\n".join("\t".join(row) for row in rows))
 
 
 @app.command("new", cls=_OptionalOnCommand)
@@ -183,7 +362,10 @@ def new_session(
     on: Optional[str] = typer.Option(
         None,
         "--on",
-        help="Target node. Use --on without a value to pick interactively.",
+        help=(
+            "Target node, comma list, or glob (e.g. 'gpu-*'). "
+            "Use --on without a value to pick interactively."
+        ),
     ),
     directory: Optional[str] = typer.Option(
         None, "--dir", "-d", help="Working directory."
@@ -203,7 +385,9 @@ def new_session(
         name: Name for the new tmux session.
         cmd: Command to run inside the session. Defaults to the shell
             configured in the fleet config.
-        on: Target node. Defaults to the fleet's default_node.
+        on: Target node, a comma-separated list, or a glob matched against
+            the fleet. Multiple targets are created concurrently and never
+            attached. Defaults to the fleet's default_node.
         directory: Working directory for the session. For local nodes
             defaults to the current directory; for remote nodes defaults
             to the remote user's $HOME.
@@ -212,6 +396,8 @@ def new_session(
 
     # Reason: Generate a random slug when the user omits the session name.
     if name is None:
+        from coolname import generate_slug
+
         name = generate_slug(2)
 
     # Determine target node.
@@ -220,22 +406,27 @@ def new_session(
     pick_node = on == _PICK_NODE
 
     if on and not pick_node:
-        node = on
+        targets = _match_nodes(on, config.nodes)
+        if not targets:
+            _console().print(f"Error: No fleet nodes match '{on}'.")
+            raise typer.Exit(code=1)
+        if len(targets) > 1:
+            _new_session_on_many(config, targets, name, cmd, directory)
+            return
+        node = targets[0]
     elif len(config.nodes) == 1:
         node = config.nodes[0]
     elif pick_node or _stdin_is_tty():
-        # Reason: Put default_node first so it's pre-highlighted in fzf.
-        sorted_nodes = sorted(config.nodes, key=lambda n: (n != config.default_node, n))
-        result = subprocess.run(
-            ["fzf", "--prompt", "Select node: "],
-            input="\n".join(sorted_nodes),
-            text=True,
-            capture_output=True,
-        )
-        if result.returncode != 0:
-            console.print("Selection cancelled.")
+        # Reason: Put default_node first so it's pre-highlighted in fzf. A
+        # partition plus a plain sort of the rest avoids a key call per node.
+        default = config.default_node
+        sorted_nodes = [n for n in config.nodes if n == default]
+        sorted_nodes += sorted(n for n in config.nodes if n != default)
+        selected = fzf_select(sorted_nodes, "Select node: ")
+        if selected is None:
+            _console().print("Selection cancelled.")
             raise typer.Exit(code=1)
-        node = result.stdout.strip()
+        node = selected
     else:
         node = config.default_node
 
@@ -251,25 +442,104 @@ def new_session(
         session_dir = None
 
     # Determine command.
-    session_cmd = " ".join(cmd) if cmd else config.default_cmd
+    # Reason: Pass the user's argv through as a list so arguments with spaces
+    # or quotes reach tmux intact instead of being re-split.
+    session_cmd = cmd or config.default_cmd
 
     # Build and execute the tmux new-session command.
     tmux_cmd = build_new_cmd(name, cmd=session_cmd, directory=session_dir)
-    result = asyncio.run(run_on_node(node, tmux_cmd))
+    result = _run(run_on_node(node, tmux_cmd))
 
     if result.returncode != 0:
         if "duplicate session" in (result.stderr or ""):
-            console.print(f"Error: Session '{name}' already exists on {node}.")
+            _console().print(f"Error: Session '{name}' already exists on {node}.")
         else:
-            console.print(f"Error: {result.stderr}")
+            _console().print(f"Error: {result.stderr}")
         raise typer.Exit(code=1)
 
-    console.print(f"Created session {node}/{name}")
+    _console().print(f"Created session {node}/{name}")
 
     if not detach:
         _attach_to_session(node, name)
 
 
+def _match_nodes(pattern: str, nodes: Sequence[str]) -> list[str]:
+    """Expand a --on value into target node names.
+
+    The value is split on commas. Parts containing glob characters are
+    matched against the fleet's nodes with fnmatch; plain names are taken
+    as-is, so any reachable SSH host still works like a single --on.
+
+    Args:
+        pattern: Raw --on value, e.g. "dev", "gpu-*", or "dev,gpu-*".
+        nodes: Fleet node names to match globs against.
+
+    Returns:
+        list[str]: Matched node names, deduplicated, in first-match order.
+    """
+    matched: dict[str, None] = {}
+    for part in pattern.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if any(c in part for c in "*?["):
+            matched.update(dict.fromkeys(fnmatch.filter(nodes, part)))
+        else:
+            matched[part] = None
+    return list(matched)
+
+
+def _new_session_on_many(
+    config: FleetConfig,
+    nodes: list[str],
+    name: str,
+    cmd: Optional[list[str]],
+    directory: Optional[str],
+) -> None:
+    """Create the same session on several nodes in one concurrent fan-out.
+
+    Reason: Scripted creation across a node group would otherwise pay one
+    nx start-up and SSH round-trip per node in a shell loop. Sessions are
+    left detached since there is no single session to attach to.
+
+    Args:
+        config: Fleet configuration with concurrency settings.
+        nodes: Target node names.
+        name: Session name to create on every node.
+        cmd: Command to run in the session, or None for default_cmd.
+        directory: Working directory, or None for tmux's default (the
+            caller's cwd locally, $HOME remotely).
+
+    Raises:
+        typer.Exit: With code 1 if creation failed on any node.
+    """
+    session_cmd = cmd or config.default_cmd
+    tmux_cmd = build_new_cmd(name, cmd=session_cmd, directory=directory)
+    results = _run(
+        fan_out(
+            nodes,
+            tmux_cmd,
+            max_concurrent=config.max_concurrent_ssh,
+            timeout=config.ssh_timeout,
+            deadline=config.fleet_timeout,
+        )
+    )
+
+    failed = False
+    for node, result in results.items():
+        if result.returncode == 0:
+            _console().print(f"Created session {node}/{name}")
+        elif "duplicate session" in (result.stderr or ""):
+            failed = True
+            _console().print(f"Error: Session '{name}' already exists on {node}.")
+        else:
+            failed = True
+            _console().print(f"Error on {node}: {result.stderr.strip()}")
+
+    if failed:
+        raise typer.Exit(code=1)
+
+
 def _pick_session(config: FleetConfig) -> tuple[str, str]:
     """Launch an fzf picker listing all sessions across the fleet.
 
@@ -285,41 +555,27 @@ def _pick_session(config: FleetConfig) -> tuple[str, str]:
     Raises:
         typer.Exit: If no sessions exist or the user cancels the picker.
     """
-    results = asyncio.run(
-        fan_out(
-            config.nodes, build_list_cmd(), max_concurrent=config.max_concurrent_ssh
-        )
-    )
-
-    entries: list[str] = []
-    for node in config.nodes:
-        result = results[node]
-        if result.returncode != 0:
-            continue
-        for session in parse_list_output(result.stdout):
-            entries.append(f"{node}/{session.name}")
+    node_sessions, _ = _run(_query_fleet(config))
+    entries = [
+        f"{node}/{session.name}"
+        for node, sessions in node_sessions.items()
+        for session in sessions
+    ]
 
     if not entries:
-        console.print("No active sessions.")
+        _console().print("No active sessions.")
         raise typer.Exit(code=1)
 
     # Reason: Sort default_node sessions first for quick selection.
-    sorted_entries = sorted(
-        entries,
-        key=lambda e: (0 if e.split("/", 1)[0] == config.default_node else 1, e),
-    )
+    prefix = f"{config.default_node}/"
+    sorted_entries = sorted(e for e in entries if e.startswith(prefix))
+    sorted_entries += sorted(e for e in entries if not e.startswith(prefix))
 
-    result = subprocess.run(
-        ["fzf", "--prompt", "Attach to session: "],
-        input="\n".join(sorted_entries),
-        text=True,
-        capture_output=True,
-    )
-    if result.returncode != 0:
-        console.print("Selection cancelled.")
+    selected = fzf_select(sorted_entries, "Attach to session: ")
+    if selected is None:
+        _console().print("Selection cancelled.")
         raise typer.Exit(code=1)
 
-    selected = result.stdout.strip()
     node, session = selected.split("/", 1)
     return (node, session)
 
@@ -412,6 +668,26 @@ def _attach_to_session(node: str, session: str) -> None:
         raise typer.Exit()
 
 
+def _resolve_or_exit(name: str, config: FleetConfig) -> tuple[str, str]:
+    """Resolve a session name, exiting with an error if it cannot be resolved.
+
+    Args:
+        name: Session name, either bare ("api") or fully qualified ("dev/api").
+        config: Fleet configuration.
+
+    Returns:
+        tuple[str, str]: (node, session) pair.
+
+    Raises:
+        typer.Exit: If the session is not found or the name is ambiguous.
+    """
+    try:
+        return _run(resolve_session(name, config))
+    except (SessionNotFound, AmbiguousSession) as exc:
+        _console().print(f"Error: {exc}")
+        raise typer.Exit(code=1)
+
+
 @app.command("attach")
 def attach_session(
     ctx: typer.Context,
@@ -436,14 +712,7 @@ def attach_session(
     if name is None:
         node, session = _pick_session(config)
     else:
-        try:
-            node, session = asyncio.run(resolve_session(name, config))
-        except SessionNotFound as exc:
-            console.print(f"Error: {exc}")
-            raise typer.Exit(code=1)
-        except AmbiguousSession as exc:
-            console.print(f"Error: {exc}")
-            raise typer.Exit(code=1)
+        node, session = _resolve_or_exit(name, config)
 
     _attach_to_session(node, session)
 
@@ -465,17 +734,10 @@ def peek_session(
     """
     config: FleetConfig = ctx.obj["config"]
 
-    try:
-        node, session = asyncio.run(resolve_session(name, config))
-    except SessionNotFound as exc:
-        console.print(f"Error: {exc}")
-        raise typer.Exit(code=1)
-    except AmbiguousSession as exc:
-        console.print(f"Error: {exc}")
-        raise typer.Exit(code=1)
+    node, session = _resolve_or_exit(name, config)
 
     cmd = build_capture_cmd(session, 30)
-    result = asyncio.run(run_on_node(node, cmd))
+    result = _run(run_on_node(node, cmd))
     typer.echo(result.stdout, nl=False)
 
 
@@ -504,14 +766,7 @@ def logs_session(
     """
     config: FleetConfig = ctx.obj["config"]
 
-    try:
-        node, session = asyncio.run(resolve_session(name, config))
-    except SessionNotFound as exc:
-        console.print(f"Error: {exc}")
-        raise typer.Exit(code=1)
-    except AmbiguousSession as exc:
-        console.print(f"Error: {exc}")
-        raise typer.Exit(code=1)
+    node, session = _resolve_or_exit(name, config)
 
     # Reason: When the user explicitly passes --lines we honour it. Otherwise
     # we pick a sensible default: 100 lines for interactive terminals, or the
@@ -525,7 +780,7 @@ def logs_session(
         lines_value = "-"
 
     cmd = build_capture_cmd(session, lines_value)
-    result = asyncio.run(run_on_node(node, cmd))
+    result = _run(run_on_node(node, cmd))
     typer.echo(result.stdout, nl=False)
 
 
@@ -551,23 +806,16 @@ def send_keys(
     """
     config: FleetConfig = ctx.obj["config"]
 
-    try:
-        node, session = asyncio.run(resolve_session(name, config))
-    except SessionNotFound as exc:
-        console.print(f"Error: {exc}")
-        raise typer.Exit(code=1)
-    except AmbiguousSession as exc:
-        console.print(f"Error: {exc}")
-        raise typer.Exit(code=1)
+    node, session = _resolve_or_exit(name, config)
 
     cmd = build_send_keys_cmd(session, keys, raw=raw)
-    result = asyncio.run(run_on_node(node, cmd))
+    result = _run(run_on_node(node, cmd))
 
     if result.returncode != 0:
-        console.print(f"Error: {result.stderr}")
+        _console().print(f"Error: {result.stderr}")
         raise typer.Exit(code=1)
 
-    console.print(f"Sent to {node}/{session}")
+    _console().print(f"Sent to {node}/{session}")
 
 
 @app.command("kill")
@@ -586,23 +834,16 @@ def kill_session(
     """
     config: FleetConfig = ctx.obj["config"]
 
-    try:
-        node, session = asyncio.run(resolve_session(name, config))
-    except SessionNotFound as exc:
-        console.print(f"Error: {exc}")
-        raise typer.Exit(code=1)
-    except AmbiguousSession as exc:
-        console.print(f"Error: {exc}")
-        raise typer.Exit(code=1)
+    node, session = _resolve_or_exit(name, config)
 
     cmd = build_kill_cmd(session)
-    result = asyncio.run(run_on_node(node, cmd))
+    result = _run(run_on_node(node, cmd))
 
     if result.returncode != 0:
-        console.print(f"Error: {result.stderr}")
+        _console().print(f"Error: {result.stderr}")
         raise typer.Exit(code=1)
 
-    console.print(f"Killed session {node}/{session}")
+    _console().print(f"Killed session {node}/{session}")
 
 
 @app.command("gc")
@@ -628,44 +869,64 @@ def gc_sessions(
     """
     config: FleetConfig = ctx.obj["config"]
 
-    # Fan out list command to all nodes.
-    results = asyncio.run(
-        fan_out(
-            config.nodes, build_list_cmd(), max_concurrent=config.max_concurrent_ssh
-        )
-    )
+    node_sessions, _ = _run(_query_fleet(config))
 
     # Collect exited sessions as (node, session_name, exit_status) tuples.
-    exited: list[tuple[str, str, int | None]] = []
-    for node in config.nodes:
-        result = results[node]
-        if result.returncode != 0:
-            continue
-        sessions = parse_list_output(result.stdout)
-        for session in sessions:
-            if session.is_dead:
-                if name is None or session.name == name:
-                    exited.append((node, session.name, session.exit_status))
+    exited: list[tuple[str, str, int | None]] = [
+        (node, session.name, session.exit_status)
+        for node in config.nodes
+        for session in node_sessions.get(node, ())
+        if session.is_dead and (name is None or session.name == name)
+    ]
 
     if not exited:
-        console.print("No exited sessions.")
+        _console().print("No exited sessions.")
         return
 
     # Dry-run: list what would be reaped and exit.
     if dry_run:
-        parts = [f"{node}/{sname} [EXITED {status}]" for node, sname, status in exited]
-        console.print(f"Would reap: {', '.join(parts)}")
+        parts = [
+            f"{node}/{sname} {_status_exited(status)}" for node, sname, status in exited
+        ]
+        _console().print(f"Would reap: {', '.join(parts)}")
         return
 
     # Interactive confirmation.
     if sys.stdin.isatty():
         typer.confirm(f"Reap {len(exited)} exited session(s)?", abort=True)
 
-    # Kill each exited session.
+    # Reason: One command per node kills all of its exited sessions, so a
+    # node pays one SSH round-trip however many sessions it holds.
+    by_node: dict[str, list[str]] = {}
     for node, sname, _ in exited:
-        cmd = build_kill_cmd(sname)
-        asyncio.run(run_on_node(node, cmd))
-        console.print(f"Reaped {node}/{sname}")
+        by_node.setdefault(node, []).append(sname)
+
+    results = _run(
+        run_many(
+            [(node, build_kill_many_cmd(names)) for node, names in by_node.items()],
+            max_concurrent=config.max_concurrent_ssh,
+            timeout=config.ssh_timeout,
+        )
+    )
+    failed = False
+    for (node, names), result in zip(by_node.items(), results):
+        # Reason: A non-zero exit means the batch never ran (e.g. ssh
+        # failed); otherwise stdout lists the sessions whose kill failed.
+        if result.returncode != 0:
+            not_killed = set(names)
+        else:
+            not_killed = set(result.stdout.splitlines())
+        for sname in names:
+            if sname in not_killed:
+                failed = True
+                _console().print(
+                    f"Error reaping {node}/{sname}: {result.stderr.strip()}"
+                )
+            else:
+                _console().print(f"Reaped {node}/{sname}")
+
+    if failed:
+        raise typer.Exit(code=1)
 
 
 @app.command("snapshot")
@@ -675,14 +936,11 @@ def snapshot_cmd(ctx: typer.Context) -> None:
     Captures all active sessions across the fleet and writes them to
     ~/.config/nexus/snapshot.json.
     """
-    config: FleetConfig = ctx.obj["config"]
-    path = asyncio.run(save_snapshot(config))
-    # Reason: Count sessions from the snapshot file we just wrote to report accurately.
-    import json
+    from nx.snapshot import save_snapshot
 
-    data = json.loads(path.read_text())
-    count = len(data.get("sessions", []))
-    console.print(f"Saved {count} sessions to {path}")
+    config: FleetConfig = ctx.obj["config"]
+    path, count = _run(save_snapshot(config))
+    _console().print(f"Saved {count} sessions to {path}")
 
 
 @app.command("restore")
@@ -697,17 +955,19 @@ def restore_cmd(
     Reads ~/.config/nexus/snapshot.json and creates sessions for each
     entry. Use --node to filter to a specific node.
     """
+    from nx.snapshot import restore_snapshot
+
     config: FleetConfig = ctx.obj["config"]
-    messages = asyncio.run(restore_snapshot(config, node_filter=node))
+    messages = _run(restore_snapshot(config, node_filter=node))
 
     if not messages:
-        console.print("No sessions to restore.")
+        _console().print("No sessions to restore.")
         return
 
     for msg in messages:
-        console.print(msg)
+        _console().print(msg)
 
-    console.print(f"Restored {len(messages)} sessions")
+    _console().print(f"Restored {len(messages)} sessions")
 
 
 @app.command("dash")
@@ -718,13 +978,20 @@ def dashboard_cmd(ctx: typer.Context) -> None:
     session in read-only mode. Press Enter to tear down the dashboard and
     attach to the selected session.
     """
+    from nx.dashboard import build_dashboard
+
     config: FleetConfig = ctx.obj["config"]
-    exec_args = asyncio.run(build_dashboard(config))
+    exec_args, error = _run(build_dashboard(config))
 
     if not exec_args:
-        console.print("No active sessions to display.")
+        _console().print("No active sessions to display.")
         return
 
+    if error:
+        # Reason: The panes that fit are still worth showing, so warn and
+        # attach rather than fail.
+        typer.echo(f"Warning: dashboard is incomplete: {error}", err=True)
+
     os.execvp(exec_args[0], exec_args)
 
 
@@ -741,25 +1008,72 @@ def nodes_list(ctx: typer.Context) -> None:
     """List fleet nodes with reachability and config status.
 
     Shows each node's connectivity status, tmux version, and whether
-    the remote tmux.conf matches the canonical version.
+    the remote tmux.conf matches the canonical version. When stdout is not
+    a terminal, rows are printed as tab-separated text instead of a table.
     """
+    from nx.nodes import nodes_ls
+
     config: FleetConfig = ctx.obj["config"]
-    statuses = asyncio.run(nodes_ls(config))
+    tty = sys.stdout.isatty()
+
+    if tty:
+        # Reason: As with `nx list`, show nodes as they are checked so an
+        # unreachable host waiting out its ConnectTimeout doesn't leave the
+        # screen blank.
+        from rich.live import Live
+
+        live_table = _nodes_table()
+
+        def show_status(status: "NodeStatus") -> None:
+            live_table.add_row(*_node_row(status))
+
+        with Live(live_table, console=_console(), transient=True):
+            statuses = _run(nodes_ls(config, on_status=show_status))
+    else:
+        statuses = _run(nodes_ls(config))
+
+    rows = [_node_row(status) for status in statuses]
+
+    # Reason: Same as `nx list` -- scripts reading this get plain TSV
+    # without building a Rich table.
+    if not tty:
+        _echo_tsv(rows)
+        return
+
+    table = _nodes_table()
+    for row in rows:
+        table.add_row(*row)
+
+    _console().print(table)
+
+
+def _nodes_table() -> "Table":
+    """Create the empty Rich table used by `nx nodes ls`.
+
+    Returns:
+        Table: Table with the Node/Status/tmux.conf columns.
+    """
+    from rich.table import Table
 
     table = Table()
     table.add_column("Node")
     table.add_column("Status")
     table.add_column("tmux.conf")
+    return table
 
-    for status in statuses:
-        if not status.reachable:
-            table.add_row(status.node, "[UNREACHABLE]", "-")
-        else:
-            conn = "[OK]"
-            drift = "[DRIFT]" if status.config_drift else "[OK]"
-            table.add_row(status.node, conn, drift)
 
-    console.print(table)
+def _node_row(status: "NodeStatus") -> tuple[str, ...]:
+    """Build the `nx nodes ls` row for one node.
+
+    Args:
+        status: Checked status of the node.
+
+    Returns:
+        tuple[str, ...]: Node, reachability and tmux.conf drift columns.
+    """
+    if not status.reachable:
+        return (status.node, _STATUS_UNREACHABLE, "-")
+    return (status.node, "[OK]", "[DRIFT]" if status.config_drift else "[OK]")
 
 
 @nodes_app.command("add")
@@ -777,44 +1091,40 @@ def nodes_add_cmd(
         ctx: Typer context carrying the loaded fleet config.
         host: Hostname to add. If None, discovers hosts from SSH config.
     """
+    from nx.nodes import discover_hosts, nodes_add
+
     config: FleetConfig = ctx.obj["config"]
 
     if host is None:
         candidates = discover_hosts(config)
 
         if not candidates:
-            console.print("No new hosts found in ~/.ssh/config")
+            _console().print("No new hosts found in ~/.ssh/config")
             raise typer.Exit(code=1)
 
         if len(candidates) == 1:
             host = candidates[0]
-            console.print(f"Auto-selected: {host}")
+            _console().print(f"Auto-selected: {host}")
         elif sys.stdin.isatty():
-            result = subprocess.run(
-                ["fzf", "--prompt", "Select host to add: "],
-                input="\n".join(candidates),
-                text=True,
-                capture_output=True,
-            )
-            if result.returncode != 0:
-                console.print("Selection cancelled.")
+            host = fzf_select(candidates, "Select host to add: ")
+            if host is None:
+                _console().print("Selection cancelled.")
                 raise typer.Exit(code=1)
-            host = result.stdout.strip()
         else:
-            console.print("Multiple candidates found:")
+            _console().print("Multiple candidates found:")
             for c in candidates:
-                console.print(f"  {c}")
-            console.print("Use: nx nodes add <host>")
+                _console().print(f"  {c}")
+            _console().print("Use: nx nodes add <host>")
             raise typer.Exit(code=1)
 
     try:
-        messages = asyncio.run(nodes_add(host, config))
+        messages = _run(nodes_add(host, config))
     except RuntimeError as exc:
-        console.print(f"Error: {exc}")
+        _console().print(f"Error: {exc}")
         raise typer.Exit(code=1)
 
     for msg in messages:
-        console.print(msg)
+        _console().print(msg)
 
 
 @nodes_app.command("rm")
@@ -830,16 +1140,18 @@ def nodes_rm_cmd(
         ctx: Typer context carrying the loaded fleet config.
         host: Hostname to remove.
     """
+    from nx.nodes import nodes_rm
+
     config: FleetConfig = ctx.obj["config"]
 
     try:
         messages = nodes_rm(host, config)
     except ValueError as exc:
-        console.print(f"Error: {exc}")
+        _console().print(f"Error: {exc}")
         raise typer.Exit(code=1)
 
     for msg in messages:
-        console.print(msg)
+        _console().print(msg)
 
 
 # Alias: nx a → nx attach
@@ -1,30 +1,54 @@
 """Fleet configuration loading and validation."""
 
+import contextlib
+import functools
+import json
 import os
+import shutil
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
+from typing import TextIO
 
-import tomllib
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 DEFAULT_CONFIG_PATH = Path.home() / ".config" / "nexus" / "fleet.toml"
 
+# Reason: Set by a parent nx process (the dashboard's Enter shim) so the
+# child it spawns can reuse the already-validated config instead of
+# re-reading fleet.toml.
+CONFIG_ENV_VAR = "NX_CONFIG_JSON"
+
 
 class FleetConfig(BaseModel):
     """Fleet configuration model.
 
+    Instances are frozen: load_config hands the same cached instance to
+    every caller, so changes go through model_copy(update=...).
+
     Attributes:
-        nodes: List of nodes in the fleet. "local" is always included.
+        nodes: Nodes in the fleet, as a tuple. "local" is always included.
         default_node: Default target for 'nx new' if --on is omitted.
         default_cmd: Default command if none specified. Supports env var expansion.
         max_concurrent_ssh: Max concurrent SSH connections during fan-out.
+        ssh_timeout: Per-node deadline in seconds for fan-out queries.
+        fleet_timeout: Overall deadline in seconds for one fan-out across
+            the whole fleet, including time spent queued behind
+            max_concurrent_ssh.
+        use_uvloop: Run asyncio on uvloop when the optional package is installed.
         auto_reap_clean_exit: Auto-delete panes that exit with code 0.
     """
 
-    nodes: list[str] = ["local"]
+    model_config = ConfigDict(frozen=True)
+
+    nodes: tuple[str, ...] = ("local",)
     default_node: str = "local"
     default_cmd: str = "$SHELL"
     max_concurrent_ssh: int = 16
+    ssh_timeout: float = 10.0
+    fleet_timeout: float = 60.0
+    use_uvloop: bool = True
     auto_reap_clean_exit: bool = True
 
     @field_validator("default_node", "default_cmd", mode="before")
@@ -40,16 +64,25 @@ class FleetConfig(BaseModel):
         """
         return os.path.expandvars(v)
 
-    @model_validator(mode="after")
-    def ensure_local_in_nodes(self) -> "FleetConfig":
-        """Ensure 'local' is always present in the nodes list.
+    @field_validator("nodes")
+    @classmethod
+    def ensure_local_in_nodes(cls, v: tuple[str, ...]) -> tuple[str, ...]:
+        """Ensure 'local' is always present in the nodes tuple.
+
+        Args:
+            v: Validated node names.
 
         Returns:
-            FleetConfig: The validated config with 'local' guaranteed in nodes.
+            tuple[str, ...]: The nodes with 'local' guaranteed at the front
+                when it was missing.
         """
-        if "local" not in self.nodes:
-            self.nodes.insert(0, "local")
-        return self
+        if "local" not in v:
+            return ("local", *v)
+        return v
+
+
+# Shared result for a missing config file; safe to reuse since it is frozen.
+_DEFAULT_CONFIG = FleetConfig()
 
 
 def load_config(path: Path | None = None) -> FleetConfig:
@@ -57,7 +90,11 @@ def load_config(path: Path | None = None) -> FleetConfig:
 
     Reads the fleet config from the given path (or the default
     ~/.config/nexus/fleet.toml). If the file doesn't exist,
-    returns a FleetConfig with default values.
+    returns a FleetConfig with default values. Parsed configs are
+    memoized per file version, so repeat loads in one process skip
+    the TOML parse and validation. When no path is given and
+    NX_CONFIG_JSON is set, the config serialized there by a parent nx
+    process is used instead of the file.
 
     Args:
         path: Path to the config file. Defaults to ~/.config/nexus/fleet.toml.
@@ -68,22 +105,63 @@ def load_config(path: Path | None = None) -> FleetConfig:
     Raises:
         pydantic.ValidationError: If the config file contains invalid values.
     """
+    if path is None and (marshalled := os.environ.get(CONFIG_ENV_VAR)):
+        return _load_config_json(marshalled)
+
     config_path = path or DEFAULT_CONFIG_PATH
 
-    if not config_path.exists():
-        return FleetConfig()
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        return _DEFAULT_CONFIG
+
+    return _load_config_cached(config_path, stat.st_mtime_ns, stat.st_size)
 
-    with open(config_path, "rb") as f:
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path: Path, mtime_ns: int, size: int) -> FleetConfig:
+    """Parse and validate a fleet config file.
+
+    Reason: mtime_ns and size are part of the cache key so that an edited
+    (or freshly saved) file is re-parsed on the next load.
+
+    Args:
+        path: Path to the config file.
+        mtime_ns: File modification time in nanoseconds.
+        size: File size in bytes.
+
+    Returns:
+        FleetConfig: The parsed and validated configuration.
+    """
+    # Reason: Imported here so a missing config file, and `nx --version`,
+    # never pay for the TOML parser.
+    import tomllib
+
+    with open(path, "rb") as f:
         data = tomllib.load(f)
 
     return FleetConfig(**data)
 
 
+@functools.lru_cache(maxsize=1)
+def _load_config_json(data: str) -> FleetConfig:
+    """Validate a config marshalled through NX_CONFIG_JSON.
+
+    Args:
+        data: JSON produced by FleetConfig.model_dump_json().
+
+    Returns:
+        FleetConfig: The validated configuration.
+    """
+    return FleetConfig.model_validate_json(data)
+
+
 def save_config(config: FleetConfig, path: Path | None = None) -> None:
     """Save fleet configuration to TOML file.
 
     Writes the fleet config to the given path (or the default
-    ~/.config/nexus/fleet.toml). Creates parent directories if needed.
+    ~/.config/nexus/fleet.toml) atomically. Creates parent directories if
+    needed.
 
     Args:
         config: Fleet configuration to save.
@@ -94,12 +172,68 @@ def save_config(config: FleetConfig, path: Path | None = None) -> None:
 
     # Reason: We write TOML manually to avoid adding a tomli_w dependency.
     # The fleet config schema is flat and simple.
-    nodes_str = ", ".join(f'"{n}"' for n in config.nodes)
+    nodes_str = ", ".join(_toml_str(n) for n in config.nodes)
     lines = [
         f"nodes = [{nodes_str}]",
-        f'default_node = "{config.default_node}"',
-        f'default_cmd = "{config.default_cmd}"',
+        f"default_node = {_toml_str(config.default_node)}",
+        f"default_cmd = {_toml_str(config.default_cmd)}",
         f"max_concurrent_ssh = {config.max_concurrent_ssh}",
+        f"ssh_timeout = {config.ssh_timeout}",
+        f"fleet_timeout = {config.fleet_timeout}",
+        f"use_uvloop = {'true' if config.use_uvloop else 'false'}",
         f"auto_reap_clean_exit = {'true' if config.auto_reap_clean_exit else 'false'}",
     ]
-    config_path.write_text("\n".join(lines) + "\n")
+    with atomic_write(config_path) as f:
+        f.write("\n".join(lines) + "\n")
+
+
+@contextlib.contextmanager
+def atomic_write(path: Path) -> Iterator[TextIO]:
+    """Open a text file whose contents replace path only on success.
+
+    Reason: Writing a temporary file and renaming it over the target means a
+    crash or a concurrent `nx` never sees a half-written file. The temp name
+    is unique per call so concurrent writers don't share it, and it is
+    removed if the body raises.
+
+    The replacement keeps the existing file's mode; a new file gets the
+    usual umask default instead of mkstemp's 0600.
+
+    Args:
+        path: File to write. Its parent directory must exist.
+
+    Yields:
+        TextIO: File open for writing the new contents.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name)
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _toml_str(value: str) -> str:
+    """Render a string as a TOML basic string.
+
+    Args:
+        value: String to quote.
+
+    Returns:
+        str: The quoted string, with quotes, backslashes and control
+            characters escaped.
+    """
+    # Reason: JSON string escapes (\", \\, \n, \uXXXX, ...) are a subset of
+    # TOML's basic-string escapes, so json.dumps quotes correctly.
+    return json.dumps(value, ensure_ascii=False)
@@ -4,6 +4,7 @@ import shutil
 import sys
 from typing import TYPE_CHECKING
 
+from nx.config import CONFIG_ENV_VAR
 from nx.ssh import fan_out, run_on_node
 from nx.tmux import build_list_cmd, parse_list_output
 
@@ -16,28 +17,38 @@ DASH_SOCKET = "nx_dash"
 DASH_SESSION = "dashboard"
 
 
-async def build_dashboard(config: "FleetConfig") -> list[str]:
+async def build_dashboard(config: "FleetConfig") -> tuple[list[str], str]:
     """Build the dashboard tmux session with read-only panes.
 
     Steps:
     1. Fan-out list all sessions across the fleet.
     2. Create a temporary tmux session on the nx_dash socket.
-    3. For each session, split a new pane with a read-only attach command.
-    4. Tag each pane with @nx_target metadata.
-    5. Store NX_BIN path via set-environment.
-    6. Bind Enter to the teardown-and-attach shim.
-    7. Select even-vertical layout and select the first pane.
+    3. Store NX_BIN path and the config via set-environment.
+    4. Bind Enter to the teardown-and-attach shim.
+    5. For each remaining session, split a new pane with a read-only attach
+       command, tag it with @nx_target metadata, and re-tile.
+    6. Select the first pane.
+
+    Steps 2-6 run as a single tmux invocation. tmux stops at the first
+    failing command, so the session-wide setup is queued before the splits:
+    if the window runs out of room, the dashboard still works with the panes
+    that fit, and tmux's error is returned.
 
     Args:
         config: Fleet configuration.
 
     Returns:
-        list[str]: The execvp arguments to attach to the dashboard.
-            Returns empty list if no active sessions found.
+        tuple[list[str], str]: The execvp arguments to attach to the
+            dashboard (empty if no active sessions were found), and tmux's
+            error output if the setup stopped early ("" otherwise).
     """
     # Step 1: Fan out list command to all nodes.
     results = await fan_out(
-        config.nodes, build_list_cmd(), max_concurrent=config.max_concurrent_ssh
+        config.nodes,
+        build_list_cmd(),
+        max_concurrent=config.max_concurrent_ssh,
+        timeout=config.ssh_timeout,
+        deadline=config.fleet_timeout,
     )
 
     # Collect all active (non-dead) sessions as (node, SessionInfo) pairs.
@@ -51,186 +62,86 @@ async def build_dashboard(config: "FleetConfig") -> list[str]:
                 all_sessions.append((node, info))
 
     if not all_sessions:
-        return []
+        return [], ""
 
     # Step 2: Create the dashboard tmux session.
     # Reason: The first session's read-only attach becomes the initial window
     # command so the dashboard session starts with at least one pane.
     first_node, first_info = all_sessions[0]
-    first_attach = _build_attach_cmd(first_node, first_info.name)
-
-    await run_on_node(
-        "local",
+    commands: list[list[str]] = [
         [
-            "tmux",
-            "-L",
-            DASH_SOCKET,
             "new-session",
             "-d",
             "-s",
             DASH_SESSION,
-            *first_attach,
+            *_build_attach_cmd(first_node, first_info.name),
         ],
-    )
-
-    # Tag the first pane with @nx_target metadata.
-    first_target = f"{first_node}/{first_info.name}"
-    await run_on_node(
-        "local",
+        # Tag the first pane with @nx_target metadata.
         [
-            "tmux",
-            "-L",
-            DASH_SOCKET,
             "set-option",
             "-p",
             "-t",
             f"{DASH_SESSION}:0.0",
             "@nx_target",
-            first_target,
+            f"{first_node}/{first_info.name}",
         ],
-    )
+    ]
 
-    # Step 3-4: Split window for remaining sessions and tag each pane.
-    for node, info in all_sessions[1:]:
-        attach_cmd = _build_attach_cmd(node, info.name)
-        await run_on_node(
-            "local",
-            [
-                "tmux",
-                "-L",
-                DASH_SOCKET,
-                "split-window",
-                "-t",
-                DASH_SESSION,
-                *attach_cmd,
-            ],
-        )
-
-        target = f"{node}/{info.name}"
-        await run_on_node(
-            "local",
-            [
-                "tmux",
-                "-L",
-                DASH_SOCKET,
-                "set-option",
-                "-p",
-                "@nx_target",
-                target,
-            ],
-        )
-
-    # Step 5: Store NX_BIN path via set-environment.
+    # Step 3: Store NX_BIN path and the serialized config via set-environment.
     # Reason: The Enter-key shim needs to locate the nx binary at runtime.
     # shutil.which("nx") finds the installed entry point; sys.argv[0] is the
-    # fallback for development invocations (e.g. `uv run nx`).
+    # fallback for development invocations (e.g. `uv run nx`). The config is
+    # handed to the child `nx attach` so it skips re-parsing fleet.toml.
     nx_bin = shutil.which("nx") or sys.argv[0]
-    await run_on_node(
-        "local",
-        [
-            "tmux",
-            "-L",
-            DASH_SOCKET,
-            "set-environment",
-            "NX_BIN",
-            nx_bin,
-        ],
-    )
+    # Both are hidden (-h): the shim reads them with `show-environment -h`,
+    # which lists only hidden variables, and the panes don't need them.
+    commands.append(["set-environment", "-h", "NX_BIN", nx_bin])
+    commands.append(["set-environment", "-h", CONFIG_ENV_VAR, config.model_dump_json()])
 
-    # Step 6: Bind Enter to the teardown-and-attach shim.
+    # Step 4: Bind Enter to the teardown-and-attach shim.
     # Reason: The shim captures the target from pane metadata, tears down the
     # dashboard, and execs `nx attach` in the user's original terminal context.
     shim = (
         "NX_BIN=$(tmux -L nx_dash show-environment -h NX_BIN | cut -d= -f2); "
+        f"{CONFIG_ENV_VAR}=$(tmux -L nx_dash show-environment -h {CONFIG_ENV_VAR}"
+        f" | cut -d= -f2-); export {CONFIG_ENV_VAR}; "
         "TARGET=$(tmux -L nx_dash display-message -p '#{@nx_target}'); "
         "tmux -L nx_dash detach-client && tmux -L nx_dash kill-session; "
         'exec "$NX_BIN" attach "$TARGET"'
     )
-    await run_on_node(
-        "local",
-        [
-            "tmux",
-            "-L",
-            DASH_SOCKET,
-            "bind-key",
-            "-n",
-            "Enter",
-            "run-shell",
-            shim,
-        ],
-    )
+    commands.append(["bind-key", "-n", "Enter", "run-shell", shim])
 
     # Bind Space to cycle layouts (tiled ↔ even-vertical ↔ etc.).
-    await run_on_node(
-        "local",
-        [
-            "tmux",
-            "-L",
-            DASH_SOCKET,
-            "bind-key",
-            "-n",
-            "Space",
-            "next-layout",
-        ],
-    )
+    commands.append(["bind-key", "-n", "Space", "next-layout"])
 
     # Pane border labels: show @nx_target (node/session) in each pane's border.
-    await run_on_node(
-        "local",
-        [
-            "tmux",
-            "-L",
-            DASH_SOCKET,
-            "set-option",
-            "-t",
-            DASH_SESSION,
-            "pane-border-status",
-            "top",
-        ],
-    )
-    await run_on_node(
-        "local",
-        [
-            "tmux",
-            "-L",
-            DASH_SOCKET,
-            "set-option",
-            "-t",
-            DASH_SESSION,
-            "pane-border-format",
-            " #{@nx_target} ",
-        ],
+    commands.append(["set-option", "-t", DASH_SESSION, "pane-border-status", "top"])
+    commands.append(
+        ["set-option", "-t", DASH_SESSION, "pane-border-format", " #{@nx_target} "]
     )
 
-    # Step 7: Apply tiled layout so panes fill the screen in a grid.
-    await run_on_node(
-        "local",
-        [
-            "tmux",
-            "-L",
-            DASH_SOCKET,
-            "select-layout",
-            "-t",
-            DASH_SESSION,
-            "tiled",
-        ],
-    )
+    # Step 5: Split window for remaining sessions and tag each pane.
+    for node, info in all_sessions[1:]:
+        commands.append(
+            ["split-window", "-t", DASH_SESSION, *_build_attach_cmd(node, info.name)]
+        )
+        commands.append(["set-option", "-p", "@nx_target", f"{node}/{info.name}"])
+        # Reason: Each split halves the active pane; re-tiling keeps room for
+        # the next one. A "no space for new pane" error still aborts the rest
+        # of the sequence, which is why the splits come last.
+        commands.append(["select-layout", "-t", DASH_SESSION, "tiled"])
 
-    # Select first pane so the user starts at the top.
-    await run_on_node(
-        "local",
-        [
-            "tmux",
-            "-L",
-            DASH_SOCKET,
-            "select-pane",
-            "-t",
-            f"{DASH_SESSION}:0.0",
-        ],
-    )
+    # Step 6: Select first pane so the user starts at the top.
+    commands.append(["select-pane", "-t", f"{DASH_SESSION}:0.0"])
+
+    # Reason: Steps 2-6 run as one tmux command sequence, so the whole
+    # dashboard is built by a single tmux process instead of one per pane
+    # and per option.
+    result = await run_on_node("local", _build_sequence_cmd(commands))
+    error = result.stderr.strip() if result.returncode != 0 else ""
 
     # Return the execvp args for attaching to the dashboard.
-    return ["tmux", "-L", DASH_SOCKET, "attach", "-t", DASH_SESSION]
+    return ["tmux", "-L", DASH_SOCKET, "attach", "-t", DASH_SESSION], error
 
 
 def _build_attach_cmd(node: str, session: str) -> list[str]:
@@ -250,3 +161,23 @@ def _build_attach_cmd(node: str, session: str) -> list[str]:
         return ["tmux", "-L", "nexus", "attach", "-t", session, "-r"]
     else:
         return ["ssh", "-t", node, "tmux", "-L", "nexus", "attach", "-t", session, "-r"]
+
+
+def _build_sequence_cmd(commands: list[list[str]]) -> list[str]:
+    """Join tmux commands into one invocation on the dashboard socket.
+
+    Args:
+        commands: tmux commands, each as its argument list without the
+            leading `tmux -L nx_dash`.
+
+    Returns:
+        list[str]: A single tmux command line running every command in order.
+    """
+    argv = ["tmux", "-L", DASH_SOCKET]
+    for i, command in enumerate(commands):
+        if i:
+            argv.append(";")
+        # Reason: tmux splits commands at any argument ending in ";"; a
+        # trailing "\;" keeps it literal (e.g. a session named "a;").
+        argv.extend(arg[:-1] + "\\;" if arg.endswith(";") else arg for arg in command)
+    return argv
@@ -0,0 +1,26 @@
+"""fzf picker used for interactive node and session selection."""
+
+import subprocess
+
+
+def fzf_select(candidates: list[str], prompt: str) -> str | None:
+    """Let the user pick one candidate with fzf.
+
+    Candidates are piped to fzf as bytes and only its stdout is captured,
+    so fzf's own stderr (errors, warnings) reaches the terminal.
+
+    Args:
+        candidates: Lines to choose from, in display order.
+        prompt: Prompt shown by fzf.
+
+    Returns:
+        str | None: The selected line, or None if the user cancelled.
+    """
+    result = subprocess.run(
+        ["fzf", "--prompt", prompt],
+        input="\n".join(candidates).encode(),
+        stdout=subprocess.PIPE,
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.decode().strip()
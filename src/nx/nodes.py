@@ -1,14 +1,17 @@
 """Node management: list, add, and remove fleet nodes."""
 
 import asyncio
+import functools
 import glob as globmod
 import hashlib
 import importlib.resources
 import re
+import shlex
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
-from nx.config import FleetConfig, save_config
+from nx.config import FleetConfig, atomic_write, save_config
 from nx.ssh import run_on_node
 
 
@@ -19,11 +22,21 @@ NEXUS_SSH_CONFIG = Path.home() / ".ssh" / "nexus_config"
 SSH_CONFIG_TEMPLATE = """
 Host {host}
     ControlMaster auto
-    ControlPath ~/.ssh/sockets/nx-%r@%h:%p
+    ControlPath ~/.ssh/sockets/nx-%C
     ControlPersist 10m
     ServerAliveInterval 30
 """
 
+# Host and Include lines in an SSH config; comments and other keywords
+# never match.
+_SSH_DIRECTIVE_RE = re.compile(r"\s*(host|include)\s+(.+?)\s*$", re.IGNORECASE)
+
+# Host patterns (wildcards and negations) that are not concrete hostnames.
+_WILDCARD_RE = re.compile(r"[*?!]")
+
+# Version number in `tmux -V` output, e.g. "tmux 3.4" or "tmux next-3.5".
+_VERSION_RE = re.compile(r"(\d+\.\d+)")
+
 
 def parse_ssh_config_hosts(config_path: Path | None = None) -> list[str]:
     """Parse ~/.ssh/config for Host entries, following Include directives.
@@ -38,10 +51,22 @@ def parse_ssh_config_hosts(config_path: Path | None = None) -> list[str]:
     Returns:
         list[str]: Sorted, deduplicated list of concrete hostnames.
     """
+    return sorted(_ssh_config_host_set(config_path))
+
+
+def _ssh_config_host_set(config_path: Path | None = None) -> set[str]:
+    """Collect concrete hostnames from an SSH config, unsorted.
+
+    Args:
+        config_path: Path to SSH config file. Defaults to ~/.ssh/config.
+
+    Returns:
+        set[str]: Concrete hostnames, following Include directives.
+    """
     config_path = config_path or Path.home() / ".ssh" / "config"
     hosts: set[str] = set()
     _parse_ssh_config_file(config_path, hosts)
-    return sorted(hosts)
+    return hosts
 
 
 def _parse_ssh_config_file(path: Path, hosts: set[str]) -> None:
@@ -54,30 +79,27 @@ def _parse_ssh_config_file(path: Path, hosts: set[str]) -> None:
     if not path.exists():
         return
 
-    for line in path.read_text().splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-
-        # Reason: SSH config keywords are case-insensitive.
-        lower = stripped.lower()
-
-        if lower.startswith("host "):
-            # Extract everything after "Host " and split on whitespace
-            # to handle multi-host lines like "Host foo bar baz".
-            entries = stripped.split()[1:]
-            for entry in entries:
-                # Filter out wildcard patterns.
-                if any(c in entry for c in ("*", "?", "!")):
-                    continue
-                hosts.add(entry)
-
-        elif lower.startswith("include "):
-            # Expand ~ and globs in Include directives.
-            pattern = stripped.split(None, 1)[1]
-            expanded = str(Path(pattern).expanduser())
-            for match in globmod.glob(expanded):
-                _parse_ssh_config_file(Path(match), hosts)
+    # Reason: Iterating the file object streams lines, so Include-expanded
+    # configs are never held in memory whole.
+    with path.open() as f:
+        for line in f:
+            directive = _SSH_DIRECTIVE_RE.match(line)
+            if directive is None:
+                continue
+            keyword, value = directive.groups()
+
+            # Reason: SSH config keywords are case-insensitive.
+            if keyword.lower() == "host":
+                # Split on whitespace to handle multi-host lines like
+                # "Host foo bar baz", skipping wildcard patterns.
+                for entry in value.split():
+                    if not _WILDCARD_RE.search(entry):
+                        hosts.add(entry)
+            else:
+                # Expand ~ and globs in Include directives.
+                expanded = str(Path(value).expanduser())
+                for match in globmod.glob(expanded):
+                    _parse_ssh_config_file(Path(match), hosts)
 
 
 def discover_hosts(
@@ -95,12 +117,12 @@ def discover_hosts(
     Returns:
         list[str]: Sorted list of hostnames available to add.
     """
-    all_hosts = parse_ssh_config_hosts(ssh_config_path)
-    existing = set(config.nodes) | {"local"}
-    return [h for h in all_hosts if h not in existing]
+    # Reason: Subtract first, then sort only the hosts that are left.
+    all_hosts = _ssh_config_host_set(ssh_config_path)
+    return sorted(all_hosts.difference(config.nodes, ("local",)))
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeStatus:
     """Status of a fleet node.
 
@@ -117,15 +139,42 @@ class NodeStatus:
     config_drift: bool
 
 
+@functools.cache
+def _canonical_tmux_conf() -> bytes:
+    """Read the canonical tmux.conf shipped with nexus.
+
+    The packaged file never changes at runtime, so it is read once per
+    process.
+
+    Returns:
+        bytes: Contents of the canonical tmux.conf.
+    """
+    return importlib.resources.files("nx.data").joinpath("tmux.conf").read_bytes()
+
+
+@functools.cache
 def _local_tmux_conf_hash() -> str:
-    """Compute MD5 hash of the canonical tmux.conf shipped with nexus.
+    """Compute the hash of the canonical tmux.conf shipped with nexus.
 
     Returns:
         str: Hex digest of the canonical tmux.conf.
     """
-    ref = importlib.resources.files("nx.data").joinpath("tmux.conf")
-    content = ref.read_bytes()
-    return hashlib.md5(content).hexdigest()
+    return _tmux_conf_hash(_canonical_tmux_conf())
+
+
+def _tmux_conf_hash(content: bytes) -> str:
+    """Hash tmux.conf contents for drift comparison.
+
+    Every node's file is hashed here, locally, so the algorithm can change
+    without depending on which hash tools a node has installed.
+
+    Args:
+        content: Raw tmux.conf contents.
+
+    Returns:
+        str: SHA-256 hex digest of the contents.
+    """
+    return hashlib.sha256(content).hexdigest()
 
 
 async def _check_node(node: str, local_hash: str) -> NodeStatus:
@@ -133,7 +182,7 @@ async def _check_node(node: str, local_hash: str) -> NodeStatus:
 
     Args:
         node: Node hostname.
-        local_hash: MD5 hash of the canonical tmux.conf.
+        local_hash: Hash of the canonical tmux.conf.
 
     Returns:
         NodeStatus: Status of the node.
@@ -145,53 +194,80 @@ async def _check_node(node: str, local_hash: str) -> NodeStatus:
         # Check local tmux.conf drift.
         conf_path = Path.home() / ".config" / "nexus" / "tmux.conf"
         if conf_path.exists():
-            remote_hash = hashlib.md5(conf_path.read_bytes()).hexdigest()
-            drift = remote_hash != local_hash
+            drift = _tmux_conf_hash(conf_path.read_bytes()) != local_hash
         else:
             drift = False
         return NodeStatus(
             node="local", reachable=True, tmux_version=version, config_drift=drift
         )
 
-    # Remote node: check reachability + tmux version.
-    result = await run_on_node(node, ["tmux", "-V"])
+    # Remote node: one round-trip reports the tmux version and, if the
+    # config has been pushed, its contents on the following lines.
+    result = await run_on_node(node, _build_probe_cmd())
     if result.returncode != 0:
         return NodeStatus(
             node=node, reachable=False, tmux_version=None, config_drift=False
         )
 
-    version = result.stdout.strip()
-
-    # Check remote tmux.conf hash.
-    hash_result = await run_on_node(
-        node, ["md5sum", str(Path("~/.config/nexus/tmux.conf"))]
-    )
-    if hash_result.returncode == 0:
-        remote_hash = hash_result.stdout.split()[0]
-        drift = remote_hash != local_hash
+    version, _, remote_conf = result.stdout.partition("\n")
+    if remote_conf:
+        drift = _tmux_conf_hash(remote_conf.encode()) != local_hash
     else:
         drift = False
 
     return NodeStatus(
-        node=node, reachable=True, tmux_version=version, config_drift=drift
+        node=node, reachable=True, tmux_version=version.strip(), config_drift=drift
     )
 
 
-async def nodes_ls(config: FleetConfig) -> list[NodeStatus]:
+def _build_probe_cmd() -> list[str]:
+    """Build the remote command used by `nx nodes ls` to probe a node.
+
+    Prints `tmux -V` on the first line followed by the contents of the
+    pushed tmux.conf (nothing if the file is missing). Exits non-zero only
+    when tmux itself is unavailable.
+
+    Returns:
+        list[str]: An sh -c command suitable for run_on_node.
+    """
+    # Reason: $HOME is expanded by the remote shell; a literal "~" would
+    # arrive quoted by shlex.join and never be expanded.
+    script = (
+        'tmux -V || exit 1; cat "$HOME/.config/nexus/tmux.conf" 2>/dev/null; exit 0'
+    )
+    return ["sh", "-c", script]
+
+
+async def nodes_ls(
+    config: FleetConfig,
+    on_status: Callable[[NodeStatus], None] | None = None,
+) -> list[NodeStatus]:
     """List all fleet nodes with their status.
 
     Checks each node's reachability, tmux version, and config drift
-    concurrently.
+    concurrently, at most max_concurrent_ssh nodes at a time.
 
     Args:
         config: Fleet configuration.
+        on_status: Optional callback invoked with each node's status as
+            soon as that node has been checked.
 
     Returns:
-        list[NodeStatus]: Status of each node in the fleet.
+        list[NodeStatus]: Status of each node in the fleet, in config order.
     """
     local_hash = _local_tmux_conf_hash()
-    tasks = [_check_node(node, local_hash) for node in config.nodes]
-    return list(await asyncio.gather(*tasks))
+    # Reason: Same budget as fan_out, so a large fleet doesn't open every
+    # SSH connection at once.
+    semaphore = asyncio.Semaphore(config.max_concurrent_ssh)
+
+    async def _check(node: str) -> NodeStatus:
+        async with semaphore:
+            status = await _check_node(node, local_hash)
+        if on_status is not None:
+            on_status(status)
+        return status
+
+    return list(await asyncio.gather(*(_check(node) for node in config.nodes)))
 
 
 async def nodes_add(
@@ -228,7 +304,7 @@ async def nodes_add(
 
     version_str = result.stdout.strip()
     # Parse version number from "tmux X.Y" format.
-    match = re.search(r"(\d+\.\d+)", version_str)
+    match = _VERSION_RE.search(version_str)
     if not match or float(match.group(1)) < 3.0:
         raise RuntimeError(f"tmux >= 3.0 required on {host}, found: {version_str}")
 
@@ -240,31 +316,22 @@ async def nodes_add(
     log.append(f"Ensured {socket_dir} exists")
 
     # Step 3: Push canonical tmux.conf to remote.
-    ref = importlib.resources.files("nx.data").joinpath("tmux.conf")
-    content = ref.read_text()
-    # Reason: We use a heredoc via bash to write the file on the remote side.
-    # This avoids needing scp and makes the operation testable with mock SSH.
-    await run_on_node(host, ["mkdir", "-p", "~/.config/nexus"])
-    await run_on_node(
-        host,
-        [
-            "bash",
-            "-c",
-            f"mkdir -p ~/.config/nexus && cat > ~/.config/nexus/tmux.conf << 'NXEOF'\n{content}\nNXEOF",
-        ],
+    content = _canonical_tmux_conf().decode()
+    # Reason: The file is written by the remote shell, which avoids needing
+    # scp and keeps the push testable with mock SSH. printf '%s' writes the
+    # content byte-for-byte; a heredoc would append a newline and the pushed
+    # file's hash would never match the canonical one in `nx nodes ls`.
+    push = (
+        "mkdir -p ~/.config/nexus && "
+        f"printf '%s' {shlex.quote(content)} > ~/.config/nexus/tmux.conf"
     )
+    await run_on_node(host, ["sh", "-c", push])
     log.append(f"Pushed tmux.conf to {host}")
 
     # Step 4: Append SSH config block (idempotent).
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if config_path.exists():
-        existing = config_path.read_text()
-    else:
-        existing = ""
-
-    # Check if host block already exists.
-    if f"Host {host}" not in existing:
+    if not _has_host_block(config_path, host):
         block = SSH_CONFIG_TEMPLATE.format(host=host)
         with open(config_path, "a") as f:
             f.write(block)
@@ -274,7 +341,7 @@ async def nodes_add(
 
     # Step 5: Add host to fleet config and persist.
     if host not in config.nodes:
-        config.nodes.append(host)
+        config = config.model_copy(update={"nodes": (*config.nodes, host)})
         save_config(config, fleet_config_path)
         log.append(f"Added {host} to fleet config")
 
@@ -305,17 +372,13 @@ def nodes_rm(
     log: list[str] = []
 
     # Remove SSH config block if present.
-    if config_path.exists():
-        content = config_path.read_text()
-        if f"Host {host}" in content:
-            pattern = rf"\nHost {re.escape(host)}\n(?:    [^\n]*\n)*"
-            new_content = re.sub(pattern, "", content)
-            config_path.write_text(new_content)
-            log.append(f"Removed SSH config for {host}")
+    if config_path.exists() and _remove_host_block(config_path, host):
+        log.append(f"Removed SSH config for {host}")
 
     # Remove host from fleet config and persist.
     if host in config.nodes:
-        config.nodes.remove(host)
+        nodes = tuple(n for n in config.nodes if n != host)
+        config = config.model_copy(update={"nodes": nodes})
         save_config(config, fleet_config_path)
         log.append(f"Removed {host} from fleet config")
 
@@ -323,3 +386,70 @@ def nodes_rm(
         raise ValueError(f"Host '{host}' not found in SSH config or fleet config.")
 
     return log
+
+
+def _has_host_block(path: Path, host: str) -> bool:
+    """Check whether an SSH config file has a `Host <host>` block.
+
+    Args:
+        path: SSH config file to scan.
+        host: Hostname to look for.
+
+    Returns:
+        bool: True if a line reads exactly `Host <host>`; False if not, or
+            if the file doesn't exist.
+    """
+    # Reason: A whole-line match, so "Host dev" doesn't match "Host dev-server".
+    header = f"Host {host}"
+    try:
+        with path.open() as f:
+            return any(line.rstrip() == header for line in f)
+    except FileNotFoundError:
+        return False
+
+
+def _remove_host_block(path: Path, host: str) -> bool:
+    """Remove a `Host <host>` block from an SSH config file.
+
+    The block is the header line plus its indented option lines; the blank
+    line written before it by SSH_CONFIG_TEMPLATE goes with it. Lines are
+    streamed into a temporary file that atomically replaces the original;
+    the file is left untouched if it has no such block.
+
+    Args:
+        path: SSH config file to rewrite.
+        host: Hostname whose block should be removed.
+
+    Returns:
+        bool: True if a block was removed.
+    """
+    # Reason: Check first so a file without the block is never rewritten.
+    if not _has_host_block(path, host):
+        return False
+
+    header = f"Host {host}"
+    in_block = False
+    # Reason: A blank line is held back until we know whether the next line
+    # starts the block being removed.
+    held: str | None = None
+
+    with path.open() as src, atomic_write(path) as dst:
+        for line in src:
+            if in_block:
+                if line.strip() and line[0] in " \t":
+                    continue
+                in_block = False
+            if line.rstrip() == header:
+                in_block = True
+                held = None
+                continue
+            if held is not None:
+                dst.write(held)
+                held = None
+            if line.strip():
+                dst.write(line)
+            else:
+                held = line
+        if held is not None:
+            dst.write(held)
+    return True
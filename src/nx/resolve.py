@@ -5,12 +5,12 @@ all nodes in the fleet. Handles fully qualified names (node/session),
 unique matches, and ambiguous matches with fzf disambiguation.
 """
 
-import subprocess
 import sys
 
 from nx.config import FleetConfig
-from nx.ssh import fan_out
-from nx.tmux import build_list_cmd, parse_list_output
+from nx.fzf import fzf_select
+from nx.ssh import fan_out_iter
+from nx.tmux import build_has_session_cmd
 
 
 class SessionNotFound(Exception):
@@ -52,20 +52,21 @@ async def resolve_session(name: str, config: FleetConfig) -> tuple[str, str]:
         node, session = name.split("/", 1)
         return (node, session)
 
-    # Fan out to all nodes to find matching sessions
-    results = await fan_out(
-        config.nodes, build_list_cmd(), max_concurrent=config.max_concurrent_ssh
-    )
-
-    # Collect all (node, session_name) matches
+    # Fan out to all nodes and collect (node, session_name) matches as each
+    # node replies.
+    # Reason: tmux checks for the name itself, so a node sends back an exit
+    # status instead of its whole session list. Unreachable nodes and nodes
+    # with no nexus server fail the check like nodes without the session.
     matches: list[tuple[str, str]] = []
-    for node, result in results.items():
-        if result.returncode != 0:
-            continue
-        sessions = parse_list_output(result.stdout)
-        for session in sessions:
-            if session.name == name:
-                matches.append((node, session.name))
+    async for node, result in fan_out_iter(
+        config.nodes,
+        build_has_session_cmd(name),
+        max_concurrent=config.max_concurrent_ssh,
+        timeout=config.ssh_timeout,
+        deadline=config.fleet_timeout,
+    ):
+        if result.returncode == 0:
+            matches.append((node, name))
 
     # 0 matches
     if len(matches) == 0:
@@ -107,23 +108,15 @@ def _disambiguate_interactive(
         AmbiguousSession: If the user cancels the fzf selection.
     """
     # Reason: Sort default_node matches first, then alphabetical, so the
-    # most likely target is pre-selected in fzf.
-    sorted_matches = sorted(
-        match_strs,
-        key=lambda m: (0 if m.split("/", 1)[0] == default_node else 1, m),
-    )
-
-    fzf_input = "\n".join(sorted_matches)
-    result = subprocess.run(
-        ["fzf", "--prompt", "Select session: "],
-        input=fzf_input,
-        text=True,
-        capture_output=True,
-    )
-
-    if result.returncode != 0:
+    # most likely target is pre-selected in fzf. A prefix partition plus a
+    # plain sort avoids splitting every entry in a key function.
+    prefix = f"{default_node}/"
+    sorted_matches = sorted(m for m in match_strs if m.startswith(prefix))
+    sorted_matches += sorted(m for m in match_strs if not m.startswith(prefix))
+
+    selected = fzf_select(sorted_matches, "Select session: ")
+    if selected is None:
         raise AmbiguousSession("Selection cancelled.")
 
-    selected = result.stdout.strip()
     node, session = selected.split("/", 1)
     return (node, session)
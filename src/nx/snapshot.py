@@ -1,14 +1,13 @@
 """Snapshot and restore fleet state."""
 
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 
 from pydantic import BaseModel
 
 from nx.config import FleetConfig
-from nx.ssh import fan_out, run_on_node
-from nx.tmux import build_list_cmd, build_new_cmd, parse_list_output
+from nx.ssh import fan_out, run_many
+from nx.tmux import build_list_cmd, build_new_many_cmd, parse_list_output
 
 
 SNAPSHOT_PATH = Path.home() / ".config" / "nexus" / "snapshot.json"
@@ -42,7 +41,9 @@ class FleetSnapshot(BaseModel):
     sessions: list[SessionSnapshot]
 
 
-async def save_snapshot(config: FleetConfig, snapshot_path: Path | None = None) -> Path:
+async def save_snapshot(
+    config: FleetConfig, snapshot_path: Path | None = None
+) -> tuple[Path, int]:
     """Save fleet state to a JSON snapshot file.
 
     Fan-outs a list-sessions query to all nodes, collects running sessions,
@@ -53,13 +54,18 @@ async def save_snapshot(config: FleetConfig, snapshot_path: Path | None = None)
         snapshot_path: Path to write snapshot. Defaults to ~/.config/nexus/snapshot.json.
 
     Returns:
-        Path: The path where the snapshot was written.
+        tuple[Path, int]: The path where the snapshot was written and the
+            number of sessions it holds.
     """
     path = snapshot_path or SNAPSHOT_PATH
     path.parent.mkdir(parents=True, exist_ok=True)
 
     results = await fan_out(
-        config.nodes, build_list_cmd(), max_concurrent=config.max_concurrent_ssh
+        config.nodes,
+        build_list_cmd(),
+        max_concurrent=config.max_concurrent_ssh,
+        timeout=config.ssh_timeout,
+        deadline=config.fleet_timeout,
     )
 
     sessions: list[SessionSnapshot] = []
@@ -83,7 +89,7 @@ async def save_snapshot(config: FleetConfig, snapshot_path: Path | None = None)
     )
 
     path.write_text(snapshot.model_dump_json(indent=2))
-    return path
+    return path, len(sessions)
 
 
 async def restore_snapshot(
@@ -93,7 +99,8 @@ async def restore_snapshot(
 ) -> list[str]:
     """Restore fleet state from a JSON snapshot file.
 
-    Reads the snapshot and creates sessions via run_on_node + build_new_cmd.
+    Reads the snapshot and creates each node's sessions with one
+    build_new_many_cmd, running the nodes concurrently via run_many.
 
     Args:
         config: Fleet configuration.
@@ -109,23 +116,53 @@ async def restore_snapshot(
     if not path.exists():
         return log
 
-    data = json.loads(path.read_text())
-    snapshot = FleetSnapshot(**data)
-
-    for session in snapshot.sessions:
-        if node_filter and session.node != node_filter:
-            continue
+    # Reason: pydantic-core parses and validates the bytes in one pass, with
+    # no intermediate dict from the json module.
+    snapshot = FleetSnapshot.model_validate_json(path.read_bytes())
+
+    sessions = [
+        session
+        for session in snapshot.sessions
+        if not node_filter or session.node == node_filter
+    ]
+    by_node: dict[str, list[SessionSnapshot]] = {}
+    for session in sessions:
+        by_node.setdefault(session.node, []).append(session)
+
+    # Reason: One command per node creates all of its sessions, and nodes
+    # are restored concurrently, so a restore costs one round-trip per node
+    # instead of one per session in series.
+    results = await run_many(
+        [
+            (
+                node,
+                build_new_many_cmd(
+                    [(s.name, s.command, s.directory) for s in node_sessions]
+                ),
+            )
+            for node, node_sessions in by_node.items()
+        ],
+        max_concurrent=config.max_concurrent_ssh,
+        timeout=config.ssh_timeout,
+    )
 
-        cmd = build_new_cmd(
-            session.name, cmd=session.command, directory=session.directory
-        )
-        result = await run_on_node(session.node, cmd)
+    errors: dict[tuple[str, str], str] = {}
+    for (node, node_sessions), result in zip(by_node.items(), results):
+        # Reason: A non-zero exit means the batch never ran (e.g. ssh
+        # failed); otherwise stdout lists the sessions that failed.
+        if result.returncode != 0:
+            for session in node_sessions:
+                errors[(node, session.name)] = result.stderr
+        else:
+            for line in result.stdout.splitlines():
+                name, _, error = line.partition("\t")
+                errors[(node, name)] = error
 
-        if result.returncode == 0:
+    for session in sessions:
+        error = errors.get((session.node, session.name))
+        if error is None:
             log.append(f"Restoring {session.node}/{session.name}... OK")
         else:
-            log.append(
-                f"Restoring {session.node}/{session.name}... FAILED: {result.stderr}"
-            )
+            log.append(f"Restoring {session.node}/{session.name}... FAILED: {error}")
 
     return log
@@ -1,11 +1,39 @@
 """SSH transport layer for remote command execution."""
 
 import asyncio
+import functools
+import os
 import shlex
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
+from pathlib import Path
 
 
-@dataclass
+# Local directory holding OpenSSH ControlMaster sockets.
+SSH_SOCKET_DIR = Path.home() / ".ssh" / "sockets"
+
+# Reason: OpenSSH connection multiplexing. The first ssh call to a node
+# opens a master connection; every later call (in this or a subsequent nx
+# invocation within ControlPersist) reuses its authenticated channel and
+# skips the TCP handshake, key exchange, and auth round-trips. Mirrors the
+# Host block that `nx nodes add` writes to ~/.ssh/nexus_config. %C is a
+# fixed-length hash of the connection, keeping long user@host:port names
+# under the unix socket path limit (104 bytes on macOS). ServerAliveInterval
+# keeps an idle master from being dropped by NAT or firewalls while it
+# persists, as the nodes add Host block does.
+SSH_MUX_OPTIONS = [
+    "-o",
+    "ControlMaster=auto",
+    "-o",
+    "ControlPath=~/.ssh/sockets/nx-%C",
+    "-o",
+    "ControlPersist=10m",
+    "-o",
+    "ServerAliveInterval=30",
+]
+
+
+@dataclass(slots=True)
 class NodeResult:
     """Result of executing a command on a node.
 
@@ -22,11 +50,38 @@ class NodeResult:
     node: str
 
 
+@functools.cache
+def _ensure_socket_dir() -> None:
+    """Create the ControlMaster socket directory once per process.
+
+    Reason: ssh refuses to start a master when the ControlPath directory
+    is missing, so it must exist before the first multiplexed call.
+    """
+    SSH_SOCKET_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def _mux_options() -> list[str]:
+    """Return the ssh multiplexing options, or none if disabled.
+
+    Setting NX_DISABLE_SSH_MUX to a non-empty value opts out, e.g. on hosts
+    where the socket directory is not writable or a jump host misbehaves
+    with shared channels.
+
+    Returns:
+        list[str]: SSH_MUX_OPTIONS, or an empty list when disabled.
+    """
+    if os.environ.get("NX_DISABLE_SSH_MUX"):
+        return []
+    _ensure_socket_dir()
+    return SSH_MUX_OPTIONS
+
+
 async def run_on_node(node: str, cmd: list[str], timeout: int = 2) -> NodeResult:
     """Execute a command on a node via SSH (or locally).
 
     If node is "local", runs the command directly via asyncio subprocess.
-    Otherwise, wraps it in an SSH call with ConnectTimeout.
+    Otherwise, wraps it in an SSH call with ConnectTimeout, multiplexed
+    over a shared ControlMaster connection to the node.
 
     Args:
         node: Target node name. "local" for local execution.
@@ -47,6 +102,7 @@ async def run_on_node(node: str, cmd: list[str], timeout: int = 2) -> NodeResult
             "ssh",
             "-o",
             f"ConnectTimeout={timeout}",
+            *_mux_options(),
             node,
             shlex.join(cmd),
         ]
@@ -56,52 +112,159 @@ async def run_on_node(node: str, cmd: list[str], timeout: int = 2) -> NodeResult
             stderr=asyncio.subprocess.PIPE,
         )
 
-    stdout_bytes, stderr_bytes = await proc.communicate()
+    try:
+        stdout_bytes, stderr_bytes = await proc.communicate()
+    except asyncio.CancelledError:
+        # Reason: A fan-out deadline cancels us mid-flight; don't leave an
+        # orphaned ssh process hanging on an unresponsive node.
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+        raise
+    # Reason: A remote session name or ssh banner in a legacy encoding must
+    # not turn the whole node into a UnicodeDecodeError.
     return NodeResult(
-        stdout=stdout_bytes.decode(),
-        stderr=stderr_bytes.decode(),
+        stdout=stdout_bytes.decode("utf-8", "replace"),
+        stderr=stderr_bytes.decode("utf-8", "replace"),
         returncode=proc.returncode or 0,
         node=node,
     )
 
 
+def _failed(node: str, reason: str) -> NodeResult:
+    """Build the NodeResult reported for a node whose command could not run.
+
+    Args:
+        node: Node the command was aimed at.
+        reason: Human-readable cause, surfaced as stderr.
+
+    Returns:
+        NodeResult: Empty stdout, the reason as stderr, and returncode 1.
+    """
+    return NodeResult(stdout="", stderr=reason, returncode=1, node=node)
+
+
+async def fan_out_iter(
+    nodes: Sequence[str],
+    cmd: list[str],
+    max_concurrent: int = 16,
+    timeout: float | None = None,
+    deadline: float | None = None,
+) -> AsyncIterator[tuple[str, NodeResult]]:
+    """Execute a command on multiple nodes, yielding results as they arrive.
+
+    Uses asyncio.Semaphore to limit concurrent SSH connections and
+    asyncio.as_completed so callers can act on fast nodes without waiting
+    for the slowest one. Failures and deadline overruns are reported as a
+    NodeResult with returncode 1 rather than raised.
+
+    Args:
+        nodes: Node names to execute on.
+        cmd: Command and arguments to execute on each node.
+        max_concurrent: Maximum number of concurrent SSH connections.
+        timeout: Per-node deadline in seconds, or None for no deadline.
+        deadline: Overall deadline in seconds for the whole fan-out, counted
+            from the call and covering time spent waiting on the semaphore,
+            or None for no overall deadline.
+
+    Yields:
+        tuple[str, NodeResult]: (node, result) pairs in completion order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    # Reason: One absolute deadline shared by every task, so a fleet larger
+    # than max_concurrent cannot take (len(nodes) / max_concurrent) * timeout
+    # seconds when every node hangs.
+    fleet_deadline = (
+        None if deadline is None else asyncio.get_running_loop().time() + deadline
+    )
+
+    async def _run_one(node: str) -> NodeResult:
+        try:
+            async with asyncio.timeout_at(fleet_deadline):
+                async with semaphore:
+                    try:
+                        return await asyncio.wait_for(run_on_node(node, cmd), timeout)
+                    except TimeoutError:
+                        return _failed(node, f"Timed out after {timeout}s")
+                    except Exception as exc:
+                        return _failed(node, str(exc))
+        except TimeoutError:
+            return _failed(node, f"Fan-out deadline of {deadline}s exceeded")
+
+    tasks = [asyncio.ensure_future(_run_one(node)) for node in nodes]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            yield result.node, result
+    finally:
+        # Reason: If the consumer stops early (break, Ctrl-C), cancel the
+        # stragglers and wait for them, so their ssh processes are killed
+        # before control returns rather than left for loop teardown.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 async def fan_out(
-    nodes: list[str], cmd: list[str], max_concurrent: int = 16
+    nodes: Sequence[str],
+    cmd: list[str],
+    max_concurrent: int = 16,
+    timeout: float | None = None,
+    deadline: float | None = None,
 ) -> dict[str, NodeResult]:
     """Execute a command on multiple nodes concurrently.
 
-    Uses asyncio.Semaphore to limit concurrent SSH connections
-    and asyncio.gather to run all tasks in parallel.
+    Collects every result from fan_out_iter and returns them keyed by node,
+    in the same order as the given node list.
 
     Args:
-        nodes: List of node names to execute on.
+        nodes: Node names to execute on.
         cmd: Command and arguments to execute on each node.
         max_concurrent: Maximum number of concurrent SSH connections.
+        timeout: Per-node deadline in seconds, or None for no deadline.
+        deadline: Overall deadline in seconds for the whole fan-out, or None.
 
     Returns:
         dict[str, NodeResult]: Mapping of node name to its result.
     """
+    results = {
+        node: result
+        async for node, result in fan_out_iter(
+            nodes, cmd, max_concurrent, timeout, deadline
+        )
+    }
+    return {node: results[node] for node in nodes}
+
+
+async def run_many(
+    jobs: list[tuple[str, list[str]]],
+    max_concurrent: int = 16,
+    timeout: float | None = None,
+) -> list[NodeResult]:
+    """Execute a different command per (node, cmd) job, concurrently.
+
+    Complements fan_out for batches where each node gets its own command
+    (e.g. killing specific sessions). Failures are reported the same way,
+    as a NodeResult with returncode 1 rather than raised.
+
+    Args:
+        jobs: (node, cmd) pairs to run.
+        max_concurrent: Maximum number of concurrent SSH connections.
+        timeout: Per-job deadline in seconds, or None for no deadline.
+
+    Returns:
+        list[NodeResult]: One result per job, in the order given.
+    """
     semaphore = asyncio.Semaphore(max_concurrent)
 
-    async def _run_with_semaphore(node: str) -> NodeResult:
+    async def _run_one(node: str, cmd: list[str]) -> NodeResult:
         async with semaphore:
-            return await run_on_node(node, cmd)
-
-    results = await asyncio.gather(
-        *[_run_with_semaphore(node) for node in nodes],
-        return_exceptions=True,
-    )
+            try:
+                return await asyncio.wait_for(run_on_node(node, cmd), timeout)
+            except TimeoutError:
+                return _failed(node, f"Timed out after {timeout}s")
+            except Exception as exc:
+                return _failed(node, str(exc))
 
-    output: dict[str, NodeResult] = {}
-    for node, result in zip(nodes, results):
-        if isinstance(result, Exception):
-            output[node] = NodeResult(
-                stdout="",
-                stderr=str(result),
-                returncode=1,
-                node=node,
-            )
-        else:
-            output[node] = result
-
-    return output
+    return await asyncio.gather(*(_run_one(node, cmd) for node, cmd in jobs))
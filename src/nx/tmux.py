@@ -1,23 +1,31 @@
 """tmux command builder and output parser."""
 
+import shlex
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 SOCKET_NAME = "nexus"
-FIELD_SEPARATOR = "|"
-FORMAT_STRING = (
-    "#{session_name}"
-    "|#{session_windows}"
-    "|#{session_attached}"
-    "|#{pane_current_path}"
-    "|#{pane_current_command}"
-    "|#{pane_pid}"
-    "|#{pane_dead}"
-    "|#{pane_dead_status}"
+# Reason: ASCII unit separator rather than "|", which is legal in session
+# names and paths. tmux escapes control characters in session names, so
+# only the pane path can still contain it; the parser allows for that.
+FIELD_SEPARATOR = "\x1f"
+FORMAT_STRING = FIELD_SEPARATOR.join(
+    (
+        "#{session_name}",
+        "#{session_windows}",
+        "#{session_attached}",
+        "#{pane_current_path}",
+        "#{pane_current_command}",
+        "#{pane_pid}",
+        "#{pane_dead}",
+        "#{pane_dead_status}",
+    )
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfo:
     """Parsed tmux session information.
 
@@ -42,20 +50,67 @@ class SessionInfo:
     exit_status: int | None
 
 
+def _tmux(*args: str) -> list[str]:
+    """Build a tmux command addressed to the nexus socket.
+
+    Args:
+        *args: tmux subcommand and its arguments.
+
+    Returns:
+        list[str]: ["tmux", "-L", SOCKET_NAME, *args].
+    """
+    # Reason: SOCKET_NAME is read per call rather than frozen into a
+    # module-level prefix, so tests can point every builder at a private
+    # socket by patching one name.
+    return ["tmux", "-L", SOCKET_NAME, *args]
+
+
 def build_list_cmd() -> list[str]:
     """Build the tmux command to list all sessions with detailed format.
 
     Returns:
         list[str]: Command arguments for tmux list-sessions.
     """
-    return [
-        "tmux",
-        "-L",
-        SOCKET_NAME,
-        "list-sessions",
-        "-F",
-        FORMAT_STRING,
-    ]
+    return _tmux("list-sessions", "-F", FORMAT_STRING)
+
+
+def iter_list_output(raw: str) -> Iterator[SessionInfo]:
+    """Lazily parse tmux list-sessions output into SessionInfo objects.
+
+    Yields one session per well-formed line, so a caller looking for a
+    single session can stop without parsing the rest.
+
+    Args:
+        raw: Raw stdout from tmux list-sessions with FORMAT_STRING.
+
+    Yields:
+        SessionInfo: Parsed session information, in output order.
+    """
+    # Reason: Blank and malformed lines both split into too few fields, so
+    # length checks skip them without a separate strip(). The pane path is
+    # the only field tmux prints unescaped, so split around it from both
+    # ends and let it keep any separator it contains.
+    for line in raw.splitlines():
+        head = line.split(FIELD_SEPARATOR, 3)
+        if len(head) < 4:
+            continue
+        tail = head[3].rsplit(FIELD_SEPARATOR, 4)
+        if len(tail) < 5:
+            continue
+
+        name, windows, attached = head[:3]
+        path, cmd, pid, dead, status = tail
+        pane_dead = dead == "1"
+        yield SessionInfo(
+            name,
+            int(windows),
+            int(attached),
+            path,
+            cmd,
+            int(pid),
+            pane_dead,
+            int(status) if status and pane_dead else None,
+        )
 
 
 def parse_list_output(raw: str) -> list[SessionInfo]:
@@ -69,65 +124,103 @@ def parse_list_output(raw: str) -> list[SessionInfo]:
     Returns:
         list[SessionInfo]: Parsed session information.
     """
-    sessions: list[SessionInfo] = []
+    return list(iter_list_output(raw))
 
-    for line in raw.strip().splitlines():
-        if not line.strip():
-            continue
 
-        fields = line.split(FIELD_SEPARATOR)
-        if len(fields) < 8:
-            continue
+def build_has_session_cmd(name: str) -> list[str]:
+    """Build the tmux command that checks whether a session exists.
 
-        name = fields[0]
-        windows = int(fields[1])
-        attached = int(fields[2])
-        pane_path = fields[3]
-        pane_cmd = fields[4]
-        pane_pid = int(fields[5])
-        pane_dead = fields[6] == "1"
-        exit_status = int(fields[7]) if fields[7] and pane_dead else None
-
-        sessions.append(
-            SessionInfo(
-                name=name,
-                windows=windows,
-                attached=attached,
-                pane_path=pane_path,
-                pane_cmd=pane_cmd,
-                pane_pid=pane_pid,
-                is_dead=pane_dead,
-                exit_status=exit_status,
-            )
-        )
+    Exits 0 if a session with exactly this name exists and non-zero
+    otherwise, printing nothing on success.
+
+    Args:
+        name: Session name to look for.
 
-    return sessions
+    Returns:
+        list[str]: Command arguments for tmux has-session.
+    """
+    # Reason: A leading "=" makes tmux match the name exactly rather than
+    # as a prefix or pattern.
+    return _tmux("has-session", "-t", f"={name}")
+
+
+@lru_cache(maxsize=256)
+def _split_cmd(cmd: str) -> tuple[str, ...]:
+    """Split a command string into argv using shell quoting rules.
+
+    Cached because a restore or multi-node create repeats the same few
+    commands (default_cmd, a shell) for every session.
+
+    Args:
+        cmd: Command string such as the config default_cmd.
+
+    Returns:
+        tuple[str, ...]: The argv, or a plain whitespace split if the string
+        has unbalanced quotes.
+    """
+    try:
+        return tuple(shlex.split(cmd))
+    except ValueError:
+        # Reason: Unbalanced quotes keep the old whitespace split rather
+        # than failing a whole restore on one bad command string.
+        return tuple(cmd.split())
 
 
 def build_new_cmd(
-    name: str, cmd: str | None = None, directory: str | None = None
+    name: str, cmd: str | list[str] | None = None, directory: str | None = None
 ) -> list[str]:
     """Build the tmux command to create a new detached session.
 
     Args:
         name: Session name.
-        cmd: Command to run in the session. If None, uses tmux default.
+        cmd: Command to run in the session. A list is passed to tmux as
+            argv verbatim, so arguments containing spaces or quotes survive;
+            a string (config default_cmd, snapshot command) is split with
+            shell quoting rules. If None, uses tmux default.
         directory: Working directory for the session.
 
     Returns:
         list[str]: Command arguments for tmux new-session.
     """
-    result = ["tmux", "-L", SOCKET_NAME, "new-session", "-d", "-s", name]
+    result = _tmux("new-session", "-d", "-s", name)
 
     if directory:
         result.extend(["-c", directory])
 
-    if cmd:
-        result.extend(cmd.split())
+    if isinstance(cmd, str):
+        result.extend(_split_cmd(cmd))
+    elif cmd:
+        result.extend(cmd)
 
     return result
 
 
+def build_new_many_cmd(
+    sessions: list[tuple[str, str | list[str] | None, str | None]],
+) -> list[str]:
+    """Build one command that creates several sessions on the same node.
+
+    Each session is created even if an earlier one fails. For every session
+    that could not be created, its name and tmux's error are written to
+    stdout as one tab-separated line.
+
+    Args:
+        sessions: (name, cmd, directory) per session, as for build_new_cmd.
+
+    Returns:
+        list[str]: An sh -c command wrapping one tmux new-session per session.
+    """
+    # Reason: Chained in sh rather than with tmux's `;` for the same reason
+    # as build_kill_many_cmd; new-session -d prints nothing on success, so
+    # its captured output is the error.
+    script = "; ".join(
+        f"err=$({shlex.join(build_new_cmd(name, cmd, directory))} 2>&1)"
+        f" || printf '%s\\t%s\\n' {shlex.quote(name)} \"$err\""
+        for name, cmd, directory in sessions
+    )
+    return ["sh", "-c", script]
+
+
 def build_capture_cmd(session: str, lines: int | str = 30) -> list[str]:
     """Build the tmux command to capture pane output.
 
@@ -140,17 +233,7 @@ def build_capture_cmd(session: str, lines: int | str = 30) -> list[str]:
         list[str]: Command arguments for tmux capture-pane.
     """
     start = f"-{lines}" if isinstance(lines, int) else "-"
-    return [
-        "tmux",
-        "-L",
-        SOCKET_NAME,
-        "capture-pane",
-        "-p",
-        "-t",
-        session,
-        "-S",
-        start,
-    ]
+    return _tmux("capture-pane", "-p", "-t", session, "-S", start)
 
 
 def build_send_keys_cmd(session: str, keys: list[str], raw: bool = False) -> list[str]:
@@ -167,7 +250,7 @@ def build_send_keys_cmd(session: str, keys: list[str], raw: bool = False) -> lis
     Returns:
         list[str]: Command arguments for tmux send-keys.
     """
-    result = ["tmux", "-L", SOCKET_NAME, "send-keys", "-t", session]
+    result = _tmux("send-keys", "-t", session)
     result.extend(keys)
 
     if not raw:
@@ -185,11 +268,27 @@ def build_kill_cmd(session: str) -> list[str]:
     Returns:
         list[str]: Command arguments for tmux kill-session.
     """
-    return [
-        "tmux",
-        "-L",
-        SOCKET_NAME,
-        "kill-session",
-        "-t",
-        session,
-    ]
+    return _tmux("kill-session", "-t", session)
+
+
+def build_kill_many_cmd(sessions: list[str]) -> list[str]:
+    """Build one command that kills several sessions on the same node.
+
+    Each kill runs even if an earlier one fails, and the name of every
+    session that could not be killed is printed to stdout, one per line.
+
+    Args:
+        sessions: Target session names.
+
+    Returns:
+        list[str]: An sh -c command wrapping one tmux kill-session per session.
+    """
+    # Reason: tmux's own `;` command separator aborts the sequence at the
+    # first failing command, so the kills are chained in sh instead. printf
+    # rather than echo, which dash lets mangle backslashes and `-n` names.
+    script = "; ".join(
+        f"{shlex.join(build_kill_cmd(session))}"
+        f" || printf '%s\\n' {shlex.quote(session)}"
+        for session in sessions
+    )
+    return ["sh", "-c", script]
@@ -3,6 +3,17 @@
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolate_fleet_config(tmp_path, monkeypatch):
+    """Point the default fleet.toml location at a per-test temp file.
+
+    Commands such as nodes add/rm save the config without an explicit path.
+    Without this, those tests would write the developer's real
+    ~/.config/nexus/fleet.toml, and parallel workers would race on it.
+    """
+    monkeypatch.setattr("nx.config.DEFAULT_CONFIG_PATH", tmp_path / "fleet.toml")
+
+
 @pytest.fixture
 def mock_ssh():
     """Mock SSH command execution.
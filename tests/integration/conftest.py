@@ -1,6 +1,7 @@
 """Integration test fixtures for real tmux testing."""
 
 import asyncio
+import os
 
 import pytest
 
@@ -9,20 +10,58 @@ from nx.ssh import run_on_node
 
 # The integration test socket name. All integration tests use this
 # dedicated tmux socket to avoid interfering with the user's real sessions.
-TEST_SOCKET = "nx_test"
+# Reason: Under pytest-xdist each worker gets its own socket (nx_test_gw0,
+# ...), so workers never see or kill each other's sessions and servers.
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+TEST_SOCKET = f"nx_test_{_WORKER}" if _WORKER else "nx_test"
+
+# Session held open for the whole run so the server outlives each test.
+KEEPALIVE_SESSION = "integ-keepalive"
 
 
 @pytest.fixture(autouse=True, scope="session")
-def clean_tmux():
-    """Kill all sessions on the nx_test tmux socket before and after tests.
+def tmux_server():
+    """Start one nx_test tmux server for the whole run and kill it afterwards.
+
+    Kills any leftover server first, so no state leaks between runs, then
+    starts a keep-alive session. tmux exits when its last session goes, so
+    without it every test would boot a fresh server.
 
-    Guarantees no leaked state between test runs.
+    Yields:
+        str: Name of the keep-alive session.
     """
     asyncio.run(run_on_node("local", ["tmux", "-L", TEST_SOCKET, "kill-server"]))
-    yield
+    asyncio.run(
+        run_on_node(
+            "local",
+            [
+                "tmux",
+                "-L",
+                TEST_SOCKET,
+                "new-session",
+                "-d",
+                "-s",
+                KEEPALIVE_SESSION,
+                "cat",
+            ],
+        )
+    )
+    yield KEEPALIVE_SESSION
     asyncio.run(run_on_node("local", ["tmux", "-L", TEST_SOCKET, "kill-server"]))
 
 
+@pytest.fixture(scope="module")
+def run():
+    """Run coroutines on one event loop shared by a whole test module.
+
+    Yields:
+        Callable: asyncio.Runner.run, used in place of asyncio.run so each
+        tmux call does not build and tear down its own loop.
+    """
+    with asyncio.Runner() as runner:
+        yield runner.run
+
+
 @pytest.fixture
 def nx_test_config(monkeypatch):
     """Return a FleetConfig using the nx_test socket.
@@ -12,101 +12,179 @@ import time
 
 from nx.resolve import resolve_session
 from nx.snapshot import save_snapshot, restore_snapshot
-from nx.ssh import run_on_node
+from nx.ssh import NodeResult, run_on_node
 from nx.tmux import (
+    SessionInfo,
     build_capture_cmd,
     build_kill_cmd,
+    build_kill_many_cmd,
     build_list_cmd,
     build_new_cmd,
     build_send_keys_cmd,
+    iter_list_output,
     parse_list_output,
 )
 
 
-def _cleanup_session(name: str) -> None:
+def _wait_until(predicate, timeout: float = 2.0, interval: float = 0.02) -> bool:
+    """Poll until a condition on tmux state holds, instead of a fixed sleep.
+
+    Args:
+        predicate: Zero-argument callable returning True once the state is
+            reached.
+        timeout: Seconds to keep polling before giving up.
+        interval: Seconds between polls.
+
+    Returns:
+        bool: True if the predicate held within the timeout, False otherwise.
+    """
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+    return True
+
+
+def _sessions(run) -> list[SessionInfo]:
+    """List sessions on the test socket; empty if no server is running."""
+    result = run(run_on_node("local", build_list_cmd()))
+    return parse_list_output(result.stdout) if result.returncode == 0 else []
+
+
+def _session_names(run) -> set[str]:
+    """Names of the sessions on the test socket, for membership checks."""
+    return {s.name for s in _sessions(run)}
+
+
+def _running(run, names: list[str], cmd: str = "cat") -> bool:
+    """Whether every named session's pane is running cmd yet."""
+    panes = {s.name: s.pane_cmd for s in _sessions(run)}
+    return all(panes.get(n) == cmd for n in names)
+
+
+def _captured(run, name: str, text: str) -> bool:
+    """Whether text appears in the session's visible pane."""
+    result = run(run_on_node("local", build_capture_cmd(name, 30)))
+    return text in result.stdout
+
+
+def _cleanup_session(run, name: str) -> None:
     """Kill a test session, ignoring errors if it doesn't exist."""
-    asyncio.run(run_on_node("local", build_kill_cmd(name)))
+    run(run_on_node("local", build_kill_cmd(name)))
+
+
+async def _on_local(*cmds: list[str]) -> list[NodeResult]:
+    """Run independent tmux commands on the local node concurrently."""
+    return await asyncio.gather(*(run_on_node("local", cmd) for cmd in cmds))
+
+
+def _cleanup_many(run, names: list[str]) -> None:
+    """Kill several test sessions at once, ignoring ones that don't exist."""
+    run(_on_local(*(build_kill_cmd(n) for n in names)))
+
+
+# Printed between the outputs of batched commands so they can be split apart.
+BATCH_SEP = "==nx-batch=="
+
+
+def _batched(*commands: list[str]) -> list[str]:
+    """Fuse tmux commands into one invocation with a separator between outputs.
+
+    Args:
+        *commands: Commands from the build_*_cmd helpers, all on one socket.
+
+    Returns:
+        list[str]: One tmux command line; split its stdout on BATCH_SEP.
+    """
+    # Reason: Each builder starts with "tmux -L <socket>"; keep the first
+    # prefix and chain the rest with ";" so one tmux client runs them all.
+    argv = commands[0][:3]
+    for i, command in enumerate(commands):
+        if i:
+            argv += [";", "display-message", "-p", BATCH_SEP, ";"]
+        argv += command[3:]
+    return argv
+
+
+def _split_batch(stdout: str) -> list[str]:
+    """Split the stdout of a _batched command into one chunk per command."""
+    return stdout.split(BATCH_SEP + "\n")
 
 
 # ---- Test 1: test_full_lifecycle ----
-def test_full_lifecycle(nx_test_config):
+def test_full_lifecycle(run, nx_test_config):
     """new -> list -> peek -> send -> logs -> kill: full session lifecycle."""
     name = "integ-lifecycle"
 
     try:
         # Create a session running cat (blocks waiting for input)
-        result = asyncio.run(run_on_node("local", build_new_cmd(name, cmd="cat")))
+        result = run(run_on_node("local", build_new_cmd(name, cmd="cat")))
         assert result.returncode == 0, f"Failed to create session: {result.stderr}"
-        time.sleep(0.5)
+        assert _wait_until(lambda: _running(run, [name]))
 
-        # List -- session should appear
-        result = asyncio.run(run_on_node("local", build_list_cmd()))
+        # List and peek in one tmux call. tmux stops a sequence at the first
+        # failing command, so returncode 0 covers both.
+        result = run(
+            run_on_node(
+                "local", _batched(build_list_cmd(), build_capture_cmd(name, 30))
+            )
+        )
         assert result.returncode == 0
-        sessions = parse_list_output(result.stdout)
-        names = [s.name for s in sessions]
-        assert name in names
+        listing, _ = _split_batch(result.stdout)
 
-        # Peek -- should return something (empty or prompt)
-        result = asyncio.run(run_on_node("local", build_capture_cmd(name, 30)))
-        assert result.returncode == 0
+        # List -- session should appear
+        assert name in {s.name for s in parse_list_output(listing)}
 
         # Send "hello"
-        result = asyncio.run(run_on_node("local", build_send_keys_cmd(name, ["hello"])))
-        assert result.returncode == 0
-        time.sleep(0.5)
-
-        # Peek -- should now contain "hello" (cat echoes input)
-        result = asyncio.run(run_on_node("local", build_capture_cmd(name, 30)))
+        result = run(run_on_node("local", build_send_keys_cmd(name, ["hello"])))
         assert result.returncode == 0
-        assert "hello" in result.stdout
+        assert _wait_until(lambda: _captured(run, name, "hello"))
 
-        # Logs -- should capture scrollback
-        result = asyncio.run(run_on_node("local", build_capture_cmd(name, 100)))
+        # Peek and logs -- both should now contain "hello" (cat echoes input)
+        result = run(
+            run_on_node(
+                "local",
+                _batched(build_capture_cmd(name, 30), build_capture_cmd(name, 100)),
+            )
+        )
         assert result.returncode == 0
-        assert "hello" in result.stdout
+        peek, logs = _split_batch(result.stdout)
+        assert "hello" in peek
+        assert "hello" in logs
 
         # Kill
-        result = asyncio.run(run_on_node("local", build_kill_cmd(name)))
+        result = run(run_on_node("local", build_kill_cmd(name)))
         assert result.returncode == 0
 
         # Verify gone
-        time.sleep(0.3)
-        result = asyncio.run(run_on_node("local", build_list_cmd()))
-        if result.returncode == 0:
-            sessions = parse_list_output(result.stdout)
-            names = [s.name for s in sessions]
-            assert name not in names
+        assert name not in _session_names(run)
     finally:
-        _cleanup_session(name)
+        _cleanup_session(run, name)
 
 
 # ---- Test 2: test_send_peek_roundtrip ----
-def test_send_peek_roundtrip(nx_test_config):
+def test_send_peek_roundtrip(run, nx_test_config):
     """Send text to a cat session and verify it appears in peek output."""
     name = "integ-roundtrip"
 
     try:
-        result = asyncio.run(run_on_node("local", build_new_cmd(name, cmd="cat")))
+        result = run(run_on_node("local", build_new_cmd(name, cmd="cat")))
         assert result.returncode == 0
-        time.sleep(0.5)
+        assert _wait_until(lambda: _running(run, [name]))
 
         # Send "hello world"
-        result = asyncio.run(
-            run_on_node("local", build_send_keys_cmd(name, ["hello world"]))
-        )
+        result = run(run_on_node("local", build_send_keys_cmd(name, ["hello world"])))
         assert result.returncode == 0
-        time.sleep(0.5)
 
         # Peek -- verify "hello world" appears
-        result = asyncio.run(run_on_node("local", build_capture_cmd(name, 30)))
-        assert result.returncode == 0
-        assert "hello world" in result.stdout
+        assert _wait_until(lambda: _captured(run, name, "hello world"))
     finally:
-        _cleanup_session(name)
+        _cleanup_session(run, name)
 
 
 # ---- Test 3: test_snapshot_restore_cycle ----
-def test_snapshot_restore_cycle(nx_test_config, tmp_path):
+def test_snapshot_restore_cycle(run, nx_test_config, tmp_path):
     """Create 2 sessions -> snapshot -> kill both -> restore -> verify recreated."""
     config = nx_test_config
     names = ["integ-snap-a", "integ-snap-b"]
@@ -114,92 +192,76 @@ def test_snapshot_restore_cycle(nx_test_config, tmp_path):
 
     try:
         # Create 2 sessions
-        for n in names:
-            result = asyncio.run(run_on_node("local", build_new_cmd(n, cmd="cat")))
-            assert result.returncode == 0
-        time.sleep(0.5)
+        results = run(_on_local(*(build_new_cmd(n, cmd="cat") for n in names)))
+        assert all(r.returncode == 0 for r in results)
+        assert _wait_until(lambda: _running(run, names))
 
         # Snapshot
-        path = asyncio.run(save_snapshot(config, snapshot_path=snap_path))
+        path, _ = run(save_snapshot(config, snapshot_path=snap_path))
         assert path.exists()
 
         # Kill both
-        for n in names:
-            asyncio.run(run_on_node("local", build_kill_cmd(n)))
-        time.sleep(0.3)
+        _cleanup_many(run, names)
 
         # Verify both gone
-        result = asyncio.run(run_on_node("local", build_list_cmd()))
-        if result.returncode == 0:
-            sessions = parse_list_output(result.stdout)
-            live_names = [s.name for s in sessions]
-            for n in names:
-                assert n not in live_names
+        assert _session_names(run).isdisjoint(names)
 
         # Restore
-        log = asyncio.run(restore_snapshot(config, snapshot_path=snap_path))
-        assert len(log) == 2
-        time.sleep(0.5)
+        # Reason: The snapshot also holds the shared keep-alive session,
+        # whose restore fails as a duplicate; only check ours.
+        log = run(restore_snapshot(config, snapshot_path=snap_path))
+        for n in names:
+            assert f"Restoring local/{n}... OK" in log
 
         # Verify both recreated
-        result = asyncio.run(run_on_node("local", build_list_cmd()))
-        assert result.returncode == 0
-        sessions = parse_list_output(result.stdout)
-        live_names = [s.name for s in sessions]
-        for n in names:
-            assert n in live_names
+        assert _session_names(run).issuperset(names)
     finally:
-        for n in names:
-            _cleanup_session(n)
+        _cleanup_many(run, names)
 
 
 # ---- Test 4: test_gc_cleans_exited ----
-def test_gc_cleans_exited(nx_test_config):
+def test_gc_cleans_exited(run, nx_test_config, tmux_server):
     """Create a session with 'exit 0', wait for exit, gc, verify gone."""
     import nx.tmux
 
     name = "integ-gc-exit"
-    keepalive = "integ-gc-keepalive"
     socket = nx.tmux.SOCKET_NAME
 
     try:
-        # Reason: Create a keep-alive session so the tmux server doesn't
-        # shut down when the test session exits (tmux kills the server
-        # when the last session is gone).
-        result = asyncio.run(run_on_node("local", build_new_cmd(keepalive, cmd="cat")))
-        assert result.returncode == 0
-
-        # Create the session that will exit. Use "sleep 1" so we have
-        # time to set remain-on-exit before it finishes.
-        result = asyncio.run(run_on_node("local", build_new_cmd(name, cmd="sleep 1")))
-        assert result.returncode == 0
-
-        # Reason: Set remain-on-exit so tmux keeps the dead pane visible
-        # in list-sessions instead of destroying it immediately.
-        result = asyncio.run(
+        # Create the session that will exit and set remain-on-exit on it in
+        # one tmux call.
+        # Reason: remain-on-exit keeps the dead pane visible in
+        # list-sessions instead of destroying it immediately. tmux runs the
+        # whole sequence before returning to its event loop, where child
+        # exits are noticed, so the option is in place before the pane dies.
+        result = run(
             run_on_node(
                 "local",
-                [
-                    "tmux",
-                    "-L",
-                    socket,
-                    "set-option",
-                    "-t",
-                    name,
-                    "remain-on-exit",
-                    "on",
-                ],
+                _batched(
+                    build_new_cmd(name, cmd="sleep 0.2"),
+                    [
+                        "tmux",
+                        "-L",
+                        socket,
+                        "set-option",
+                        "-t",
+                        name,
+                        "remain-on-exit",
+                        "on",
+                    ],
+                ),
             )
         )
-        assert result.returncode == 0
+        assert result.returncode == 0, result.stderr
 
-        # Wait for the sleep command to exit
-        time.sleep(2.0)
+        # Wait for the sleep command to exit, then verify it's dead
+        def _dead() -> bool:
+            result = run(run_on_node("local", build_list_cmd()))
+            sessions = iter_list_output(result.stdout)
+            return any(s.name == name and s.is_dead for s in sessions)
 
-        # Verify it's dead
-        result = asyncio.run(run_on_node("local", build_list_cmd()))
-        assert result.returncode == 0
-        sessions = parse_list_output(result.stdout)
+        assert _wait_until(_dead, timeout=5.0)
+        sessions = _sessions(run)
         dead = [s for s in sessions if s.name == name and s.is_dead]
         assert len(dead) == 1, (
             f"Expected dead session, got: {[(s.name, s.is_dead) for s in sessions]}"
@@ -208,74 +270,66 @@ def test_gc_cleans_exited(nx_test_config):
         # GC -- kill dead sessions
         for s in sessions:
             if s.name == name and s.is_dead:
-                asyncio.run(run_on_node("local", build_kill_cmd(name)))
-        time.sleep(0.3)
+                run(run_on_node("local", build_kill_cmd(name)))
 
         # Verify gone
-        result = asyncio.run(run_on_node("local", build_list_cmd()))
-        assert result.returncode == 0
-        sessions = parse_list_output(result.stdout)
-        names_left = [s.name for s in sessions]
+        names_left = _session_names(run)
+        assert tmux_server in names_left
         assert name not in names_left
     finally:
-        _cleanup_session(name)
-        _cleanup_session(keepalive)
+        _cleanup_session(run, name)
 
 
 # ---- Test 5: test_resolution_fully_qualified ----
-def test_resolution_fully_qualified(nx_test_config):
+def test_resolution_fully_qualified(run, nx_test_config):
     """peek 'local/name' resolves without fan-out."""
     config = nx_test_config
     name = "integ-fqn"
 
     try:
-        result = asyncio.run(run_on_node("local", build_new_cmd(name, cmd="cat")))
+        result = run(run_on_node("local", build_new_cmd(name, cmd="cat")))
         assert result.returncode == 0
-        time.sleep(0.5)
 
         # Resolve fully qualified name -- should return immediately without fan-out
-        node, session = asyncio.run(resolve_session(f"local/{name}", config))
+        node, session = run(resolve_session(f"local/{name}", config))
         assert node == "local"
         assert session == name
 
         # Verify we can peek using the resolved session
-        result = asyncio.run(run_on_node(node, build_capture_cmd(session, 30)))
+        result = run(run_on_node(node, build_capture_cmd(session, 30)))
         assert result.returncode == 0
     finally:
-        _cleanup_session(name)
+        _cleanup_session(run, name)
 
 
 # ---- Test 6: test_new_duplicate_rejected ----
-def test_new_duplicate_rejected(nx_test_config):
+def test_new_duplicate_rejected(run, nx_test_config):
     """Creating a session with the same name twice fails."""
     name = "integ-dup"
 
     try:
         # First creation -- should succeed
-        result = asyncio.run(run_on_node("local", build_new_cmd(name, cmd="cat")))
+        result = run(run_on_node("local", build_new_cmd(name, cmd="cat")))
         assert result.returncode == 0
-        time.sleep(0.3)
 
         # Second creation -- should fail with "duplicate session"
-        result = asyncio.run(run_on_node("local", build_new_cmd(name, cmd="cat")))
+        result = run(run_on_node("local", build_new_cmd(name, cmd="cat")))
         assert result.returncode != 0
         assert (
             "duplicate" in result.stderr.lower() or "exists" in result.stderr.lower()
         ), f"Expected duplicate error, got: {result.stderr}"
     finally:
-        _cleanup_session(name)
+        _cleanup_session(run, name)
 
 
 # ---- Test 7: test_fzf_roundtrip ----
-def test_fzf_roundtrip(nx_test_config):
+def test_fzf_roundtrip(run, nx_test_config):
     """Verify fzf format/parse contract: create sessions, filter, parse back."""
     names = ["integ-fzf-alpha", "integ-fzf-beta"]
 
     try:
-        for n in names:
-            result = asyncio.run(run_on_node("local", build_new_cmd(n, cmd="cat")))
-            assert result.returncode == 0
-        time.sleep(0.5)
+        results = run(_on_local(*(build_new_cmd(n, cmd="cat") for n in names)))
+        assert all(r.returncode == 0 for r in results)
 
         # Format as fzf input: "local/sess1\nlocal/sess2"
         fzf_input = "\n".join(f"local/{n}" for n in names)
@@ -296,20 +350,22 @@ def test_fzf_roundtrip(nx_test_config):
         assert node == "local"
         assert session == "integ-fzf-alpha"
     finally:
-        for n in names:
-            _cleanup_session(n)
+        _cleanup_many(run, names)
 
 
 # ---- Test 8: test_list_empty_fleet ----
-def test_list_empty_fleet(nx_test_config):
+def test_list_empty_fleet(run, nx_test_config, monkeypatch):
     """No sessions -> list returns empty (tmux server may not even exist)."""
+    import nx.tmux
 
-    # Kill any leftover sessions first
-    asyncio.run(run_on_node("local", ["tmux", "-L", "nx_test", "kill-server"]))
-    time.sleep(0.3)
+    # Reason: Point at a socket of its own rather than killing the shared
+    # test server that the other tests rely on.
+    socket = f"{nx.tmux.SOCKET_NAME}_empty"
+    monkeypatch.setattr(nx.tmux, "SOCKET_NAME", socket)
+    run(run_on_node("local", ["tmux", "-L", socket, "kill-server"]))
 
     # List sessions -- should return non-zero (no server) or empty output
-    result = asyncio.run(run_on_node("local", build_list_cmd()))
+    result = run(run_on_node("local", build_list_cmd()))
 
     if result.returncode == 0:
         sessions = parse_list_output(result.stdout)
@@ -317,3 +373,22 @@ def test_list_empty_fleet(nx_test_config):
     else:
         # tmux returns error when no server exists -- this is expected
         assert result.returncode != 0
+
+
+# ---- Test 9: test_kill_many_continues_past_missing ----
+def test_kill_many_continues_past_missing(run, nx_test_config, tmux_server):
+    """Batched kill reaps every existing session and reports the missing one."""
+    names = ["integ-batch-a", "integ-batch-b"]
+
+    try:
+        results = run(_on_local(*(build_new_cmd(n, cmd="cat") for n in names)))
+        assert all(r.returncode == 0 for r in results)
+
+        cmd = build_kill_many_cmd([names[0], "integ-batch-missing", names[1]])
+        result = run(run_on_node("local", cmd))
+        assert result.returncode == 0
+        assert result.stdout.splitlines() == ["integ-batch-missing"]
+
+        assert _session_names(run) == {tmux_server}
+    finally:
+        _cleanup_many(run, names)
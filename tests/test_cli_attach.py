@@ -16,6 +16,7 @@ Three scenarios are tested:
 import os
 import subprocess as subprocess_mod
 
+import pytest
 from typer.testing import CliRunner
 
 from nx.cli import app
@@ -23,13 +24,85 @@ from nx.config import FleetConfig
 
 runner = CliRunner()
 
+# Reason: FleetConfig is frozen, so one instance per fleet shape can be
+# shared by every test instead of being rebuilt and revalidated each time.
+CONFIG_LOCAL_ONLY = FleetConfig(
+    nodes=["local"], default_node="local", default_cmd="/bin/bash"
+)
+CONFIG_WITH_DEV = FleetConfig(
+    nodes=["local", "dev-server"], default_node="local", default_cmd="/bin/bash"
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers for process mocking
+# ---------------------------------------------------------------------------
+
+
+class AttachRecorder:
+    """Records the process calls `nx attach` makes instead of running them.
+
+    Attributes:
+        execvp_calls: (file, args) for each os.execvp call.
+        run_calls: Positional args for each subprocess.run call.
+    """
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch):
+        self._monkeypatch = monkeypatch
+        self.execvp_calls: list[tuple] = []
+        self.run_calls: list[tuple] = []
+
+    def fake_execvp(self, file, args):
+        """Record the execvp call instead of replacing the process."""
+        self.execvp_calls.append((file, args))
+
+    def fake_run(self, *args, **kwargs):
+        """Record subprocess.run call and return success."""
+        self.run_calls.append(args)
+        return subprocess_mod.CompletedProcess(args=args[0], returncode=0)
+
+    def use_config(self, config: FleetConfig) -> None:
+        """Make the CLI load the given config instead of reading fleet.toml.
+
+        Args:
+            config: Fleet configuration to hand to every command.
+        """
+        self._monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+
+    def resolve_to(self, node: str, session: str) -> None:
+        """Make resolve_session return (node, session) for any name.
+
+        Args:
+            node: Node the session resolves to.
+            session: Session name it resolves to.
+        """
+
+        async def fake_resolve(name, config):
+            """Return the fixed node/session pair."""
+            return (node, session)
+
+        self._monkeypatch.setattr("nx.cli.resolve_session", fake_resolve)
+
+
+@pytest.fixture
+def attach_env(monkeypatch) -> AttachRecorder:
+    """Patch os.execvp and nx.cli's subprocess.run with a shared recorder.
+
+    Returns:
+        AttachRecorder: Recorder holding every captured call.
+    """
+    recorder = AttachRecorder(monkeypatch)
+    monkeypatch.setattr(os, "execvp", recorder.fake_execvp)
+    monkeypatch.setattr("nx.cli.subprocess.run", recorder.fake_run)
+    return recorder
+
 
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
 
 
-def test_attach_bare_terminal(monkeypatch):
+def test_attach_bare_terminal(monkeypatch, attach_env):
     """Bare terminal attaching to a remote session replaces the process via SSH.
 
     Scenario:
@@ -38,34 +111,17 @@ def test_attach_bare_terminal(monkeypatch):
     Expected:
         - os.execvp is called with "ssh" and the full SSH+tmux attach args.
     """
-    config = FleetConfig(
-        nodes=["local", "dev-server"],
-        default_node="local",
-        default_cmd="/bin/bash",
-    )
-    monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+    attach_env.use_config(CONFIG_WITH_DEV)
     monkeypatch.delenv("TMUX", raising=False)
 
-    async def fake_resolve(name, config):
-        """Return a remote node/session pair."""
-        return ("dev-server", "api")
-
-    monkeypatch.setattr("nx.cli.resolve_session", fake_resolve)
-
-    execvp_calls: list[tuple] = []
-
-    def fake_execvp(file, args):
-        """Record the execvp call instead of replacing the process."""
-        execvp_calls.append((file, args))
-
-    monkeypatch.setattr(os, "execvp", fake_execvp)
+    attach_env.resolve_to("dev-server", "api")
 
     result = runner.invoke(app, ["attach", "api"])
 
     assert result.exit_code == 0
-    assert len(execvp_calls) == 1
+    assert len(attach_env.execvp_calls) == 1
 
-    file, args = execvp_calls[0]
+    file, args = attach_env.execvp_calls[0]
     # Reason: Remote attach from bare terminal uses SSH to reach the node.
     assert file == "ssh"
     assert args == [
@@ -81,7 +137,7 @@ def test_attach_bare_terminal(monkeypatch):
     ]
 
 
-def test_attach_bare_terminal_local(monkeypatch):
+def test_attach_bare_terminal_local(monkeypatch, attach_env):
     """Bare terminal attaching to a local session replaces the process with tmux.
 
     Scenario:
@@ -90,36 +146,23 @@ def test_attach_bare_terminal_local(monkeypatch):
     Expected:
         - os.execvp is called with "tmux" and the local tmux attach args.
     """
-    config = FleetConfig(nodes=["local"], default_node="local", default_cmd="/bin/bash")
-    monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+    attach_env.use_config(CONFIG_LOCAL_ONLY)
     monkeypatch.delenv("TMUX", raising=False)
 
-    async def fake_resolve(name, config):
-        """Return a local node/session pair."""
-        return ("local", "api")
-
-    monkeypatch.setattr("nx.cli.resolve_session", fake_resolve)
-
-    execvp_calls: list[tuple] = []
-
-    def fake_execvp(file, args):
-        """Record the execvp call instead of replacing the process."""
-        execvp_calls.append((file, args))
-
-    monkeypatch.setattr(os, "execvp", fake_execvp)
+    attach_env.resolve_to("local", "api")
 
     result = runner.invoke(app, ["attach", "api"])
 
     assert result.exit_code == 0
-    assert len(execvp_calls) == 1
+    assert len(attach_env.execvp_calls) == 1
 
-    file, args = execvp_calls[0]
+    file, args = attach_env.execvp_calls[0]
     # Reason: Local attach from bare terminal uses tmux directly.
     assert file == "tmux"
     assert args == ["tmux", "-L", "nexus", "attach", "-t", "api"]
 
 
-def test_attach_from_nexus_local(monkeypatch):
+def test_attach_from_nexus_local(monkeypatch, attach_env):
     """Inside nexus tmux, local attach uses switch-client.
 
     Scenario:
@@ -129,33 +172,19 @@ def test_attach_from_nexus_local(monkeypatch):
         - subprocess.run is called with tmux switch-client args.
         - typer.Exit is raised (exit_code == 0).
     """
-    config = FleetConfig(nodes=["local"], default_node="local", default_cmd="/bin/bash")
-    monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+    attach_env.use_config(CONFIG_LOCAL_ONLY)
     monkeypatch.setenv("TMUX", "/tmp/tmux-1000/nexus,12345,0")
 
-    async def fake_resolve(name, config):
-        """Return a local node/session pair."""
-        return ("local", "api")
-
-    monkeypatch.setattr("nx.cli.resolve_session", fake_resolve)
-
-    captured_runs: list[tuple] = []
-
-    def fake_subprocess_run(*args, **kwargs):
-        """Record subprocess.run call and return success."""
-        captured_runs.append(args)
-        return subprocess_mod.CompletedProcess(args=args[0], returncode=0)
-
-    monkeypatch.setattr("nx.cli.subprocess.run", fake_subprocess_run)
+    attach_env.resolve_to("local", "api")
 
     result = runner.invoke(app, ["attach", "api"])
 
     assert result.exit_code == 0
-    assert len(captured_runs) == 1
+    assert len(attach_env.run_calls) == 1
 
     # Reason: Inside nexus tmux, local attach uses switch-client to stay
     # within the same nexus tmux server.
-    assert captured_runs[0][0] == [
+    assert attach_env.run_calls[0][0] == [
         "tmux",
         "-L",
         "nexus",
@@ -165,7 +194,7 @@ def test_attach_from_nexus_local(monkeypatch):
     ]
 
 
-def test_attach_from_nexus_remote(monkeypatch):
+def test_attach_from_nexus_remote(monkeypatch, attach_env):
     """Inside nexus tmux, remote attach opens a new window with SSH.
 
     Scenario:
@@ -175,37 +204,19 @@ def test_attach_from_nexus_remote(monkeypatch):
         - subprocess.run is called with tmux new-window + SSH attach args.
         - typer.Exit is raised (exit_code == 0).
     """
-    config = FleetConfig(
-        nodes=["local", "dev-server"],
-        default_node="local",
-        default_cmd="/bin/bash",
-    )
-    monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+    attach_env.use_config(CONFIG_WITH_DEV)
     monkeypatch.setenv("TMUX", "/tmp/tmux-1000/nexus,12345,0")
 
-    async def fake_resolve(name, config):
-        """Return a remote node/session pair."""
-        return ("dev-server", "api")
-
-    monkeypatch.setattr("nx.cli.resolve_session", fake_resolve)
-
-    captured_runs: list[tuple] = []
-
-    def fake_subprocess_run(*args, **kwargs):
-        """Record subprocess.run call and return success."""
-        captured_runs.append(args)
-        return subprocess_mod.CompletedProcess(args=args[0], returncode=0)
-
-    monkeypatch.setattr("nx.cli.subprocess.run", fake_subprocess_run)
+    attach_env.resolve_to("dev-server", "api")
 
     result = runner.invoke(app, ["attach", "api"])
 
     assert result.exit_code == 0
-    assert len(captured_runs) == 1
+    assert len(attach_env.run_calls) == 1
 
     # Reason: Inside nexus tmux, remote attach opens a new window that
     # SSHes to the remote node and attaches to the nexus session there.
-    assert captured_runs[0][0] == [
+    assert attach_env.run_calls[0][0] == [
         "tmux",
         "-L",
         "nexus",
@@ -224,7 +235,7 @@ def test_attach_from_nexus_remote(monkeypatch):
     ]
 
 
-def test_attach_from_user_tmux(monkeypatch):
+def test_attach_from_user_tmux(monkeypatch, attach_env):
     """Inside user's personal tmux, remote attach opens a nested window.
 
     Scenario:
@@ -234,37 +245,19 @@ def test_attach_from_user_tmux(monkeypatch):
         - subprocess.run is called with tmux new-window + SSH + nexus attach.
         - typer.Exit is raised (exit_code == 0).
     """
-    config = FleetConfig(
-        nodes=["local", "dev-server"],
-        default_node="local",
-        default_cmd="/bin/bash",
-    )
-    monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+    attach_env.use_config(CONFIG_WITH_DEV)
     monkeypatch.setenv("TMUX", "/tmp/tmux-1000/default,12345,0")
 
-    async def fake_resolve(name, config):
-        """Return a remote node/session pair."""
-        return ("dev-server", "api")
-
-    monkeypatch.setattr("nx.cli.resolve_session", fake_resolve)
-
-    captured_runs: list[tuple] = []
-
-    def fake_subprocess_run(*args, **kwargs):
-        """Record subprocess.run call and return success."""
-        captured_runs.append(args)
-        return subprocess_mod.CompletedProcess(args=args[0], returncode=0)
-
-    monkeypatch.setattr("nx.cli.subprocess.run", fake_subprocess_run)
+    attach_env.resolve_to("dev-server", "api")
 
     result = runner.invoke(app, ["attach", "api"])
 
     assert result.exit_code == 0
-    assert len(captured_runs) == 1
+    assert len(attach_env.run_calls) == 1
 
     # Reason: Inside user's personal tmux (no "nexus"), a new window is
     # opened in the user's tmux that nests into the nexus session via SSH.
-    assert captured_runs[0][0] == [
+    assert attach_env.run_calls[0][0] == [
         "tmux",
         "new-window",
         "-n",
@@ -281,7 +274,7 @@ def test_attach_from_user_tmux(monkeypatch):
     ]
 
 
-def test_attach_uses_resolution(monkeypatch):
+def test_attach_uses_resolution(monkeypatch, attach_env):
     """Fully qualified name bypasses fan-out and uses resolved node/session.
 
     Scenario:
@@ -293,12 +286,7 @@ def test_attach_uses_resolution(monkeypatch):
         - os.execvp is called with "tmux" and local attach args.
         - The command uses "local" as node and "api" as session.
     """
-    config = FleetConfig(
-        nodes=["local", "dev-server"],
-        default_node="local",
-        default_cmd="/bin/bash",
-    )
-    monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+    attach_env.use_config(CONFIG_WITH_DEV)
     monkeypatch.delenv("TMUX", raising=False)
 
     # Reason: We use the real resolve_session here to verify that fully
@@ -307,20 +295,12 @@ def test_attach_uses_resolution(monkeypatch):
     # (no network calls needed), so no additional mocking is required.
     # We keep the real resolve_session — no monkeypatch for it.
 
-    execvp_calls: list[tuple] = []
-
-    def fake_execvp(file, args):
-        """Record the execvp call instead of replacing the process."""
-        execvp_calls.append((file, args))
-
-    monkeypatch.setattr(os, "execvp", fake_execvp)
-
     result = runner.invoke(app, ["attach", "local/api"])
 
     assert result.exit_code == 0
-    assert len(execvp_calls) == 1
+    assert len(attach_env.execvp_calls) == 1
 
-    file, args = execvp_calls[0]
+    file, args = attach_env.execvp_calls[0]
     # Reason: "local/api" resolves to node="local", session="api",
     # so local tmux attach is used (no SSH).
     assert file == "tmux"
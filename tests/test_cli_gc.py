@@ -5,7 +5,7 @@ Covers Milestone 9: `nx gc` — Garbage Collection.
 Tests mock asyncio.create_subprocess_exec to control what fan_out and
 run_on_node return. The gc command fans out a list-sessions query to all
 nodes, filters for exited (is_dead=True) sessions, optionally confirms
-with the user, and kills each exited session.
+with the user, and kills the exited sessions concurrently.
 
 Unlike send/kill tests that mock resolve_session, gc uses fan_out directly,
 so the subprocess mock must handle both list-sessions and kill-session calls.
@@ -80,7 +80,8 @@ def _make_fake_exec_for_gc(
 
     The gc command issues two kinds of subprocess calls:
     1. list-sessions (via fan_out) — returns pipe-delimited session info.
-    2. kill-session (for each exited session) — returns empty success.
+    2. kill-session (one batch per node) — returns empty success, i.e. no
+       session names reported as failed.
 
     This factory returns different FakeProcess results depending on whether
     the command contains "list-sessions" (list call) or not (kill call).
@@ -102,7 +103,7 @@ def _make_fake_exec_for_gc(
 
         # Determine if this is a list-sessions call by checking the args.
         # For local: args = ("tmux", "-L", "nexus", "list-sessions", ...)
-        # For remote: args = ("ssh", "-o", "ConnectTimeout=2", "<node>", "tmux -L nexus list-sessions ...")
+        # For remote: args = ("ssh", "-o", "ConnectTimeout=2", ..., "<node>", "tmux -L nexus list-sessions ...")
         is_list = any("list-sessions" in str(a) for a in args)
 
         if is_list:
@@ -111,8 +112,8 @@ def _make_fake_exec_for_gc(
                 # Local call
                 output = node_list_outputs.get("local", b"")
             else:
-                # SSH call — node name is args[3] (after ssh, -o, ConnectTimeout=2)
-                node_name = args[3]
+                # SSH call — node name precedes the joined remote command.
+                node_name = args[-2]
                 output = node_list_outputs.get(node_name, b"")
             return FakeProcess(stdout=output, returncode=0)
         else:
@@ -151,8 +152,8 @@ def test_gc_fleet_wide(monkeypatch):
 
     calls: list[tuple] = []
     node_outputs = {
-        "local": b"old-api|1|0|/home/u|bash|1234|1|0\n",
-        "dev-server": b"crashed|1|0|/app|python|5678|1|1\n",
+        "local": b"old-api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f1\x1f0\n",
+        "dev-server": b"crashed\x1f1\x1f0\x1f/app\x1fpython\x1f5678\x1f1\x1f1\n",
     }
     monkeypatch.setattr(
         asyncio,
@@ -195,7 +196,7 @@ def test_gc_by_name(monkeypatch):
     calls: list[tuple] = []
     node_outputs = {
         "local": (
-            b"old-api|1|0|/home/u|bash|1234|1|0\ncrashed|1|0|/app|python|5678|1|1\n"
+            b"old-api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f1\x1f0\ncrashed\x1f1\x1f0\x1f/app\x1fpython\x1f5678\x1f1\x1f1\n"
         ),
     }
     monkeypatch.setattr(
@@ -213,6 +214,7 @@ def test_gc_by_name(monkeypatch):
     # Reason: Only one kill-session call should be made (for old-api only).
     kill_calls = [c for c in calls if any("kill-session" in str(a) for a in c)]
     assert len(kill_calls) == 1
+    assert "crashed" not in kill_calls[0][-1]
 
 
 def test_gc_running_session_skipped(monkeypatch):
@@ -235,7 +237,7 @@ def test_gc_running_session_skipped(monkeypatch):
 
     calls: list[tuple] = []
     node_outputs = {
-        "local": b"api|1|0|/home/u|bash|1234|0|\n",
+        "local": b"api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f0\x1f\n",
     }
     monkeypatch.setattr(
         asyncio,
@@ -270,7 +272,7 @@ def test_gc_dry_run(monkeypatch):
 
     calls: list[tuple] = []
     node_outputs = {
-        "local": b"old-api|1|0|/home/u|bash|1234|1|0\n",
+        "local": b"old-api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f1\x1f0\n",
     }
     monkeypatch.setattr(
         asyncio,
@@ -313,7 +315,7 @@ def test_gc_interactive_confirmation(monkeypatch):
 
     calls: list[tuple] = []
     node_outputs = {
-        "local": b"old-api|1|0|/home/u|bash|1234|1|0\n",
+        "local": b"old-api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f1\x1f0\n",
     }
     monkeypatch.setattr(
         asyncio,
@@ -362,7 +364,7 @@ def test_gc_piped_no_confirmation(monkeypatch):
 
     calls: list[tuple] = []
     node_outputs = {
-        "local": b"old-api|1|0|/home/u|bash|1234|1|0\n",
+        "local": b"old-api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f1\x1f0\n",
     }
     monkeypatch.setattr(
         asyncio,
@@ -385,3 +387,82 @@ def test_gc_piped_no_confirmation(monkeypatch):
     assert "Reaped" in result.output
     # Reason: Piped mode must NOT prompt the user.
     assert len(confirm_called) == 0
+
+
+def test_gc_reports_failed_kill(monkeypatch):
+    """A kill that fails is reported instead of claimed as reaped.
+
+    Scenario:
+        - Config: nodes=["local"].
+        - local returns one exited session (old-api); its kill-session fails.
+        - Invoke: ["gc"] with piped stdin.
+    Expected:
+        - exit_code == 1
+        - Output contains "Error reaping local/old-api" and not "Reaped".
+    """
+    config = FleetConfig(
+        nodes=["local"],
+        default_node="local",
+        default_cmd="/bin/bash",
+    )
+    monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+    monkeypatch.setattr("nx.cli.sys", _FakeSys(tty=False))
+
+    async def fake_exec(*args, **kwargs):
+        """List succeeds; kill fails."""
+        if "list-sessions" in args:
+            return FakeProcess(
+                stdout=b"old-api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f1\x1f0\n"
+            )
+        return FakeProcess(stderr=b"can't find session: old-api", returncode=1)
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+
+    result = runner.invoke(app, ["gc"])
+
+    assert result.exit_code == 1
+    assert "Error reaping local/old-api" in result.output
+    assert "Reaped" not in result.output
+
+
+def test_gc_batches_kills_per_node(monkeypatch):
+    """Several exited sessions on one node are reaped with a single command.
+
+    Scenario:
+        - Config: nodes=["local"].
+        - local returns two exited sessions: old-api and crashed.
+        - Invoke: ["gc"] with piped stdin.
+    Expected:
+        - exit_code == 0, both sessions reported as reaped.
+        - Exactly one kill call, naming both sessions.
+    """
+    config = FleetConfig(
+        nodes=["local"],
+        default_node="local",
+        default_cmd="/bin/bash",
+    )
+    monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+    monkeypatch.setattr("nx.cli.sys", _FakeSys(tty=False))
+
+    calls: list[tuple] = []
+    node_outputs = {
+        "local": (
+            b"old-api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f1\x1f0\ncrashed\x1f1\x1f0\x1f/app\x1fpython\x1f5678\x1f1\x1f1\n"
+        ),
+    }
+    monkeypatch.setattr(
+        asyncio,
+        "create_subprocess_exec",
+        _make_fake_exec_for_gc(calls, node_outputs),
+    )
+
+    result = runner.invoke(app, ["gc"])
+
+    assert result.exit_code == 0
+    assert "Reaped local/old-api" in result.output
+    assert "Reaped local/crashed" in result.output
+
+    kill_calls = [c for c in calls if any("kill-session" in str(a) for a in c)]
+    assert len(kill_calls) == 1
+    assert "old-api" in kill_calls[0][-1]
+    assert "crashed" in kill_calls[0][-1]
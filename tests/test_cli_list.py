@@ -9,6 +9,8 @@ a controlled FleetConfig.
 """
 
 import asyncio
+import sys
+from types import SimpleNamespace
 
 from typer.testing import CliRunner
 
@@ -42,6 +44,31 @@ class FakeProcess:
         return self.stdout, self.stderr
 
 
+class _FakeSys:
+    """Proxy for the sys module with a controllable stdout.isatty().
+
+    The CliRunner replaces sys.stdout during invoke(), so stdout is never a
+    terminal there. We replace the sys reference in nx.cli with this proxy
+    to exercise the Rich table path; all other attributes are forwarded to
+    the real sys module.
+
+    Args:
+        tty: Whether stdout.isatty() should return True.
+    """
+
+    def __init__(self, tty: bool = True):
+        self._tty = tty
+
+    @property
+    def stdout(self):
+        """Return a namespace whose isatty() returns the configured value."""
+        return SimpleNamespace(isatty=lambda: self._tty)
+
+    def __getattr__(self, name):
+        """Forward all other attribute access to the real sys module."""
+        return getattr(sys, name)
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -76,16 +103,16 @@ def test_list_single_node(monkeypatch):
 
     Scenario:
         - Single node "local" with two sessions: api (python) and worker (celery).
+        - stdout is a terminal.
     Expected:
         - Exit code 0.
         - Output contains session names, commands, and [RUNNING] status.
     """
     config = FleetConfig(nodes=["local"], default_node="local", default_cmd="/bin/bash")
     monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+    monkeypatch.setattr("nx.cli.sys", _FakeSys(tty=True))
 
-    tmux_output = (
-        b"api|1|0|/home/u/app|python|1234|0|\nworker|2|0|/home/u/app|celery|5678|0|\n"
-    )
+    tmux_output = b"api\x1f1\x1f0\x1f/home/u/app\x1fpython\x1f1234\x1f0\x1f\nworker\x1f2\x1f0\x1f/home/u/app\x1fcelery\x1f5678\x1f0\x1f\n"
 
     async def fake_exec(*args, **kwargs):
         """Return two sessions for local node."""
@@ -132,17 +159,17 @@ def test_list_multi_node(monkeypatch):
         if args[0] == "tmux":
             # Local node
             return FakeProcess(
-                stdout=b"web|1|0|/home/u/web|node|1001|0|\n",
+                stdout=b"web\x1f1\x1f0\x1f/home/u/web\x1fnode\x1f1001\x1f0\x1f\n",
                 returncode=0,
             )
         elif "dev-server" in args:
             return FakeProcess(
-                stdout=b"api|1|0|/home/u/api|python|2001|0|\n",
+                stdout=b"api\x1f1\x1f0\x1f/home/u/api\x1fpython\x1f2001\x1f0\x1f\n",
                 returncode=0,
             )
         elif "gpu-rig" in args:
             return FakeProcess(
-                stdout=b"train|1|0|/home/u/ml|python|3001|0|\n",
+                stdout=b"train\x1f1\x1f0\x1f/home/u/ml\x1fpython\x1f3001\x1f0\x1f\n",
                 returncode=0,
             )
         # Fallback
@@ -186,7 +213,7 @@ def test_list_unreachable_node(monkeypatch):
         if args[0] == "tmux":
             # Local node — one running session
             return FakeProcess(
-                stdout=b"api|1|0|/home/u/app|python|1234|0|\n",
+                stdout=b"api\x1f1\x1f0\x1f/home/u/app\x1fpython\x1f1234\x1f0\x1f\n",
                 returncode=0,
             )
         else:
@@ -225,9 +252,9 @@ def test_list_shows_status(monkeypatch):
     monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
 
     tmux_output = (
-        b"running|1|0|/home/u|bash|1234|0|\n"
-        b"exited_ok|1|0|/home/u|python|2345|1|0\n"
-        b"exited_bad|1|0|/home/u|node|3456|1|1\n"
+        b"running\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f0\x1f\n"
+        b"exited_ok\x1f1\x1f0\x1f/home/u\x1fpython\x1f2345\x1f1\x1f0\n"
+        b"exited_bad\x1f1\x1f0\x1f/home/u\x1fnode\x1f3456\x1f1\x1f1\n"
     )
 
     async def fake_exec(*args, **kwargs):
@@ -246,3 +273,42 @@ def test_list_shows_status(monkeypatch):
     assert "running" in result.output
     assert "exited_ok" in result.output
     assert "exited_bad" in result.output
+
+
+def test_list_piped_prints_tsv(monkeypatch):
+    """Piped output is plain tab-separated rows without a table header.
+
+    Scenario:
+        - Two nodes: local (one session) and bad-node (unreachable).
+        - stdout is not a terminal.
+    Expected:
+        - Exit code 0.
+        - One tab-separated line per session and per unreachable node.
+        - No Rich table header or box-drawing characters.
+    """
+    config = FleetConfig(
+        nodes=["local", "bad-node"],
+        default_node="local",
+        default_cmd="/bin/bash",
+    )
+    monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+    monkeypatch.setattr("nx.cli.sys", _FakeSys(tty=False))
+
+    async def fake_exec(*args, **kwargs):
+        """Return one session for local, connection failure for bad-node."""
+        if args[0] == "tmux":
+            return FakeProcess(
+                stdout=b"api\x1f1\x1f0\x1f/home/u/app\x1fpython\x1f1234\x1f0\x1f\n",
+                returncode=0,
+            )
+        return FakeProcess(stderr=b"Connection refused", returncode=255)
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+
+    result = runner.invoke(app, ["list"])
+
+    assert result.exit_code == 0
+    assert result.output.splitlines() == [
+        "local\tapi\t/home/u/app\tpython\t[RUNNING]",
+        "bad-node\t\t\t\t[UNREACHABLE]",
+    ]
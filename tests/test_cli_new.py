@@ -282,6 +282,28 @@ def test_new_default_cmd(monkeypatch):
     assert "/usr/bin/zsh" in args
 
 
+def test_new_cmd_args_passed_verbatim(monkeypatch):
+    """Command arguments containing spaces reach tmux as single argv entries.
+
+    Scenario:
+        - Invoke: ["new", "-D", "api", "--", "python", "-c", "print('a b')"]
+    Expected:
+        - Exec args end with "python", "-c", "print('a b')" unsplit.
+    """
+    config = FleetConfig(nodes=["local"], default_node="local", default_cmd="/bin/bash")
+    monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+
+    calls: list[tuple] = []
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", _make_fake_exec(calls))
+
+    result = runner.invoke(
+        app, ["new", "-D", "api", "--", "python", "-c", "print('a b')"]
+    )
+
+    assert result.exit_code == 0
+    assert list(calls[0][-3:]) == ["python", "-c", "print('a b')"]
+
+
 def test_new_duplicate_name(monkeypatch):
     """Duplicate session name returns a user-friendly error.
 
@@ -326,7 +348,7 @@ def test_new_auto_name(monkeypatch):
     """
     config = FleetConfig(nodes=["local"], default_node="local", default_cmd="/bin/bash")
     monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
-    monkeypatch.setattr("nx.cli.generate_slug", lambda n: "brave-penguin")
+    monkeypatch.setattr("coolname.generate_slug", lambda n: "brave-penguin")
 
     calls: list[tuple] = []
     monkeypatch.setattr(asyncio, "create_subprocess_exec", _make_fake_exec(calls))
@@ -371,7 +393,7 @@ def test_new_fzf_node_picker(monkeypatch):
         if cmd[0] == "fzf":
             fzf_calls.append((cmd, kwargs))
             return subprocess.CompletedProcess(
-                args=cmd, returncode=0, stdout="dev-server\n", stderr=""
+                args=cmd, returncode=0, stdout=b"dev-server\n", stderr=None
             )
         return real_subprocess_run(cmd, **kwargs)
 
@@ -392,7 +414,7 @@ def test_new_fzf_node_picker(monkeypatch):
     assert fzf_cmd == ["fzf", "--prompt", "Select node: "]
 
     # Verify default_node "local" appears first in the fzf input.
-    fzf_input = fzf_kwargs["input"]
+    fzf_input = fzf_kwargs["input"].decode()
     lines = fzf_input.strip().split("\n")
     assert lines[0] == "local"
 
@@ -420,7 +442,7 @@ def test_new_on_flag_triggers_picker(monkeypatch):
         default_cmd="/bin/bash",
     )
     monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
-    monkeypatch.setattr("nx.cli.generate_slug", lambda n: "brave-penguin")
+    monkeypatch.setattr("coolname.generate_slug", lambda n: "brave-penguin")
 
     fzf_calls: list[tuple] = []
     real_subprocess_run = subprocess.run
@@ -430,7 +452,7 @@ def test_new_on_flag_triggers_picker(monkeypatch):
         if cmd[0] == "fzf":
             fzf_calls.append((cmd, kwargs))
             return subprocess.CompletedProcess(
-                args=cmd, returncode=0, stdout="dev-server\n", stderr=""
+                args=cmd, returncode=0, stdout=b"dev-server\n", stderr=None
             )
         return real_subprocess_run(cmd, **kwargs)
 
@@ -586,3 +608,86 @@ def test_new_detach_skips_attach(monkeypatch):
     assert result.exit_code == 0
     assert "Created session local/api" in result.output
     assert len(execvp_calls) == 0
+
+
+def test_new_on_glob_creates_on_all_matches(monkeypatch):
+    """--on with a glob creates the session on every matching node, detached.
+
+    Scenario:
+        - Config: nodes=["local", "gpu-1", "gpu-2", "dev-server"]
+        - Invoke: ["new", "--on", "gpu-*", "train"]
+    Expected:
+        - One SSH new-session call per matching node, none for others.
+        - Output contains "Created session gpu-1/train" and "gpu-2/train".
+        - os.execvp is NOT called (no auto-attach for multiple targets).
+    """
+    config = FleetConfig(
+        nodes=["local", "gpu-1", "gpu-2", "dev-server"],
+        default_node="local",
+        default_cmd="/bin/bash",
+    )
+    monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+
+    calls: list[tuple] = []
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", _make_fake_exec(calls))
+
+    execvp_calls: list[tuple] = []
+    monkeypatch.setattr(os, "execvp", lambda f, a: execvp_calls.append((f, a)))
+
+    result = runner.invoke(app, ["new", "--on", "gpu-*", "train"])
+
+    assert result.exit_code == 0
+    assert "Created session gpu-1/train" in result.output
+    assert "Created session gpu-2/train" in result.output
+
+    targets = sorted(args[-2] for args in calls)
+    assert targets == ["gpu-1", "gpu-2"]
+    assert len(execvp_calls) == 0
+
+
+def test_new_on_comma_list_reports_failures(monkeypatch):
+    """--on with a comma list reports per-node errors and exits non-zero.
+
+    Scenario:
+        - Config: nodes=["local", "dev-server", "gpu-rig"]
+        - gpu-rig already has a session named "api".
+        - Invoke: ["new", "--on", "dev-server,gpu-rig", "api"]
+    Expected:
+        - exit_code == 1
+        - dev-server succeeds; gpu-rig reports the duplicate.
+    """
+    config = FleetConfig(
+        nodes=["local", "dev-server", "gpu-rig"],
+        default_node="local",
+        default_cmd="/bin/bash",
+    )
+    monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+
+    async def fake_exec(*args, **kwargs):
+        """Fail with a duplicate-session error on gpu-rig only."""
+        if "gpu-rig" in args:
+            return FakeProcess(stderr=b"duplicate session: api", returncode=1)
+        return FakeProcess(returncode=0)
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+
+    result = runner.invoke(app, ["new", "--on", "dev-server,gpu-rig", "api"])
+
+    assert result.exit_code == 1
+    assert "Created session dev-server/api" in result.output
+    assert "already exists on gpu-rig" in result.output
+
+
+def test_new_on_glob_no_match(monkeypatch):
+    """--on with a glob matching no fleet node errors out without running tmux."""
+    config = FleetConfig(nodes=["local"], default_node="local", default_cmd="/bin/bash")
+    monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+
+    calls: list[tuple] = []
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", _make_fake_exec(calls))
+
+    result = runner.invoke(app, ["new", "--on", "gpu-*", "train"])
+
+    assert result.exit_code == 1
+    assert "No fleet nodes match" in result.output
+    assert calls == []
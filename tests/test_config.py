@@ -1,11 +1,17 @@
 """Tests for FleetConfig loading, validation, and env-var expansion (Milestone 1)."""
 
+import asyncio
+import os
+import stat
+import sys
+import tomllib
+import types
 from pathlib import Path
 
 import pytest
 from pydantic import ValidationError
 
-from nx.config import load_config
+from nx.config import FleetConfig, load_config, save_config
 
 
 def test_load_valid_config(tmp_path: Path) -> None:
@@ -28,7 +34,7 @@ def test_load_valid_config(tmp_path: Path) -> None:
 
     config = load_config(config_file)
 
-    assert config.nodes == ["local", "dev-server", "gpu-rig"]
+    assert config.nodes == ("local", "dev-server", "gpu-rig")
     assert config.default_node == "dev-server"
     assert config.default_cmd == "/usr/bin/zsh"
     assert config.max_concurrent_ssh == 8
@@ -63,26 +69,89 @@ def test_missing_config_uses_defaults() -> None:
     """Calling load_config with a nonexistent path returns all defaults.
 
     Asserts:
-        nodes defaults to ["local"].
+        nodes defaults to ("local",).
         default_node defaults to "local".
         default_cmd defaults to "$SHELL" (literal; pydantic v2 field_validator
         with mode='before' does not fire for field defaults -- expansion only
         happens when a value is explicitly supplied via TOML or constructor kwargs).
         max_concurrent_ssh defaults to 16.
+        ssh_timeout defaults to 10.0.
+        fleet_timeout defaults to 60.0.
+        use_uvloop defaults to True.
         auto_reap_clean_exit defaults to True.
     """
     config = load_config(Path("/nonexistent/path/fleet.toml"))
 
-    assert config.nodes == ["local"]
+    assert config.nodes == ("local",)
     assert config.default_node == "local"
     # Reason: pydantic v2 field_validator(mode="before") only triggers on
     # values explicitly passed to the model, not on field defaults. So when
     # no config file exists, FleetConfig() keeps the literal "$SHELL".
     assert config.default_cmd == "$SHELL"
     assert config.max_concurrent_ssh == 16
+    assert config.ssh_timeout == 10.0
+    assert config.fleet_timeout == 60.0
+    assert config.use_uvloop is True
     assert config.auto_reap_clean_exit is True
 
 
+def test_use_uvloop_false_keeps_default_loop() -> None:
+    """With use_uvloop off, the shared runner builds asyncio's default loop.
+
+    Asserts:
+        _loop_factory returns None.
+        A Runner given that factory runs on the stdlib event loop class.
+    """
+    from nx.cli import _loop_factory
+
+    factory = _loop_factory(False)
+
+    assert factory is None
+    with asyncio.Runner(loop_factory=factory) as runner:
+        default_loop = asyncio.new_event_loop()
+        try:
+            assert type(runner.get_loop()) is type(default_loop)
+        finally:
+            default_loop.close()
+
+
+def test_use_uvloop_without_package_falls_back(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A missing uvloop leaves the default loop in place instead of failing.
+
+    Args:
+        monkeypatch: pytest fixture; a None entry in sys.modules makes
+            ``import uvloop`` raise ImportError.
+
+    Asserts:
+        _loop_factory returns None.
+    """
+    from nx.cli import _loop_factory
+
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    assert _loop_factory(True) is None
+
+
+def test_use_uvloop_returns_uvloop_factory(monkeypatch: pytest.MonkeyPatch) -> None:
+    """When uvloop is importable, its new_event_loop becomes the loop factory.
+
+    Args:
+        monkeypatch: pytest fixture used to install a stand-in uvloop module.
+
+    Asserts:
+        _loop_factory returns uvloop.new_event_loop.
+    """
+    from nx.cli import _loop_factory
+
+    fake_uvloop = types.ModuleType("uvloop")
+    fake_uvloop.new_event_loop = asyncio.new_event_loop
+    monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+
+    assert _loop_factory(True) is asyncio.new_event_loop
+
+
 def test_invalid_config_raises(tmp_path: Path) -> None:
     """A TOML file with wrong types raises pydantic ValidationError.
 
@@ -120,3 +189,175 @@ def test_local_always_in_nodes(tmp_path: Path) -> None:
     # Reason: Ensure the user-specified nodes are preserved after "local".
     assert "dev-server" in config.nodes
     assert "gpu-rig" in config.nodes
+
+
+def test_load_config_memoized_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    """Repeat loads of an unchanged file reuse the parse; edits are picked up.
+
+    Args:
+        tmp_path: pytest built-in fixture for a temporary directory.
+        monkeypatch: pytest fixture for patching tomllib.load.
+
+    Asserts:
+        The TOML file is parsed once for two loads of the same version.
+        Both loads return the same frozen instance, which rejects assignment.
+        Rewriting the file triggers a fresh parse with the new values.
+    """
+    config_file = tmp_path / "fleet.toml"
+    config_file.write_text('nodes = ["local", "dev-server"]\n')
+
+    parses: list[Path] = []
+    real_load = tomllib.load
+
+    def counting_load(f):
+        parses.append(Path(f.name))
+        return real_load(f)
+
+    monkeypatch.setattr(tomllib, "load", counting_load)
+
+    first = load_config(config_file)
+    second = load_config(config_file)
+
+    assert len(parses) == 1
+    assert second is first
+    with pytest.raises(ValidationError):
+        first.default_node = "dev-server"
+
+    config_file.write_text('nodes = ["local", "gpu-rig", "dev-server"]\n')
+    third = load_config(config_file)
+
+    assert len(parses) == 2
+    assert third.nodes == ("local", "gpu-rig", "dev-server")
+
+
+def test_load_config_from_marshalled_json(tmp_path: Path, monkeypatch) -> None:
+    """NX_CONFIG_JSON from a parent nx process replaces the default file read.
+
+    Args:
+        tmp_path: pytest built-in fixture for a temporary directory.
+        monkeypatch: pytest fixture for setting the env var and config path.
+
+    Asserts:
+        With no path, the marshalled config is used and the file is ignored.
+        An explicit path still reads the file.
+    """
+    config_file = tmp_path / "fleet.toml"
+    config_file.write_text('nodes = ["local", "dev-server"]\n')
+    monkeypatch.setattr("nx.config.DEFAULT_CONFIG_PATH", config_file)
+
+    marshalled = FleetConfig(
+        nodes=["local", "gpu-rig"], default_node="gpu-rig", default_cmd="/bin/zsh"
+    )
+    monkeypatch.setenv("NX_CONFIG_JSON", marshalled.model_dump_json())
+
+    config = load_config()
+
+    assert config == marshalled
+    assert load_config(config_file).nodes == ("local", "dev-server")
+
+
+def test_save_config_escapes_strings(tmp_path: Path) -> None:
+    """Strings with quotes and backslashes survive a save/load round trip.
+
+    Args:
+        tmp_path: pytest built-in fixture for a temporary directory.
+
+    Asserts:
+        The saved file parses, and default_cmd reads back unchanged.
+    """
+    config_file = tmp_path / "fleet.toml"
+    config = FleetConfig(
+        nodes=["local", "dev-server"],
+        default_cmd='bash -c "echo \\\\o/"',
+    )
+
+    save_config(config, config_file)
+
+    assert load_config(config_file).default_cmd == 'bash -c "echo \\\\o/"'
+
+
+def test_save_config_replaces_file(tmp_path: Path) -> None:
+    """save_config swaps in a complete new file and leaves no temp file behind.
+
+    Args:
+        tmp_path: pytest built-in fixture for a temporary directory.
+
+    Asserts:
+        The config path is a new file (different inode) holding the new
+        nodes, and it is the only file left in the directory.
+    """
+    config_file = tmp_path / "fleet.toml"
+    config_file.write_text('nodes = ["local", "dev-server"]\n')
+    old_inode = config_file.stat().st_ino
+
+    save_config(FleetConfig(nodes=["local", "gpu-rig"]), config_file)
+
+    assert config_file.stat().st_ino != old_inode
+    assert load_config(config_file).nodes == ("local", "gpu-rig")
+    assert list(tmp_path.iterdir()) == [config_file]
+
+
+def test_save_config_keeps_file_mode(tmp_path: Path) -> None:
+    """Replacing fleet.toml keeps the permissions of the file it replaces.
+
+    Args:
+        tmp_path: pytest built-in fixture for a temporary directory.
+
+    Asserts:
+        The rewritten file has the original 0644 mode, not mkstemp's 0600.
+    """
+    config_file = tmp_path / "fleet.toml"
+    config_file.write_text('nodes = ["local"]\n')
+    config_file.chmod(0o644)
+
+    save_config(FleetConfig(nodes=["local", "gpu-rig"]), config_file)
+
+    assert stat.S_IMODE(config_file.stat().st_mode) == 0o644
+
+
+def test_save_config_new_file_uses_umask_mode(tmp_path: Path) -> None:
+    """A fleet.toml created from scratch gets the umask default mode.
+
+    Args:
+        tmp_path: pytest built-in fixture for a temporary directory.
+
+    Asserts:
+        Under umask 022 the new file is 0644, not mkstemp's 0600.
+    """
+    config_file = tmp_path / "fleet.toml"
+
+    old_umask = os.umask(0o022)
+    try:
+        save_config(FleetConfig(nodes=["local"]), config_file)
+    finally:
+        os.umask(old_umask)
+
+    assert stat.S_IMODE(config_file.stat().st_mode) == 0o644
+
+
+def test_save_config_removes_temp_file_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed save leaves the old config untouched and no temp file behind.
+
+    Args:
+        tmp_path: pytest built-in fixture for a temporary directory.
+        monkeypatch: pytest fixture for making os.fsync fail.
+
+    Asserts:
+        The error propagates, fleet.toml keeps its old contents, and it is
+        the only file left in the directory.
+    """
+    config_file = tmp_path / "fleet.toml"
+    config_file.write_text('nodes = ["local", "dev-server"]\n')
+
+    def failing_fsync(fd: int) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr("nx.config.os.fsync", failing_fsync)
+
+    with pytest.raises(OSError, match="disk full"):
+        save_config(FleetConfig(nodes=["local", "gpu-rig"]), config_file)
+
+    assert config_file.read_text() == 'nodes = ["local", "dev-server"]\n'
+    assert list(tmp_path.iterdir()) == [config_file]
@@ -77,6 +77,31 @@ def make_subprocess_factory(tmux_output: bytes):
     return fake_exec, calls
 
 
+def split_tmux_commands(calls: list[tuple]) -> list[tuple]:
+    """Split recorded invocations into individual tmux commands.
+
+    The dashboard queues its tmux commands into one invocation separated
+    by ";" arguments; this undoes that so tests can look at each command.
+
+    Args:
+        calls: Recorded create_subprocess_exec argument tuples.
+
+    Returns:
+        list[tuple]: One argument tuple per tmux command.
+    """
+    commands: list[tuple] = []
+    for call in calls:
+        command: list = []
+        for arg in call:
+            if arg == ";":
+                commands.append(tuple(command))
+                command = []
+            else:
+                command.append(arg)
+        commands.append(tuple(command))
+    return commands
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -90,18 +115,19 @@ def test_dash_creates_temporary_session(monkeypatch):
     Expected:
         - Subprocess calls include `new-session -d -s dashboard` on the
           nx_dash socket.
-        - build_dashboard returns the execvp args for attaching.
+        - build_dashboard returns the execvp args for attaching and no error.
     """
     config = FleetConfig(nodes=["local"], default_node="local", default_cmd="/bin/bash")
 
-    tmux_output = b"api|1|0|/home/u|bash|1234|0|\n"
+    tmux_output = b"api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f0\x1f\n"
     fake_exec, calls = make_subprocess_factory(tmux_output)
     monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
 
-    result = asyncio.run(build_dashboard(config))
+    result, error = asyncio.run(build_dashboard(config))
 
     # Verify the return value is the execvp args for attaching.
     assert result == ["tmux", "-L", "nx_dash", "attach", "-t", "dashboard"]
+    assert error == ""
 
     # Verify that a new-session call was made on the nx_dash socket.
     new_session_calls = [
@@ -117,6 +143,118 @@ def test_dash_creates_temporary_session(monkeypatch):
     assert "-d" in ns_call
 
 
+def test_dash_single_tmux_invocation(monkeypatch):
+    """Dashboard setup runs as one tmux command sequence.
+
+    Scenario:
+        - Single node "local" with three running sessions, one of them
+          named "a;".
+    Expected:
+        - Besides list-sessions, exactly one subprocess is spawned, on the
+          nx_dash socket.
+        - Every split-window is followed by a tiled re-layout.
+        - The ";" in "a;" is escaped so tmux doesn't split on it.
+    """
+    config = FleetConfig(nodes=["local"], default_node="local", default_cmd="/bin/bash")
+
+    tmux_output = (
+        b"api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f0\x1f\n"
+        b"worker\x1f1\x1f0\x1f/home/u\x1fcelery\x1f5678\x1f0\x1f\n"
+        b"a;\x1f1\x1f0\x1f/home/u\x1fbash\x1f9012\x1f0\x1f\n"
+    )
+    fake_exec, calls = make_subprocess_factory(tmux_output)
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+
+    asyncio.run(build_dashboard(config))
+
+    setup_calls = [c for c in calls if "list-sessions" not in c]
+    assert len(setup_calls) == 1
+    assert setup_calls[0][:3] == ("tmux", "-L", "nx_dash")
+
+    commands = split_tmux_commands(setup_calls)
+    names = [c[0] for c in commands]
+    for i, name in enumerate(names):
+        if name == "split-window":
+            assert commands[i + 2] == ("select-layout", "-t", "dashboard", "tiled")
+
+    assert ("set-option", "-p", "@nx_target", "local/a\\;") in commands
+
+
+def test_dash_setup_precedes_splits(monkeypatch):
+    """Session-wide setup is queued before the first split-window.
+
+    Scenario:
+        - Single node "local" with two running sessions.
+    Expected:
+        - set-environment, the Enter binding, and the pane-border options all
+          come before the first split-window, so a split that runs out of
+          room cannot skip them.
+    """
+    config = FleetConfig(nodes=["local"], default_node="local", default_cmd="/bin/bash")
+
+    tmux_output = (
+        b"api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f0\x1f\n"
+        b"worker\x1f1\x1f0\x1f/home/u\x1fcelery\x1f5678\x1f0\x1f\n"
+    )
+    fake_exec, calls = make_subprocess_factory(tmux_output)
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+
+    asyncio.run(build_dashboard(config))
+
+    commands = split_tmux_commands([c for c in calls if "list-sessions" not in c])
+    first_split = next(i for i, c in enumerate(commands) if "split-window" in c)
+    setup = [
+        i
+        for i, c in enumerate(commands)
+        if "set-environment" in c
+        or ("bind-key" in c and "Enter" in c)
+        or "pane-border-format" in c
+    ]
+    assert len(setup) == 4
+    assert max(setup) < first_split
+
+
+def test_dash_reports_setup_error(monkeypatch):
+    """A failed tmux sequence is reported, and the dashboard is still attached.
+
+    Scenario:
+        - Single node "local" with two running sessions.
+        - The setup tmux call fails with "no space for new pane".
+    Expected:
+        - build_dashboard returns the attach args and tmux's error.
+        - `nx dash` prints a warning and still calls os.execvp.
+    """
+    config = FleetConfig(nodes=["local"], default_node="local", default_cmd="/bin/bash")
+    monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+
+    tmux_output = (
+        b"api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f0\x1f\n"
+        b"worker\x1f1\x1f0\x1f/home/u\x1fcelery\x1f5678\x1f0\x1f\n"
+    )
+
+    async def fake_exec(*args, **kwargs):
+        """List the sessions, then fail the setup like a full window would."""
+        if "list-sessions" in args:
+            return FakeProcess(stdout=tmux_output, returncode=0)
+        return FakeProcess(stderr=b"no space for new pane\n", returncode=1)
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+
+    result, error = asyncio.run(build_dashboard(config))
+
+    assert result == ["tmux", "-L", "nx_dash", "attach", "-t", "dashboard"]
+    assert error == "no space for new pane"
+
+    execvp_calls: list[tuple] = []
+    monkeypatch.setattr(os, "execvp", lambda file, args: execvp_calls.append(args))
+
+    cli_result = runner.invoke(app, ["dash"])
+
+    assert cli_result.exit_code == 0
+    assert "dashboard is incomplete: no space for new pane" in cli_result.output
+    assert execvp_calls == [result]
+
+
 def test_dash_pane_metadata(monkeypatch):
     """Each pane is tagged with @nx_target metadata.
 
@@ -128,14 +266,16 @@ def test_dash_pane_metadata(monkeypatch):
     """
     config = FleetConfig(nodes=["local"], default_node="local", default_cmd="/bin/bash")
 
-    tmux_output = b"api|1|0|/home/u|bash|1234|0|\nworker|1|0|/home/u|celery|5678|0|\n"
+    tmux_output = b"api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f0\x1f\nworker\x1f1\x1f0\x1f/home/u\x1fcelery\x1f5678\x1f0\x1f\n"
     fake_exec, calls = make_subprocess_factory(tmux_output)
     monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
 
     asyncio.run(build_dashboard(config))
 
-    # Collect all set-option calls that tag panes with @nx_target.
-    set_option_calls = [c for c in calls if "set-option" in c and "@nx_target" in c]
+    # Collect all set-option commands that tag panes with @nx_target.
+    set_option_calls = [
+        c for c in split_tmux_commands(calls) if "set-option" in c and "@nx_target" in c
+    ]
 
     # Reason: Two sessions means two set-option calls, one per pane.
     assert len(set_option_calls) == 2
@@ -159,10 +299,11 @@ def test_dash_stores_nx_bin(monkeypatch):
         - shutil.which("nx") returns "/usr/local/bin/nx".
     Expected:
         - Subprocess calls include `set-environment NX_BIN /usr/local/bin/nx`.
+        - The same call stores the config as NX_CONFIG_JSON.
     """
     config = FleetConfig(nodes=["local"], default_node="local", default_cmd="/bin/bash")
 
-    tmux_output = b"api|1|0|/home/u|bash|1234|0|\n"
+    tmux_output = b"api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f0\x1f\n"
     fake_exec, calls = make_subprocess_factory(tmux_output)
     monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
     monkeypatch.setattr("nx.dashboard.shutil.which", lambda name: "/usr/local/bin/nx")
@@ -178,6 +319,10 @@ def test_dash_stores_nx_bin(monkeypatch):
     idx = call.index("NX_BIN")
     assert call[idx + 1] == "/usr/local/bin/nx"
 
+    # Reason: The serialized config rides along so `nx attach` skips fleet.toml.
+    idx = call.index("NX_CONFIG_JSON")
+    assert FleetConfig.model_validate_json(call[idx + 1]) == config
+
 
 def test_dash_enter_binding(monkeypatch):
     """Enter key is bound to a shim that tears down the dashboard and attaches.
@@ -192,7 +337,7 @@ def test_dash_enter_binding(monkeypatch):
     """
     config = FleetConfig(nodes=["local"], default_node="local", default_cmd="/bin/bash")
 
-    tmux_output = b"api|1|0|/home/u|bash|1234|0|\n"
+    tmux_output = b"api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f0\x1f\n"
     fake_exec, calls = make_subprocess_factory(tmux_output)
     monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
 
@@ -231,20 +376,22 @@ def test_dash_read_only(monkeypatch):
     """
     config = FleetConfig(nodes=["local"], default_node="local", default_cmd="/bin/bash")
 
-    tmux_output = b"api|1|0|/home/u|bash|1234|0|\nworker|1|0|/home/u|celery|5678|0|\n"
+    tmux_output = b"api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f0\x1f\nworker\x1f1\x1f0\x1f/home/u\x1fcelery\x1f5678\x1f0\x1f\n"
     fake_exec, calls = make_subprocess_factory(tmux_output)
     monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
 
     asyncio.run(build_dashboard(config))
 
-    # Find the new-session call (initial pane) — it should contain -r.
-    new_session_calls = [c for c in calls if "new-session" in c]
+    commands = split_tmux_commands(calls)
+
+    # Find the new-session command (initial pane) — it should contain -r.
+    new_session_calls = [c for c in commands if "new-session" in c]
     assert len(new_session_calls) == 1
     # Reason: The initial pane's attach command must include -r for read-only.
     assert "-r" in new_session_calls[0]
 
     # Find the split-window calls (additional panes) — each should contain -r.
-    split_calls = [c for c in calls if "split-window" in c]
+    split_calls = [c for c in commands if "split-window" in c]
     assert len(split_calls) >= 1
     for sc in split_calls:
         # Reason: Every additional pane must also be read-only.
@@ -303,9 +450,9 @@ def test_dash_uses_execvp(monkeypatch):
     # Monkeypatch build_dashboard to return known args without subprocess calls.
     async def fake_build_dashboard(cfg):
         """Return the expected execvp args directly."""
-        return ["tmux", "-L", "nx_dash", "attach", "-t", "dashboard"]
+        return ["tmux", "-L", "nx_dash", "attach", "-t", "dashboard"], ""
 
-    monkeypatch.setattr("nx.cli.build_dashboard", fake_build_dashboard)
+    monkeypatch.setattr("nx.dashboard.build_dashboard", fake_build_dashboard)
 
     execvp_calls: list[tuple] = []
 
@@ -12,15 +12,15 @@ use pytest's tmp_path fixture.
 """
 
 import asyncio
-import hashlib
 import importlib.resources
+import os
 from pathlib import Path
 
 import pytest
 from typer.testing import CliRunner
 
 from nx.cli import app
-from nx.config import FleetConfig
+from nx.config import FleetConfig, load_config
 from nx.nodes import (
     SSH_CONFIG_TEMPLATE,
     discover_hosts,
@@ -57,14 +57,14 @@ class FakeProcess:
         return self.stdout, self.stderr
 
 
-def _canonical_tmux_conf_hash() -> str:
-    """Compute the MD5 hash of the canonical tmux.conf for test assertions.
+def _canonical_tmux_conf() -> bytes:
+    """Read the canonical tmux.conf for fake remote probe output.
 
     Returns:
-        str: Hex digest of the shipped tmux.conf.
+        bytes: Contents of the shipped tmux.conf.
     """
     ref = importlib.resources.files("nx.data").joinpath("tmux.conf")
-    return hashlib.md5(ref.read_bytes()).hexdigest()
+    return ref.read_bytes()
 
 
 def _make_fake_exec_for_nodes(
@@ -101,6 +101,78 @@ def _make_fake_exec_for_nodes(
     return fake_exec
 
 
+def _make_fake_remote(remote_home: Path, calls: list | None = None):
+    """Create a fake create_subprocess_exec backed by a local "remote" home.
+
+    ssh calls run their remote command string under sh with HOME pointed at
+    remote_home and a stub tmux reporting 3.2 on PATH, so whatever nodes_add
+    writes there is exactly what a later probe reads back. Local calls get
+    "tmux 3.4".
+
+    Args:
+        remote_home: Directory standing in for the remote user's home.
+        calls: Optional list to append captured positional args to.
+
+    Returns:
+        Async callable matching the asyncio.create_subprocess_exec signature.
+    """
+    stub_bin = remote_home / ".stub-bin"
+    stub_bin.mkdir(parents=True, exist_ok=True)
+    tmux_stub = stub_bin / "tmux"
+    tmux_stub.write_text("#!/bin/sh\necho 'tmux 3.2'\n")
+    tmux_stub.chmod(0o755)
+    env = {
+        **os.environ,
+        "HOME": str(remote_home),
+        "PATH": f"{stub_bin}{os.pathsep}{os.environ['PATH']}",
+    }
+    # Reason: Tests patch asyncio.create_subprocess_exec, possibly with
+    # another fake remote; the asyncio.subprocess name stays the real one.
+    real_exec = asyncio.subprocess.create_subprocess_exec
+
+    async def fake_exec(*args, **kwargs):
+        """Run ssh commands against the fake remote; answer local tmux -V."""
+        if calls is not None:
+            calls.append(args)
+        if args[0] != "ssh":
+            return FakeProcess(stdout=b"tmux 3.4\n")
+        return await real_exec("sh", "-c", args[-1], env=env, **kwargs)
+
+    return fake_exec
+
+
+def _add_node_to_fake_remote(monkeypatch, tmp_path: Path, host: str) -> Path:
+    """Run the real nodes_add push against a fake remote.
+
+    Args:
+        monkeypatch: pytest fixture used to patch subprocess creation and
+            Path.home().
+        tmp_path: Directory holding the fake local and remote homes.
+        host: Node name to add.
+
+    Returns:
+        Path: The remote home; the pushed file is .config/nexus/tmux.conf.
+    """
+    remote_home = tmp_path / "remote"
+    local_home = tmp_path / "local"
+    local_home.mkdir()
+    monkeypatch.setattr(Path, "home", staticmethod(lambda: local_home))
+    monkeypatch.setattr(
+        asyncio, "create_subprocess_exec", _make_fake_remote(remote_home)
+    )
+    config = FleetConfig(nodes=["local"])
+
+    asyncio.run(
+        nodes_add(
+            host,
+            config,
+            ssh_config_path=tmp_path / "nexus_config",
+            fleet_config_path=tmp_path / "fleet.toml",
+        )
+    )
+    return remote_home
+
+
 # ---------------------------------------------------------------------------
 # nodes_ls tests
 # ---------------------------------------------------------------------------
@@ -111,53 +183,21 @@ def test_nodes_ls(monkeypatch, tmp_path):
 
     Scenario:
         - Config: nodes=["local", "dev-server"].
-        - local tmux -V returns "tmux 3.4".
-        - dev-server tmux -V returns "tmux 3.2".
-        - dev-server md5sum returns a matching hash (no drift).
+        - dev-server was set up by nodes_add against a fake remote.
+        - local tmux -V returns "tmux 3.4"; the remote stub reports "tmux 3.2".
     Expected:
         - Two NodeStatus results, both reachable, no drift.
     """
+    remote_home = _add_node_to_fake_remote(monkeypatch, tmp_path, "dev-server")
     config = FleetConfig(
         nodes=["local", "dev-server"],
         default_node="local",
         default_cmd="/bin/bash",
     )
 
-    canonical_hash = _canonical_tmux_conf_hash()
-
     calls: list[tuple] = []
-    {
-        # Reason: local calls use "tmux" directly; remote calls use "ssh".
-        # The local tmux -V check.
-        "tmux -V": (b"tmux 3.4\n", b"", 0),
-        # The remote tmux -V check — goes via SSH so the command string
-        # includes the node name and the tmux command.
-        "ssh": (b"tmux 3.2\n", b"", 0),
-        # The remote md5sum call — also via SSH. Return matching hash.
-        "md5sum": (
-            f"{canonical_hash}  /home/u/.config/nexus/tmux.conf\n".encode(),
-            b"",
-            0,
-        ),
-    }
-
-    # Reason: We need more fine-grained control. When the joined args
-    # contain "ssh" AND "md5sum", we want the md5sum response. When
-    # it contains "ssh" AND "tmux -V", we want the tmux version.
-    # Rebuild with ordering that checks md5sum before generic ssh.
-    ordered_responses = {
-        "md5sum": (
-            f"{canonical_hash}  /home/u/.config/nexus/tmux.conf\n".encode(),
-            b"",
-            0,
-        ),
-        "tmux -V": (b"tmux 3.4\n", b"", 0),
-    }
-
     monkeypatch.setattr(
-        asyncio,
-        "create_subprocess_exec",
-        _make_fake_exec_for_nodes(calls, ordered_responses),
+        asyncio, "create_subprocess_exec", _make_fake_remote(remote_home, calls)
     )
 
     # Reason: nodes_ls calls _local_tmux_conf_hash() which reads the
@@ -174,6 +214,69 @@ def test_nodes_ls(monkeypatch, tmp_path):
     # Remote node.
     remote_status = next(s for s in statuses if s.node == "dev-server")
     assert remote_status.reachable is True
+    assert remote_status.tmux_version == "tmux 3.2"
+    assert remote_status.config_drift is False
+
+    # Reason: Version and config come from a single ssh round-trip.
+    assert len([c for c in calls if c[0] == "ssh"]) == 1
+
+
+def test_nodes_ls_detects_drift(monkeypatch, tmp_path):
+    """A remote tmux.conf edited after nodes_add pushed it is drift.
+
+    Scenario:
+        - Config: nodes=["local", "dev-server"].
+        - dev-server was set up by nodes_add, then its tmux.conf was edited.
+    Expected:
+        - dev-server is reachable with config_drift=True.
+    """
+    remote_home = _add_node_to_fake_remote(monkeypatch, tmp_path, "dev-server")
+    with open(remote_home / ".config" / "nexus" / "tmux.conf", "a") as f:
+        f.write("set -g mouse off\n")
+    config = FleetConfig(
+        nodes=["local", "dev-server"],
+        default_node="local",
+        default_cmd="/bin/bash",
+    )
+
+    statuses = asyncio.run(nodes_ls(config))
+
+    remote_status = next(s for s in statuses if s.node == "dev-server")
+    assert remote_status.reachable is True
+    assert remote_status.config_drift is True
+
+
+def test_nodes_ls_reports_each_status(monkeypatch):
+    """nodes_ls hands each status to on_status and returns them in config order.
+
+    Scenario:
+        - Config: nodes=["local", "dev-server", "gpu-rig"] with
+          max_concurrent_ssh=1, so remote checks run one at a time.
+    Expected:
+        - on_status is called once per node.
+        - The returned statuses follow config order.
+    """
+    config = FleetConfig(
+        nodes=["local", "dev-server", "gpu-rig"],
+        default_node="local",
+        default_cmd="/bin/bash",
+        max_concurrent_ssh=1,
+    )
+
+    responses = {"tmux.conf": (b"tmux 3.2\n", b"", 0)}
+    monkeypatch.setattr(
+        asyncio,
+        "create_subprocess_exec",
+        _make_fake_exec_for_nodes([], responses),
+    )
+
+    seen: list[str] = []
+    statuses = asyncio.run(
+        nodes_ls(config, on_status=lambda status: seen.append(status.node))
+    )
+
+    assert sorted(seen) == ["dev-server", "gpu-rig", "local"]
+    assert [s.node for s in statuses] == ["local", "dev-server", "gpu-rig"]
 
 
 def test_nodes_ls_unreachable(monkeypatch):
@@ -217,6 +320,37 @@ def test_nodes_ls_unreachable(monkeypatch):
     assert dead_status.tmux_version is None
 
 
+def test_nodes_ls_piped_prints_tsv(monkeypatch):
+    """`nx nodes ls` writes tab-separated rows when stdout is not a terminal.
+
+    Scenario:
+        - Config: nodes=["local", "dead-server"]; dead-server refuses SSH.
+        - CliRunner output is not a tty.
+    Expected:
+        - One TSV line per node, with unreachable nodes marked.
+    """
+    config = FleetConfig(
+        nodes=["local", "dead-server"],
+        default_node="local",
+        default_cmd="/bin/bash",
+    )
+    monkeypatch.setattr("nx.cli.load_config", lambda path=None: config)
+
+    async def fake_exec(*args, **kwargs):
+        """Local succeeds, remote fails."""
+        if args[0] == "tmux":
+            return FakeProcess(stdout=b"tmux 3.4\n", returncode=0)
+        return FakeProcess(stderr=b"Connection refused", returncode=255)
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+
+    result = runner.invoke(app, ["nodes", "ls"])
+
+    assert result.exit_code == 0
+    assert "dead-server\t[UNREACHABLE]\t-" in result.output.splitlines()
+    assert result.output.splitlines()[0].startswith("local\t[OK]\t")
+
+
 # ---------------------------------------------------------------------------
 # nodes_add tests
 # ---------------------------------------------------------------------------
@@ -301,6 +435,7 @@ def test_nodes_add_pushes_tmux_conf(monkeypatch, tmp_path):
         - Remote host returns "tmux 3.4".
     Expected:
         - A subprocess call is made that includes "tmux.conf" (the push).
+        - The push creates its own directory; no separate ssh mkdir is issued.
         - Log includes "Pushed tmux.conf".
     """
     config = FleetConfig(
@@ -333,6 +468,30 @@ def test_nodes_add_pushes_tmux_conf(monkeypatch, tmp_path):
     # Reason: Verify that one of the subprocess calls involves writing tmux.conf.
     tmux_conf_calls = [c for c in calls if any("tmux.conf" in str(a) for a in c)]
     assert len(tmux_conf_calls) >= 1
+    assert not [c for c in calls if c[-1].startswith("mkdir")]
+
+
+def test_nodes_add_push_matches_probe(monkeypatch, tmp_path):
+    """The tmux.conf pushed by nodes_add is byte-identical to the canonical one.
+
+    Scenario:
+        - nodes_add pushes to a fake remote that runs the real shell command.
+        - nodes_ls then probes the same fake remote.
+    Expected:
+        - The remote file equals the packaged tmux.conf (no extra newline).
+        - The freshly added node is not reported as drifted.
+    """
+    remote_home = _add_node_to_fake_remote(monkeypatch, tmp_path, "new-server")
+
+    pushed = (remote_home / ".config" / "nexus" / "tmux.conf").read_bytes()
+    assert pushed == _canonical_tmux_conf()
+
+    statuses = asyncio.run(nodes_ls(FleetConfig(nodes=["local", "new-server"])))
+
+    remote_status = next(s for s in statuses if s.node == "new-server")
+    assert remote_status.reachable is True
+    assert remote_status.tmux_version == "tmux 3.2"
+    assert remote_status.config_drift is False
 
 
 def test_nodes_add_appends_ssh_config(monkeypatch, tmp_path):
@@ -388,6 +547,7 @@ def test_nodes_add_idempotent(monkeypatch, tmp_path):
     Expected:
         - SSH config contains exactly one "Host new-server" block.
         - Second call logs "already exists".
+        - A host whose name is a prefix ("new") still gets its own block.
     """
     config = FleetConfig(
         nodes=["local"],
@@ -422,6 +582,10 @@ def test_nodes_add_idempotent(monkeypatch, tmp_path):
     assert content.count("Host new-server") == 1
     assert any("already exists" in m for m in messages)
 
+    # Reason: "Host new-server" must not count as a block for "new".
+    asyncio.run(nodes_add("new", config, ssh_config_path=ssh_config))
+    assert "\nHost new\n" in ssh_config.read_text()
+
 
 # ---------------------------------------------------------------------------
 # nodes_rm tests
@@ -436,7 +600,7 @@ def test_nodes_rm(tmp_path):
         - Fleet config includes "dev-server".
     Expected:
         - After removal, "Host dev-server" is no longer in the file.
-        - Fleet config no longer includes "dev-server".
+        - The saved fleet config no longer includes "dev-server".
         - Log includes "Removed SSH config for dev-server".
     """
     config = FleetConfig(
@@ -457,10 +621,72 @@ def test_nodes_rm(tmp_path):
 
     content = ssh_config.read_text()
     assert "Host dev-server" not in content
-    assert "dev-server" not in config.nodes
+    assert "dev-server" not in load_config(fleet_config).nodes
     assert any("Removed SSH config for dev-server" in m for m in messages)
 
 
+def test_nodes_rm_failed_write_leaves_no_temp_file(monkeypatch, tmp_path):
+    """A failed SSH config rewrite keeps the old file and cleans up after itself.
+
+    Scenario:
+        - SSH config contains a Host block for "dev-server".
+        - os.fsync fails while the new file is being written.
+    Expected:
+        - The error propagates and the SSH config is unchanged.
+        - No temporary file is left next to it.
+    """
+    config = FleetConfig(nodes=["local", "dev-server"])
+    ssh_dir = tmp_path / "ssh"
+    ssh_dir.mkdir()
+    ssh_config = ssh_dir / "nexus_config"
+    block = SSH_CONFIG_TEMPLATE.format(host="dev-server")
+    ssh_config.write_text(block)
+
+    def failing_fsync(fd: int) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr("nx.config.os.fsync", failing_fsync)
+
+    with pytest.raises(OSError, match="disk full"):
+        nodes_rm(
+            "dev-server",
+            config,
+            ssh_config_path=ssh_config,
+            fleet_config_path=tmp_path / "fleet.toml",
+        )
+
+    assert ssh_config.read_text() == block
+    assert list(ssh_dir.iterdir()) == [ssh_config]
+
+
+def test_nodes_rm_keeps_other_hosts(tmp_path):
+    """nodes_rm removes only the exact host's block.
+
+    Scenario:
+        - SSH config holds blocks for "dev", then "dev-server", then "gpu".
+    Expected:
+        - Removing "dev" leaves the "dev-server" and "gpu" blocks intact.
+        - Removing "dev" again finds no SSH config block for it.
+    """
+    config = FleetConfig(
+        nodes=["local"],
+        default_node="local",
+        default_cmd="/bin/bash",
+    )
+
+    ssh_config = tmp_path / "nexus_config"
+    blocks = [SSH_CONFIG_TEMPLATE.format(host=h) for h in ("dev", "dev-server", "gpu")]
+    ssh_config.write_text("".join(blocks))
+
+    messages = nodes_rm("dev", config, ssh_config_path=ssh_config)
+
+    assert ssh_config.read_text() == blocks[1] + blocks[2]
+    assert messages == ["Removed SSH config for dev"]
+
+    with pytest.raises(ValueError, match="not found"):
+        nodes_rm("dev", config, ssh_config_path=ssh_config)
+
+
 def test_nodes_rm_nonexistent(tmp_path):
     """nodes_rm raises ValueError for a host not in SSH config or fleet.
 
@@ -533,7 +759,7 @@ def test_nodes_rm_fleet_only(tmp_path):
         fleet_config_path=fleet_config,
     )
 
-    assert "orphan-server" not in config.nodes
+    assert "orphan-server" not in load_config(fleet_config).nodes
     assert any("Removed orphan-server from fleet config" in m for m in messages)
 
 
@@ -664,7 +890,7 @@ def test_nodes_add_no_args_fzf(monkeypatch, tmp_path):
     import nx.cli as cli_mod
 
     monkeypatch.setattr(
-        "nx.cli.discover_hosts",
+        "nx.nodes.discover_hosts",
         lambda config, **kw: ["alpha", "beta"],
     )
 
@@ -674,23 +900,23 @@ def test_nodes_add_no_args_fzf(monkeypatch, tmp_path):
         captured["host"] = host
         return [f"Added {host}"]
 
-    monkeypatch.setattr("nx.cli.nodes_add", fake_nodes_add)
+    monkeypatch.setattr("nx.nodes.nodes_add", fake_nodes_add)
     monkeypatch.setattr("shutil.which", lambda name: "/usr/bin/fzf")
 
     def fake_run(cmd, **kwargs):
         """Intercept fzf calls."""
         if cmd and cmd[0] == "fzf":
-            return sp.CompletedProcess(cmd, 0, stdout="alpha\n", stderr="")
+            return sp.CompletedProcess(cmd, 0, stdout=b"alpha\n", stderr=None)
         return sp.CompletedProcess(cmd, 0, stdout="", stderr="")
 
+    # Reason: The picker runs fzf through nx.fzf.fzf_select, so intercept
+    # subprocess.run there, as tests/test_resolve.py does.
+    monkeypatch.setattr("nx.fzf.subprocess.run", fake_run)
+
     # Reason: CliRunner replaces sys.stdin, so patching stdin.isatty
     # directly doesn't survive. We patch the entire sys module as seen
     # by cli.py to control isatty.
-    with (
-        patch.object(cli_mod, "subprocess") as mock_sp,
-        patch.object(cli_mod, "sys") as mock_sys,
-    ):
-        mock_sp.run = fake_run
+    with patch.object(cli_mod, "sys") as mock_sys:
         mock_sys.stdin.isatty.return_value = True
 
         result = runner.invoke(app, ["nodes", "add"])
@@ -708,7 +934,7 @@ def test_nodes_add_no_args_single_host(monkeypatch, tmp_path):
         - Auto-selected without fzf.
     """
     monkeypatch.setattr(
-        "nx.cli.discover_hosts",
+        "nx.nodes.discover_hosts",
         lambda config, **kw: ["only-host"],
     )
 
@@ -718,7 +944,7 @@ def test_nodes_add_no_args_single_host(monkeypatch, tmp_path):
         captured["host"] = host
         return [f"Added {host}"]
 
-    monkeypatch.setattr("nx.cli.nodes_add", fake_nodes_add)
+    monkeypatch.setattr("nx.nodes.nodes_add", fake_nodes_add)
     monkeypatch.setattr("shutil.which", lambda name: "/usr/bin/fzf")
 
     result = runner.invoke(app, ["nodes", "add"])
@@ -737,7 +963,7 @@ def test_nodes_add_no_candidates(monkeypatch):
         - Error message and exit code 1.
     """
     monkeypatch.setattr(
-        "nx.cli.discover_hosts",
+        "nx.nodes.discover_hosts",
         lambda config, **kw: [],
     )
     monkeypatch.setattr("shutil.which", lambda name: "/usr/bin/fzf")
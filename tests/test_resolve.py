@@ -98,10 +98,10 @@ async def test_resolve_unique_match(monkeypatch, two_node_config):
         """
         # Reason: Local calls start with "tmux"; remote calls start with "ssh".
         if args[0] == "tmux":
-            return FakeProcess(stdout=b"api|1|0|/home/u|bash|1234|0|\n", returncode=0)
+            return FakeProcess(returncode=0 if "=api" in args else 1)
         elif "dev-server" in args:
-            return FakeProcess(stdout=b"data|1|0|/app|python|5678|0|\n", returncode=0)
-        return FakeProcess(stdout=b"", returncode=0)
+            return FakeProcess(returncode=0 if "=data" in args else 1)
+        return FakeProcess(returncode=1)
 
     monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
 
@@ -111,15 +111,36 @@ async def test_resolve_unique_match(monkeypatch, two_node_config):
     assert session == "api"
 
 
+@pytest.mark.asyncio
+async def test_resolve_uses_exact_has_session(monkeypatch, two_node_config):
+    """Bare name resolution asks each node for the exact session name."""
+    captured: list[tuple] = []
+
+    async def fake_exec(*args, **kwargs):
+        """Record the command; only local has the session."""
+        captured.append(args)
+        return FakeProcess(returncode=0 if args[0] == "tmux" else 1)
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+
+    await resolve_session("api", two_node_config)
+
+    local_cmd = next(c for c in captured if c[0] == "tmux")
+    assert list(local_cmd) == ["tmux", "-L", "nexus", "has-session", "-t", "=api"]
+    remote_cmd = next(c for c in captured if c[0] == "ssh")
+    assert "has-session" in remote_cmd[-1]
+    assert "list-sessions" not in remote_cmd[-1]
+
+
 @pytest.mark.asyncio
 async def test_resolve_no_match(monkeypatch, two_node_config):
     """Bare name matching no sessions raises SessionNotFound."""
 
     async def fake_exec(*args, **kwargs):
         """Return only 'api' on local; nothing on dev-server."""
-        if args[0] == "tmux":
-            return FakeProcess(stdout=b"api|1|0|/home/u|bash|1234|0|\n", returncode=0)
-        return FakeProcess(stdout=b"", returncode=0)
+        if args[0] == "tmux" and "=api" in args:
+            return FakeProcess(returncode=0)
+        return FakeProcess(stderr=b"can't find session", returncode=1)
 
     monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
 
@@ -130,15 +151,14 @@ async def test_resolve_no_match(monkeypatch, two_node_config):
 @pytest.mark.asyncio
 async def test_resolve_ambiguous_interactive(monkeypatch, two_node_config):
     """Ambiguous match with interactive tty launches fzf and returns selection."""
-    two_node_config.default_node = "local"
 
     async def fake_exec(*args, **kwargs):
         """Both nodes have a session named 'api'."""
         if args[0] == "tmux":
-            return FakeProcess(stdout=b"api|1|0|/home/u|bash|1234|0|\n", returncode=0)
+            return FakeProcess(returncode=0)
         elif "dev-server" in args:
-            return FakeProcess(stdout=b"api|1|0|/app|python|5678|0|\n", returncode=0)
-        return FakeProcess(stdout=b"", returncode=0)
+            return FakeProcess(returncode=0)
+        return FakeProcess(returncode=1)
 
     monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
 
@@ -154,10 +174,10 @@ async def test_resolve_ambiguous_interactive(monkeypatch, two_node_config):
         """Record kwargs and return a fake CompletedProcess."""
         captured.append({"args": args, "kwargs": kwargs})
         return subprocess_mod.CompletedProcess(
-            args=args[0], returncode=0, stdout="local/api\n", stderr=""
+            args=args[0], returncode=0, stdout=b"local/api\n", stderr=None
         )
 
-    monkeypatch.setattr("nx.resolve.subprocess.run", fake_fzf)
+    monkeypatch.setattr("nx.fzf.subprocess.run", fake_fzf)
 
     node, session = await resolve_session("api", two_node_config)
 
@@ -167,7 +187,7 @@ async def test_resolve_ambiguous_interactive(monkeypatch, two_node_config):
     assert call_args == ["fzf", "--prompt", "Select session: "]
 
     # Verify the input kwarg contains both matches.
-    fzf_input = captured[0]["kwargs"]["input"]
+    fzf_input = captured[0]["kwargs"]["input"].decode()
     assert "local/api" in fzf_input
     assert "dev-server/api" in fzf_input
 
@@ -182,10 +202,10 @@ async def test_resolve_ambiguous_piped(monkeypatch, two_node_config):
     async def fake_exec(*args, **kwargs):
         """Both nodes have a session named 'api'."""
         if args[0] == "tmux":
-            return FakeProcess(stdout=b"api|1|0|/home/u|bash|1234|0|\n", returncode=0)
+            return FakeProcess(returncode=0)
         elif "dev-server" in args:
-            return FakeProcess(stdout=b"api|1|0|/app|python|5678|0|\n", returncode=0)
-        return FakeProcess(stdout=b"", returncode=0)
+            return FakeProcess(returncode=0)
+        return FakeProcess(returncode=1)
 
     monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
 
@@ -211,7 +231,7 @@ async def test_resolve_fzf_default_node_first(monkeypatch, three_node_config):
         """All three nodes have a session named 'api'."""
         # Reason: All calls return the same session "api".
         # Local (alpha) uses tmux directly; beta and gamma go through ssh.
-        return FakeProcess(stdout=b"api|1|0|/home/u|bash|1234|0|\n", returncode=0)
+        return FakeProcess(returncode=0)
 
     monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
 
@@ -226,15 +246,15 @@ async def test_resolve_fzf_default_node_first(monkeypatch, three_node_config):
         """Capture input and return gamma/api as selection."""
         captured.append({"args": args, "kwargs": kwargs})
         return subprocess_mod.CompletedProcess(
-            args=args[0], returncode=0, stdout="gamma/api\n", stderr=""
+            args=args[0], returncode=0, stdout=b"gamma/api\n", stderr=None
         )
 
-    monkeypatch.setattr("nx.resolve.subprocess.run", fake_fzf)
+    monkeypatch.setattr("nx.fzf.subprocess.run", fake_fzf)
 
     node, session = await resolve_session("api", three_node_config)
 
     # Verify gamma/api (default node) is the FIRST line in fzf input.
-    fzf_input = captured[0]["kwargs"]["input"]
+    fzf_input = captured[0]["kwargs"]["input"].decode()
     lines = fzf_input.strip().split("\n")
     assert lines[0] == "gamma/api"
 
@@ -253,10 +273,10 @@ async def test_resolve_fzf_output_parsed(monkeypatch, two_node_config):
     async def fake_exec(*args, **kwargs):
         """Both nodes have a session named 'api'."""
         if args[0] == "tmux":
-            return FakeProcess(stdout=b"api|1|0|/home/u|bash|1234|0|\n", returncode=0)
+            return FakeProcess(returncode=0)
         elif "dev-server" in args:
-            return FakeProcess(stdout=b"api|1|0|/app|python|5678|0|\n", returncode=0)
-        return FakeProcess(stdout=b"", returncode=0)
+            return FakeProcess(returncode=0)
+        return FakeProcess(returncode=1)
 
     monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
 
@@ -268,10 +288,10 @@ async def test_resolve_fzf_output_parsed(monkeypatch, two_node_config):
     def fake_fzf(*args, **kwargs):
         """Return dev-server/api as the user's selection."""
         return subprocess_mod.CompletedProcess(
-            args=args[0], returncode=0, stdout="dev-server/api\n", stderr=""
+            args=args[0], returncode=0, stdout=b"dev-server/api\n", stderr=None
         )
 
-    monkeypatch.setattr("nx.resolve.subprocess.run", fake_fzf)
+    monkeypatch.setattr("nx.fzf.subprocess.run", fake_fzf)
 
     node, session = await resolve_session("api", two_node_config)
 
@@ -60,7 +60,7 @@ def test_snapshot_saves_state(monkeypatch, tmp_path):
         - dev-server returns 1 session: pipeline
     Expected:
         - Snapshot file is created at the given path.
-        - File contains 3 sessions total.
+        - File contains 3 sessions total, matching the returned count.
     """
     config = FleetConfig(
         nodes=["local", "dev-server"],
@@ -68,8 +68,8 @@ def test_snapshot_saves_state(monkeypatch, tmp_path):
         default_cmd="/bin/bash",
     )
 
-    local_output = b"api|1|0|/home/u|bash|1234|0|\nworker|1|0|/app|node|5678|0|\n"
-    remote_output = b"pipeline|1|0|/data|python|9012|0|\n"
+    local_output = b"api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f0\x1f\nworker\x1f1\x1f0\x1f/app\x1fnode\x1f5678\x1f0\x1f\n"
+    remote_output = b"pipeline\x1f1\x1f0\x1f/data\x1fpython\x1f9012\x1f0\x1f\n"
 
     async def fake_exec(*args, **kwargs):
         """Return different sessions based on whether this is local or SSH."""
@@ -82,7 +82,7 @@ def test_snapshot_saves_state(monkeypatch, tmp_path):
     monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
 
     snapshot_file = tmp_path / "snapshot.json"
-    path = asyncio.run(save_snapshot(config, snapshot_path=snapshot_file))
+    path, count = asyncio.run(save_snapshot(config, snapshot_path=snapshot_file))
 
     # Verify file was created.
     assert path.exists()
@@ -91,6 +91,7 @@ def test_snapshot_saves_state(monkeypatch, tmp_path):
     # Verify it contains 3 sessions.
     data = json.loads(path.read_text())
     assert len(data["sessions"]) == 3
+    assert count == 3
 
 
 def test_snapshot_schema_valid(monkeypatch, tmp_path):
@@ -109,8 +110,8 @@ def test_snapshot_schema_valid(monkeypatch, tmp_path):
         default_cmd="/bin/bash",
     )
 
-    local_output = b"api|1|0|/home/u|bash|1234|0|\nworker|1|0|/app|node|5678|0|\n"
-    remote_output = b"pipeline|1|0|/data|python|9012|0|\n"
+    local_output = b"api\x1f1\x1f0\x1f/home/u\x1fbash\x1f1234\x1f0\x1f\nworker\x1f1\x1f0\x1f/app\x1fnode\x1f5678\x1f0\x1f\n"
+    remote_output = b"pipeline\x1f1\x1f0\x1f/data\x1fpython\x1f9012\x1f0\x1f\n"
 
     async def fake_exec(*args, **kwargs):
         """Return different sessions based on whether this is local or SSH."""
@@ -255,6 +256,50 @@ def test_restore_specific_node(monkeypatch, tmp_path):
     assert "OK" in log[0]
 
 
+def test_restore_batches_per_node(monkeypatch, tmp_path):
+    """restore_snapshot creates a node's sessions with one command.
+
+    Scenario:
+        - Snapshot holds "api" and "worker" on local; creating "worker" fails.
+    Expected:
+        - A single subprocess call carries both new-session commands.
+        - "api" is logged OK; "worker" is logged FAILED with tmux's error.
+    """
+    config = FleetConfig(nodes=["local"], default_node="local", default_cmd="/bin/bash")
+
+    snapshot_data = FleetSnapshot(
+        timestamp="2026-02-24T12:00:00Z",
+        sessions=[
+            SessionSnapshot(
+                node="local", name="api", directory="/home/u", command="bash"
+            ),
+            SessionSnapshot(
+                node="local", name="worker", directory="/app", command="node"
+            ),
+        ],
+    )
+    snapshot_file = tmp_path / "snapshot.json"
+    snapshot_file.write_text(snapshot_data.model_dump_json(indent=2))
+
+    calls: list[tuple] = []
+
+    async def fake_exec(*args, **kwargs):
+        """Report that the worker session could not be created."""
+        calls.append(args)
+        return FakeProcess(stdout=b"worker\tduplicate session: worker\n", returncode=0)
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+
+    log = asyncio.run(restore_snapshot(config, snapshot_path=snapshot_file))
+
+    assert len(calls) == 1
+    assert calls[0][-1].count("new-session") == 2
+    assert log == [
+        "Restoring local/api... OK",
+        "Restoring local/worker... FAILED: duplicate session: worker",
+    ]
+
+
 def test_restore_logs_output(monkeypatch):
     """CLI 'nx restore' prints each log message and a summary line.
 
@@ -277,7 +322,7 @@ def test_restore_logs_output(monkeypatch):
         """Return predetermined log messages."""
         return fake_logs
 
-    monkeypatch.setattr("nx.cli.restore_snapshot", fake_restore)
+    monkeypatch.setattr("nx.snapshot.restore_snapshot", fake_restore)
 
     result = runner.invoke(app, ["restore"])
 
@@ -314,7 +359,7 @@ def test_restore_empty_snapshot(monkeypatch):
         """Return empty list (no sessions to restore)."""
         return []
 
-    monkeypatch.setattr("nx.cli.restore_snapshot", fake_restore)
+    monkeypatch.setattr("nx.snapshot.restore_snapshot", fake_restore)
 
     result = runner.invoke(app, ["restore"])
 
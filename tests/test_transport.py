@@ -7,18 +7,21 @@ tmux tests are pure unit tests — no mocking needed.
 """
 
 import asyncio
+import subprocess
 
 import pytest
 
-from nx.ssh import fan_out, run_on_node
+from nx.ssh import SSH_MUX_OPTIONS, fan_out, fan_out_iter, run_on_node
 from nx.tmux import (
     FORMAT_STRING,
     SessionInfo,
     build_capture_cmd,
     build_kill_cmd,
+    build_kill_many_cmd,
     build_list_cmd,
     build_new_cmd,
     build_send_keys_cmd,
+    iter_list_output,
     parse_list_output,
 )
 
@@ -75,9 +78,26 @@ async def test_run_local_command(monkeypatch):
     assert calls[0] == ("echo", "hi")
 
 
+@pytest.mark.asyncio
+async def test_run_invalid_utf8_output(monkeypatch):
+    """Undecodable bytes in output are replaced instead of raising."""
+
+    async def fake_exec(*args, **kwargs):
+        """Return stdout and stderr that are not valid UTF-8."""
+        return FakeProcess(stdout=b"caf\xe9\n", stderr=b"\xff", returncode=0)
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+
+    result = await run_on_node("local", ["echo"])
+
+    assert result.stdout == "caf\ufffd\n"
+    assert result.stderr == "\ufffd"
+    assert result.returncode == 0
+
+
 @pytest.mark.asyncio
 async def test_run_remote_command(monkeypatch):
-    """Remote node wraps the command in an SSH call with ConnectTimeout."""
+    """Remote node wraps the command in a multiplexed SSH call with ConnectTimeout."""
     calls: list[tuple] = []
 
     async def fake_exec(*args, **kwargs):
@@ -89,14 +109,38 @@ async def test_run_remote_command(monkeypatch):
 
     result = await run_on_node("dev-server", ["echo", "hi"])
 
-    # Reason: remote commands must be wrapped in ssh with ConnectTimeout
-    # and the original command joined via shlex.join.
-    assert calls[0] == ("ssh", "-o", "ConnectTimeout=2", "dev-server", "echo hi")
+    # Reason: remote commands must be wrapped in ssh with ConnectTimeout,
+    # the ControlMaster options, and the original command joined via shlex.join.
+    assert calls[0] == (
+        "ssh",
+        "-o",
+        "ConnectTimeout=2",
+        *SSH_MUX_OPTIONS,
+        "dev-server",
+        "echo hi",
+    )
     assert result.node == "dev-server"
     assert result.stdout == "hi\n"
     assert result.returncode == 0
 
 
+@pytest.mark.asyncio
+async def test_run_remote_command_mux_disabled(monkeypatch):
+    """NX_DISABLE_SSH_MUX drops the ControlMaster options from the ssh argv."""
+    captured: list[tuple] = []
+
+    async def fake_exec(*args, **kwargs):
+        captured.append(args)
+        return FakeProcess(stdout=b"ok\n", returncode=0)
+
+    monkeypatch.setenv("NX_DISABLE_SSH_MUX", "1")
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+
+    await run_on_node("dev-server", ["echo", "hi"])
+
+    assert captured[0] == ("ssh", "-o", "ConnectTimeout=2", "dev-server", "echo hi")
+
+
 @pytest.mark.asyncio
 async def test_fan_out_parallel(monkeypatch):
     """fan_out dispatches to multiple nodes and returns results keyed by node."""
@@ -178,6 +222,82 @@ async def test_fan_out_semaphore_created(monkeypatch):
     assert 8 in captured_semaphore_values
 
 
+@pytest.mark.asyncio
+async def test_fan_out_iter_yields_in_completion_order(monkeypatch):
+    """fan_out_iter yields fast nodes before slow ones, regardless of input order."""
+
+    async def fake_exec(*args, **kwargs):
+        """Delay the remote node so local finishes first."""
+        if args[0] == "ssh":
+            await asyncio.sleep(0.05)
+            return FakeProcess(stdout=b"slow\n", returncode=0)
+        return FakeProcess(stdout=b"fast\n", returncode=0)
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+
+    order = [node async for node, _ in fan_out_iter(["dev-server", "local"], ["echo"])]
+
+    assert order == ["local", "dev-server"]
+
+
+@pytest.mark.asyncio
+async def test_fan_out_deadline_kills_hung_node(monkeypatch):
+    """A node exceeding the deadline is reported as failed and its process killed."""
+    killed: list[bool] = []
+
+    class HungProcess(FakeProcess):
+        """Process whose communicate() never returns."""
+
+        async def communicate(self):
+            await asyncio.sleep(60)
+
+        def kill(self):
+            killed.append(True)
+
+    async def fake_exec(*args, **kwargs):
+        """Hang on the remote node, answer immediately locally."""
+        if args[0] == "ssh":
+            return HungProcess()
+        return FakeProcess(stdout=b"ok\n", returncode=0)
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+
+    results = await fan_out(["local", "hung-node"], ["echo"], timeout=0.05)
+
+    assert results["local"].returncode == 0
+    assert results["hung-node"].returncode == 1
+    assert "Timed out" in results["hung-node"].stderr
+    assert killed == [True]
+
+
+@pytest.mark.asyncio
+async def test_fan_out_fleet_deadline_covers_queued_nodes(monkeypatch):
+    """Nodes still queued behind the semaphore fail once the fleet deadline passes."""
+
+    class HungProcess(FakeProcess):
+        """Process whose communicate() never returns."""
+
+        async def communicate(self):
+            await asyncio.sleep(60)
+
+        def kill(self):
+            pass
+
+    async def fake_exec(*args, **kwargs):
+        return HungProcess()
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+
+    nodes = ["n1", "n2", "n3", "n4"]
+    start = asyncio.get_running_loop().time()
+    results = await fan_out(nodes, ["echo"], max_concurrent=1, timeout=5, deadline=0.1)
+    elapsed = asyncio.get_running_loop().time() - start
+
+    assert elapsed < 1
+    assert all(results[n].returncode == 1 for n in nodes)
+    assert all("deadline" in results[n].stderr for n in nodes)
+
+
 # ===========================================================================
 # tmux Tests
 # ===========================================================================
@@ -190,8 +310,8 @@ def test_build_list_cmd():
 
 
 def test_parse_list_output():
-    """parse_list_output converts pipe-delimited lines into SessionInfo objects."""
-    raw = "api|1|0|/home/u/app|python|1234|0|\n"
+    """parse_list_output converts delimited lines into SessionInfo objects."""
+    raw = "api\x1f1\x1f0\x1f/home/u/app\x1fpython\x1f1234\x1f0\x1f\n"
     result = parse_list_output(raw)
 
     assert len(result) == 1
@@ -208,6 +328,28 @@ def test_parse_list_output():
     )
 
 
+def test_parse_pipes_and_separator_in_fields():
+    """A "|" in the name and a separator inside the pane path both parse."""
+    raw = "a|b\x1f1\x1f0\x1f/srv/x\x1fy|z\x1fpython\x1f1234\x1f0\x1f\n"
+    result = parse_list_output(raw)
+
+    assert len(result) == 1
+    assert result[0].name == "a|b"
+    assert result[0].pane_path == "/srv/x\x1fy|z"
+    assert result[0].pane_cmd == "python"
+    assert result[0].pane_pid == 1234
+
+
+def test_iter_list_output_is_lazy():
+    """iter_list_output stops parsing once the caller stops consuming."""
+    raw = "api\x1f1\x1f0\x1f/app\x1fpython\x1f1234\x1f0\x1f\nbroken\x1fx\x1fy\x1fz\x1fa\x1fb\x1fc\x1fd\n"
+    sessions = iter_list_output(raw)
+
+    # Reason: The second line has non-integer fields and would raise if it
+    # were parsed; taking only the first session must never reach it.
+    assert next(sessions).name == "api"
+
+
 def test_parse_empty_output():
     """Empty or whitespace-only input returns an empty list, not an error."""
     assert parse_list_output("") == []
@@ -216,7 +358,7 @@ def test_parse_empty_output():
 
 def test_parse_dead_pane():
     """A pane with pane_dead=1 is parsed with is_dead=True and exit_status set."""
-    raw = "crashed|1|0|/home/u|bash|5678|1|1\n"
+    raw = "crashed\x1f1\x1f0\x1f/home/u\x1fbash\x1f5678\x1f1\x1f1\n"
     result = parse_list_output(raw)
 
     assert len(result) == 1
@@ -258,6 +400,24 @@ def test_build_new_cmd():
     ]
 
 
+def test_build_new_cmd_list_is_verbatim():
+    """A list command is appended as-is, without re-splitting on spaces."""
+    result = build_new_cmd("api", ["sh", "-c", "echo 'a b'"])
+    assert result[-3:] == ["sh", "-c", "echo 'a b'"]
+
+
+def test_build_new_cmd_string_honours_quotes():
+    """A string command is split like a shell would, keeping quoted args whole."""
+    result = build_new_cmd("api", "python -c \"print('hi there')\"")
+    assert result[-3:] == ["python", "-c", "print('hi there')"]
+
+
+def test_build_new_cmd_unbalanced_quotes_split_on_whitespace():
+    """A string with unbalanced quotes falls back to a whitespace split."""
+    result = build_new_cmd("api", "echo 'oops")
+    assert result[-2:] == ["echo", "'oops"]
+
+
 def test_build_capture_cmd():
     """build_capture_cmd builds correct capture-pane commands."""
     # Numeric lines — -S -30
@@ -328,3 +488,31 @@ def test_build_kill_cmd():
         "-t",
         "api",
     ]
+
+
+def test_build_kill_many_cmd():
+    """build_kill_many_cmd chains quoted kills in sh and prints failures."""
+    result = build_kill_many_cmd(["api", "odd name"])
+    assert result == [
+        "sh",
+        "-c",
+        "tmux -L nexus kill-session -t api || printf '%s\\n' api; "
+        "tmux -L nexus kill-session -t 'odd name' || printf '%s\\n' 'odd name'",
+    ]
+
+
+def test_build_kill_many_cmd_prints_names_verbatim():
+    """Failed names with backslashes or a leading dash reach stdout unchanged.
+
+    Runs the generated script under sh with tmux stubbed to always fail, so
+    every session is reported.
+    """
+    names = ["a\\nb", "-n", "back\\slash"]
+    _, flag, script = build_kill_many_cmd(names)
+    script = script.replace("tmux -L nexus", "false")
+
+    result = subprocess.run(
+        ["sh", flag, script], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.splitlines() == names